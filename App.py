@@ -1,16 +1,31 @@
 import streamlit as st
+import instrumentacao
 from sim_recria import render_recria
 from sim_confinamento import render_confinamento
+from sim_risco import render_risco
+from sim_comparacao import render_comparacao
+from sim_debug import render_debug
 
 st.set_page_config(page_title="Simuladores Econômicos", layout="wide")
 
+# Instrumentação opcional: SIMULADOR_INSTRUMENTACAO=1 ou ?debug=1 na URL
+instrumentacao.iniciar_execucao(ativo=st.query_params.get("debug") == "1")
+
 st.markdown("<h1 style='text-align:center;'>📊 Simuladores Econômicos</h1>", unsafe_allow_html=True)
 st.markdown("---")
 
-tab1, tab2 = st.tabs(["🌱 Recria a Pasto", "🏭 Confinamento"])
+tab1, tab2, tab3, tab4 = st.tabs(["🌱 Recria a Pasto", "🏭 Confinamento", "🎲 Risco", "⚖️ Comparação"])
 
 with tab1:
     render_recria(prefix="recria")
 
 with tab2:
     render_confinamento(prefix="conf")
+
+with tab3:
+    render_risco(prefix="risco")
+
+with tab4:
+    render_comparacao(prefix="comp")
+
+render_debug()
@@ -0,0 +1,204 @@
+# -*- coding: utf-8 -*-
+"""Agenda de currais do confinamento: alocação de lotes, caixa diário e ocupação.
+
+Os lotes chegam numa data com ``cabecas`` animais e os parâmetros do
+confinamento por cabeça (mesmos campos de ``PADROES_CONFINAMENTO``). Cada
+curral recebe um lote por vez; lotes maiores que o maior curral são divididos.
+A alocação é por eventos (lotes em ordem de chegada, menor curral livre que
+comporta o lote; sem curral livre, a entrada espera até ``max_espera`` dias).
+
+O calendário é vetorizado: compras, custeio diário e vendas viram vetores
+diários por somas acumuladas (``np.bincount`` + ``cumsum``), e a ocupação de
+cada curral é uma matriz currais × dias. Em vez dos juros por animal do motor
+(``valor_compra × juros_mes × dias/30``), os juros incidem sobre o saldo de
+caixa negativo (capital de giro), em juros simples diários de ``juros_mes/30``.
+"""
+import numpy as np
+
+from confinamento_engine import PADROES_CONFINAMENTO, calcular_confinamento
+from etapas import colunas_parametros
+from pipeline import encadear
+from recria_engine import PADROES_RECRIA
+
+
+MAX_ESPERA = 30
+
+SERIES_DIARIAS = (
+    "entradas_caixa", "saidas_caixa", "fluxo", "saldo", "juros_capital_giro",
+    "saldo_com_juros", "cabecas", "ocupacao", "currais_ocupados",
+)
+
+
+# ==============================
+# LOTES DE ENTRADA
+# ==============================
+def lotes_de_compra(data_entrada, cabecas, params=None):
+    """Lista de compras: datas de entrada, cabeças e parâmetros por cabeça (escalares ou arrays).
+
+    Levanta ``ValueError`` para uma lista sem lotes, datas vazias ou cabeças
+    vazias, fracionárias ou menores que 1.
+    """
+    data_entrada = np.atleast_1d(np.asarray(data_entrada, dtype="datetime64[D]"))
+    if not data_entrada.size:
+        raise ValueError("a lista de compras não tem nenhum lote")
+    if np.isnat(data_entrada).any():
+        raise ValueError("data_entrada vazia em algum lote")
+    cabecas = np.broadcast_to(np.asarray(cabecas, dtype=np.float64), data_entrada.shape)
+    if not (np.isfinite(cabecas) & (cabecas == np.rint(cabecas)) & (cabecas >= 1)).all():
+        raise ValueError("cabecas deve ser um número inteiro maior que zero em todos os lotes")
+    colunas, _ = colunas_parametros(params or {}, PADROES_CONFINAMENTO, len(data_entrada))
+    lotes = {nome: valor.copy() for nome, valor in colunas.items()}
+    lotes["data_entrada"] = data_entrada
+    lotes["cabecas"] = cabecas.astype(np.int64)
+    return lotes
+
+
+def lotes_da_recria(data_compra, cabecas, params_recria=None, params_confinamento=None):
+    """Lotes que entram no confinamento ao fim da recria (como no link entre as abas).
+
+    A entrada é ``data_compra + dias`` da recria, com o peso final e o preço
+    de venda da recria como peso inicial e preço de compra.
+    """
+    params_recria = {**PADROES_RECRIA, **(params_recria or {})}
+    _, _, params_conf = encadear(params_recria, params_confinamento or {})
+    dias_recria = np.asarray(params_recria["dias"], dtype=np.float64)
+    data_entrada = (np.asarray(data_compra, dtype="datetime64[D]")
+                    + np.rint(dias_recria).astype(np.int64).astype("timedelta64[D]"))
+    return lotes_de_compra(data_entrada, cabecas, params_conf)
+
+
+def _dividir_lotes(lotes, capacidade_maxima):
+    # lote com mais cabeças que o maior curral vira vários sublotes
+    partes = -(-lotes["cabecas"] // capacidade_maxima)
+    origem = np.repeat(np.arange(len(partes)), partes)
+    sublotes = {nome: valor[origem] for nome, valor in lotes.items()}
+    primeira = np.r_[0, np.cumsum(partes)[:-1]]
+    ordem = np.arange(len(origem)) - np.repeat(primeira, partes)
+    restante = sublotes["cabecas"] - ordem * capacidade_maxima
+    sublotes["cabecas"] = np.minimum(restante, capacidade_maxima)
+    sublotes["lote"] = origem
+    return sublotes
+
+
+# ==============================
+# ALOCAÇÃO
+# ==============================
+def alocar(lotes, capacidades, max_espera=MAX_ESPERA):
+    """Aloca os lotes aos currais por ordem de chegada.
+
+    Devolve ``lotes`` (já divididos) com ``curral`` (-1 = não alocado),
+    ``entrada``/``saida`` efetivas e ``espera`` (dias de atraso na entrada).
+    """
+    capacidades = np.asarray(capacidades, dtype=np.int64)
+    lotes = _dividir_lotes(lotes, int(capacidades.max()))
+
+    ordem = np.argsort(lotes["data_entrada"], kind="stable")
+    lotes = {nome: valor[ordem] for nome, valor in lotes.items()}
+    chegada = lotes["data_entrada"].astype(np.int64)
+    dias = np.rint(lotes["dias"]).astype(np.int64)
+
+    livre_em = np.full(len(capacidades), np.iinfo(np.int64).min)
+    curral = np.full(len(chegada), -1)
+    entrada = chegada.copy()
+    for i in range(len(chegada)):
+        cabe = capacidades >= lotes["cabecas"][i]
+        # dia em que cada curral que comporta o lote fica disponível para ele
+        disponivel = np.where(cabe, np.maximum(livre_em, chegada[i]), np.iinfo(np.int64).max)
+        primeiro = disponivel.min()
+        if primeiro - chegada[i] > max_espera:
+            continue
+        candidatos = np.flatnonzero(disponivel == primeiro)
+        escolhido = candidatos[np.argmin(capacidades[candidatos])]
+        curral[i] = escolhido
+        entrada[i] = primeiro
+        livre_em[escolhido] = primeiro + dias[i]
+
+    lotes["curral"] = curral
+    lotes["entrada"] = entrada.astype("datetime64[D]")
+    lotes["saida"] = (entrada + dias).astype("datetime64[D]")
+    lotes["espera"] = np.where(curral >= 0, entrada - chegada, 0)
+    return lotes
+
+
+# ==============================
+# CALENDÁRIO (CAIXA E OCUPAÇÃO)
+# ==============================
+def _por_dia(indices, valores, n_dias):
+    return np.bincount(indices, weights=valores, minlength=n_dias)[:n_dias]
+
+
+def agendar(lotes, capacidades, juros_mes=None, data_inicial=None, max_espera=MAX_ESPERA):
+    """Aloca os lotes e monta o calendário diário de caixa, juros e ocupação.
+
+    ``juros_mes`` é a taxa do capital de giro (padrão: a dos parâmetros do
+    primeiro lote). Devolve um dict com ``lotes`` (alocação e resultado
+    operacional por sublote), ``datas``, ``diario`` (séries de
+    ``SERIES_DIARIAS``), ``ocupacao_currais`` (cabeças, currais × dias) e
+    ``resumo``. Levanta ``ValueError`` sem lotes.
+    """
+    if not len(lotes["cabecas"]):
+        raise ValueError("a lista de compras não tem nenhum lote")
+    capacidades = np.asarray(capacidades, dtype=np.int64)
+    lotes = alocar(lotes, capacidades, max_espera)
+    alocado = lotes["curral"] >= 0
+    if juros_mes is None:
+        juros_mes = float(lotes["juros_mes"][0]) if len(lotes["juros_mes"]) else PADROES_CONFINAMENTO["juros_mes"]
+
+    # resultado operacional por cabeça, sem os juros do motor (vão para o capital de giro)
+    por_cabeca = calcular_confinamento(**{**{n: lotes[n] for n in PADROES_CONFINAMENTO}, "juros_mes": 0.0})
+    cabecas = np.where(alocado, lotes["cabecas"], 0).astype(np.float64)
+    compra = (por_cabeca["valor_compra"] + lotes["custos_extras"]) * cabecas
+    custeio_dia = (lotes["diaria"] + lotes["servicos_operacionais"]) * cabecas
+    receita = por_cabeca["receita"] * cabecas
+    lotes["lucro_operacional"] = por_cabeca["lucro"] * cabecas
+
+    inicio = np.datetime64(data_inicial, "D") if data_inicial is not None else lotes["data_entrada"].min()
+    entrada = (lotes["entrada"] - inicio).astype(np.int64)
+    saida = (lotes["saida"] - inicio).astype(np.int64)
+    if (entrada[alocado] < 0).any():
+        raise ValueError("data_inicial posterior à entrada de algum lote")
+    n_dias = int(saida[alocado].max()) + 1 if alocado.any() else 1
+    entrada, saida = entrada[alocado], saida[alocado]
+
+    # custeio corre de entrada até a véspera da saída: diferença + soma acumulada
+    custeio = np.cumsum(_por_dia(entrada, custeio_dia[alocado], n_dias + 1)
+                        - _por_dia(saida, custeio_dia[alocado], n_dias + 1))[:n_dias]
+    saidas_caixa = _por_dia(entrada, compra[alocado], n_dias) + custeio
+    entradas_caixa = _por_dia(saida, receita[alocado], n_dias)
+    fluxo = entradas_caixa - saidas_caixa
+    saldo = np.cumsum(fluxo)
+    juros = np.maximum(-saldo, 0.0) * juros_mes / 30
+    saldo_com_juros = saldo - np.cumsum(juros)
+
+    # ocupação: cabeças por curral e dia (diferença por curral + soma acumulada)
+    n_currais = len(capacidades)
+    curral = lotes["curral"][alocado]
+    ocupacao_currais = np.zeros((n_currais, n_dias + 1))
+    np.add.at(ocupacao_currais, (curral, entrada), cabecas[alocado])
+    np.add.at(ocupacao_currais, (curral, saida), -cabecas[alocado])
+    ocupacao_currais = np.cumsum(ocupacao_currais, axis=1)[:, :n_dias]
+    cabecas_dia = ocupacao_currais.sum(axis=0)
+
+    diario = dict(zip(SERIES_DIARIAS, (
+        entradas_caixa, saidas_caixa, fluxo, saldo, juros, saldo_com_juros,
+        cabecas_dia, cabecas_dia / capacidades.sum(), np.count_nonzero(ocupacao_currais, axis=0),
+    )))
+    resumo = {
+        "lotes": int(len(np.unique(lotes["lote"]))),
+        "sublotes_alocados": int(alocado.sum()),
+        "sublotes_nao_alocados": int((~alocado).sum()),
+        "cabecas_alocadas": int(cabecas.sum()),
+        "espera_media": float(lotes["espera"][alocado].mean()) if alocado.any() else 0.0,
+        "lucro_operacional": float(lotes["lucro_operacional"][alocado].sum()),
+        "juros_capital_giro": float(juros.sum()),
+        "lucro": float(saldo_com_juros[-1]),
+        "pico_capital": float(max(0.0, -saldo_com_juros.min())),
+        "ocupacao_media": float(diario["ocupacao"].mean()),
+    }
+    return {
+        "lotes": lotes,
+        "datas": inicio + np.arange(n_dias),
+        "diario": diario,
+        "ocupacao_currais": ocupacao_currais,
+        "resumo": resumo,
+    }
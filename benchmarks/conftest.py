@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Benchmarks dos caminhos críticos (cálculos, sensibilidade, PDF e rerun do App).
+
+Requer ``pip install -r requirements-bench.txt``. Rodar sempre da raiz do
+repositório (o caminho da linha de base no pytest.ini é relativo a ela):
+
+    pytest benchmarks --benchmark-compare=0001 \\
+        --benchmark-compare-fail=median:25%            # compara com a referência versionada
+    pytest benchmarks --benchmark-save=local           # grava uma execução local (não versionada)
+
+A referência versionada é ``benchmarks/.linhas_base/<máquina>/0001_referencia.json``;
+o pytest-benchmark só compara dentro da mesma pasta de máquina (sistema,
+Python e arquitetura), então o CI roda num executor com essa mesma
+identificação. Para trocar de máquina ou atualizar a referência, apague o
+arquivo e regrave com ``--benchmark-save=referencia`` no executor do CI.
+"""
+import os
+import sys
+
+import numpy as np
+import pytest
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
+
+from recria_engine import PADROES_RECRIA  # noqa: E402
+from confinamento_engine import PADROES_CONFINAMENTO  # noqa: E402
+
+
+N_CENARIOS = 100_000
+
+
+@pytest.fixture(scope="session")
+def raiz():
+    return RAIZ
+
+
+@pytest.fixture(scope="session")
+def cenarios_recria():
+    rng = np.random.default_rng(0)
+    return {
+        **{nome: np.full(N_CENARIOS, float(valor)) for nome, valor in PADROES_RECRIA.items()},
+        "peso_inicial": rng.uniform(150, 250, N_CENARIOS),
+        "preco_compra_pyg": rng.uniform(15000, 25000, N_CENARIOS),
+        "dias": rng.integers(90, 540, N_CENARIOS).astype(np.float64),
+        "gmd": rng.uniform(0.3, 0.9, N_CENARIOS),
+        "preco_venda_kg": rng.uniform(1.5, 3.5, N_CENARIOS),
+    }
+
+
+@pytest.fixture(scope="session")
+def cenarios_confinamento():
+    rng = np.random.default_rng(1)
+    return {
+        **{nome: np.full(N_CENARIOS, float(valor)) for nome, valor in PADROES_CONFINAMENTO.items()},
+        "peso_inicial": rng.uniform(300, 420, N_CENARIOS),
+        "ganho_dia": rng.uniform(1.0, 1.8, N_CENARIOS),
+        "dias": rng.integers(60, 180, N_CENARIOS).astype(np.float64),
+    }
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+"""Tempo de execução completa do App.py (primeira execução e rerun por slider)."""
+import os
+
+import pytest
+
+AppTest = pytest.importorskip("streamlit.testing.v1").AppTest
+
+
+@pytest.fixture
+def app(raiz):
+    return AppTest.from_file(os.path.join(raiz, "App.py"), default_timeout=120)
+
+
+@pytest.mark.benchmark(group="app")
+def test_app_primeira_execucao(benchmark, raiz):
+    def executar():
+        at = AppTest.from_file(os.path.join(raiz, "App.py"), default_timeout=120).run()
+        assert not at.exception
+        return at
+
+    benchmark.pedantic(executar, rounds=5, iterations=1)
+
+
+@pytest.mark.benchmark(group="app")
+def test_app_rerun_slider(benchmark, app):
+    app.run()
+    valores = iter([0.5, 0.6] * 50)
+
+    def mover_slider():
+        app.slider(key="recria_sens_gmd").set_value(next(valores)).run()
+        assert not app.exception
+
+    benchmark.pedantic(mover_slider, rounds=10, iterations=1)
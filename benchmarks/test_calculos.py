@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Cálculo escalar (fórmulas originais, um cenário por vez) × motores vetorizados."""
+import numpy as np
+import pytest
+
+from confinamento_engine import calcular_confinamento
+from conftest import N_CENARIOS
+from recria_engine import evaluate_recria, superficie_lucro
+from tests.referencia import confinamento_escalar, recria_escalar
+
+N_ESCALAR = 2_000
+
+
+def _linhas(colunas, n):
+    nomes = list(colunas)
+    return [dict(zip(nomes, valores)) for valores in zip(*(colunas[nome][:n].tolist() for nome in nomes))]
+
+
+@pytest.mark.benchmark(group="recria")
+def test_recria_escalar(benchmark, cenarios_recria):
+    linhas = _linhas(cenarios_recria, N_ESCALAR)
+    resultado = benchmark(lambda: [recria_escalar(**linha) for linha in linhas])
+    benchmark.extra_info["cenarios"] = N_ESCALAR
+    vetorizado = evaluate_recria(**{k: v[:N_ESCALAR] for k, v in cenarios_recria.items()})
+    np.testing.assert_allclose([r["lucro"] for r in resultado], vetorizado["lucro"], rtol=1e-9)
+
+
+@pytest.mark.benchmark(group="recria")
+@pytest.mark.parametrize("n", [N_ESCALAR, N_CENARIOS])
+def test_recria_vetorizado(benchmark, cenarios_recria, n):
+    benchmark(evaluate_recria, **{k: v[:n] for k, v in cenarios_recria.items()})
+    benchmark.extra_info["cenarios"] = n
+
+
+@pytest.mark.benchmark(group="confinamento")
+def test_confinamento_escalar(benchmark, cenarios_confinamento):
+    linhas = _linhas(cenarios_confinamento, N_ESCALAR)
+    resultado = benchmark(lambda: [confinamento_escalar(**linha) for linha in linhas])
+    benchmark.extra_info["cenarios"] = N_ESCALAR
+    vetorizado = calcular_confinamento(**{k: v[:N_ESCALAR] for k, v in cenarios_confinamento.items()})
+    np.testing.assert_allclose([r["lucro"] for r in resultado], vetorizado["lucro"], rtol=1e-9)
+
+
+@pytest.mark.benchmark(group="confinamento")
+@pytest.mark.parametrize("n", [N_ESCALAR, N_CENARIOS])
+def test_confinamento_vetorizado(benchmark, cenarios_confinamento, n):
+    benchmark(calcular_confinamento, **{k: v[:n] for k, v in cenarios_confinamento.items()})
+    benchmark.extra_info["cenarios"] = n
+
+
+@pytest.mark.benchmark(group="sensibilidade")
+def test_sensibilidade_ponto(benchmark):
+    # cenário único do bloco "Análise de Sensibilidade Interativa"
+    def ponto(peso_inicial=175.0, cambio=7320.0, dias=365, custo_total_periodo=153.66, frete=8.0,
+              comissao=4.0, juros_anual=0.085, sens_preco_compra=20000, sens_preco_venda=2.4, sens_gmd=0.49):
+        valor_compra_usd_sens = (peso_inicial * sens_preco_compra) / cambio if cambio > 0 else 0
+        receita_sens = (peso_inicial + sens_gmd * dias) * sens_preco_venda
+        custo_total_sens = valor_compra_usd_sens + custo_total_periodo + frete + comissao
+        juros_sens = valor_compra_usd_sens * juros_anual * (dias / 365)
+        return receita_sens - custo_total_sens - juros_sens
+
+    benchmark(ponto)
+
+
+@pytest.mark.benchmark(group="sensibilidade")
+def test_sensibilidade_grade(benchmark):
+    superficie = benchmark(superficie_lucro, 175.0, 7320.0, 365, 153.66, 8.0, 4.0, 0.085)
+    benchmark.extra_info["pontos"] = superficie.size
@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+"""Diagramação do relatório PDF da recria (sem e com cache)."""
+import datetime
+
+import pytest
+
+from recria_engine import PADROES_RECRIA
+from relatorio_pdf import elementos_recria, montar_pdf, pdf_recria
+
+DATA = datetime.date(2025, 1, 1)
+
+
+@pytest.mark.benchmark(group="pdf")
+def test_pdf_recria_renderizacao(benchmark):
+    dados = benchmark(lambda: montar_pdf(elementos_recria(PADROES_RECRIA, DATA)))
+    assert dados.startswith(b"%PDF")
+    benchmark.extra_info["bytes"] = len(dados)
+
+
+@pytest.mark.benchmark(group="pdf")
+def test_pdf_recria_cache(benchmark):
+    pdf_recria(data_inicial=DATA, **PADROES_RECRIA)
+    dados = benchmark(pdf_recria, data_inicial=DATA, **PADROES_RECRIA)
+    benchmark.extra_info["bytes"] = len(dados)
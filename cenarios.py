@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+"""Armazém persistente de cenários (SQLite) com entradas e resultados.
+
+Uma tabela por etapa (``recria``, ``confinamento``) com colunas REAL para
+cada parâmetro e cada indicador, mais ``cliente``, ``lote``, ``data`` e o
+``hash`` dos parâmetros. Índices em (cliente, lote, data) e em ``hash``
+permitem buscar um cenário já calculado sem reavaliar o motor e consultar
+lotes inteiros de uma vez (colunas NumPy).
+
+O arquivo padrão é ``cenarios.sqlite3`` no diretório atual, ou o caminho em
+``SIMULADOR_BANCO``.
+"""
+import datetime
+import hashlib
+import os
+import sqlite3
+
+import numpy as np
+
+from etapas import ETAPAS, colunas_parametros, motor_da_etapa
+
+
+ARQUIVO_BANCO = os.environ.get("SIMULADOR_BANCO", "cenarios.sqlite3")
+
+COLUNAS_CHAVE = ("cliente", "lote", "data")
+
+
+def conectar(caminho=None):
+    """Abre (e cria, se preciso) o banco de cenários.
+
+    A conexão pode passar de uma thread a outra (os reruns de uma sessão do
+    App nem sempre rodam na mesma), mas não deve ser usada por duas ao mesmo
+    tempo: as transações são por conexão. O App abre uma por sessão.
+    """
+    conexao = sqlite3.connect(caminho or ARQUIVO_BANCO, check_same_thread=False)
+    conexao.execute("PRAGMA journal_mode=WAL")
+    for etapa, (_, padroes, indicadores) in ETAPAS.items():
+        numericas = ", ".join(f"{nome} REAL" for nome in (*padroes, *indicadores))
+        conexao.execute(
+            f"CREATE TABLE IF NOT EXISTS {etapa} ("
+            "id INTEGER PRIMARY KEY, hash TEXT NOT NULL, "
+            "cliente TEXT NOT NULL DEFAULT '', lote TEXT NOT NULL DEFAULT '', data TEXT NOT NULL DEFAULT '', "
+            f"criado_em TEXT NOT NULL, {numericas}, "
+            "UNIQUE (cliente, lote, data, hash))"
+        )
+        conexao.execute(f"CREATE INDEX IF NOT EXISTS {etapa}_cliente ON {etapa} (cliente, lote, data)")
+        conexao.execute(f"CREATE INDEX IF NOT EXISTS {etapa}_hash ON {etapa} (hash)")
+    conexao.commit()
+    return conexao
+
+
+def hash_parametros(etapa, params):
+    """Hash (16 hex) de cada cenário, pelos parâmetros arredondados como no cache."""
+    _, padroes, _ = motor_da_etapa(etapa)
+    colunas, _ = colunas_parametros(params, padroes)
+    matriz = np.round(np.column_stack(list(colunas.values())), 9) + 0.0   # -0.0 -> 0.0
+    return [hashlib.sha1(linha.tobytes()).hexdigest()[:16] for linha in matriz]
+
+
+def _textos(valor, n):
+    if valor is None:
+        return [""] * n
+    if isinstance(valor, (str, datetime.date)):
+        return [str(valor)] * n
+    return [str(item) for item in valor]
+
+
+def salvar_cenarios(conexao, etapa, params, cliente=None, lote=None, data=None):
+    """Avalia os cenários (escalares ou arrays) e grava entradas + resultados.
+
+    ``cliente``, ``lote`` e ``data`` podem ser um valor para todos ou um por
+    cenário. Um cenário igual (mesmos chave e hash) é substituído. Devolve os
+    hashes gravados.
+    """
+    motor, padroes, indicadores = motor_da_etapa(etapa)
+    colunas, n = colunas_parametros(params, padroes)
+    resultado = motor(**colunas)
+
+    nomes = (*padroes, *indicadores)
+    valores = np.column_stack(
+        [colunas[nome] for nome in padroes]
+        + [np.broadcast_to(resultado[nome], (n,)) for nome in indicadores]
+    ).tolist()
+    hashes = hash_parametros(etapa, colunas)
+    criado_em = datetime.datetime.now().isoformat(timespec="seconds")
+
+    linhas = [
+        (h, c, lt, d, criado_em, *linha)
+        for h, c, lt, d, linha in zip(hashes, _textos(cliente, n), _textos(lote, n), _textos(data, n), valores)
+    ]
+    marcadores = ", ".join("?" * (5 + len(nomes)))
+    with conexao:
+        conexao.executemany(
+            f"INSERT OR REPLACE INTO {etapa} (hash, cliente, lote, data, criado_em, {', '.join(nomes)}) "
+            f"VALUES ({marcadores})",
+            linhas,
+        )
+    return hashes
+
+
+def buscar_resultado(conexao, etapa, params):
+    """Resultado já gravado de um cenário (dict de floats) ou ``None``."""
+    _, _, indicadores = motor_da_etapa(etapa)
+    linha = conexao.execute(
+        f"SELECT {', '.join(indicadores)} FROM {etapa} WHERE hash = ? LIMIT 1",
+        (hash_parametros(etapa, params)[0],),
+    ).fetchone()
+    return None if linha is None else dict(zip(indicadores, linha))
+
+
+def consultar(conexao, etapa, cliente=None, lote=None, data_inicial=None, data_final=None, limite=None):
+    """Cenários gravados como colunas ``{nome: np.ndarray}`` (mais recentes primeiro).
+
+    Filtros opcionais por cliente, lote e intervalo de datas (AAAA-MM-DD).
+    """
+    _, padroes, indicadores = motor_da_etapa(etapa)
+    filtros, argumentos = [], []
+    for coluna, valor in (("cliente", cliente), ("lote", lote)):
+        if valor is not None:
+            filtros.append(f"{coluna} = ?")
+            argumentos.append(str(valor))
+    if data_inicial is not None:
+        filtros.append("data >= ?")
+        argumentos.append(str(data_inicial))
+    if data_final is not None:
+        filtros.append("data <= ?")
+        argumentos.append(str(data_final))
+
+    texto = ("hash", *COLUNAS_CHAVE, "criado_em")
+    numericas = (*padroes, *indicadores)
+    sql = f"SELECT {', '.join((*texto, *numericas))} FROM {etapa}"
+    if filtros:
+        sql += " WHERE " + " AND ".join(filtros)
+    sql += " ORDER BY criado_em DESC, id DESC"
+    if limite is not None:
+        sql += f" LIMIT {int(limite)}"
+
+    linhas = conexao.execute(sql, argumentos).fetchall()
+    colunas = {nome: np.array([linha[i] for linha in linhas], dtype=object) for i, nome in enumerate(texto)}
+    matriz = np.array([linha[len(texto):] for linha in linhas], dtype=np.float64).reshape(len(linhas), len(numericas))
+    colunas.update({nome: matriz[:, i] for i, nome in enumerate(numericas)})
+    return colunas
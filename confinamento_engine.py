@@ -0,0 +1,173 @@
+# -*- coding: utf-8 -*-
+"""Motor de cálculo do Confinamento (NumPy puro, sem Streamlit).
+
+``evaluate_confinamento`` recebe um array estruturado com um registro por
+animal (ou cenário) e devolve outro array estruturado com os resultados, sem
+laços Python por animal.
+"""
+import functools
+
+import numpy as np
+
+from recria_engine import TAMANHO_CACHE, chave_cenario, dividir, escalar, estatisticas_cache
+
+
+# Parâmetros de entrada; rendimentos e juros em fração (0.56 = 56%).
+PARAMS_CONFINAMENTO = np.dtype([
+    ("peso_inicial", np.float64),
+    ("ganho_dia", np.float64),
+    ("dias", np.float64),
+    ("rendimento_ini", np.float64),
+    ("rendimento_fim", np.float64),
+    ("preco_compra_kg", np.float64),
+    ("preco_venda_kg", np.float64),
+    ("diaria", np.float64),
+    ("servicos_operacionais", np.float64),
+    ("custos_extras", np.float64),
+    ("juros_mes", np.float64),
+])
+
+# Valores padrão dos campos da aba Confinamento (rendimentos e juros em fração).
+PADROES_CONFINAMENTO = {
+    "peso_inicial": 350.0,
+    "ganho_dia": 1.40,
+    "dias": 110,
+    "rendimento_ini": 0.50,
+    "rendimento_fim": 0.56,
+    "preco_compra_kg": 11.30,
+    "preco_venda_kg": 21.40,
+    "diaria": 14.50,
+    "servicos_operacionais": 1.0,
+    "custos_extras": 0.0,
+    "juros_mes": 0.005,
+}
+
+RESULTADO_CONFINAMENTO = np.dtype([
+    ("peso_final", np.float64),
+    ("carcaca_final", np.float64),
+    ("ganho_peso", np.float64),
+    ("ganho_carcaca", np.float64),
+    ("carcaca_dia", np.float64),
+    ("valor_compra", np.float64),
+    ("custo_nutricional", np.float64),
+    ("custo_servicos", np.float64),
+    ("despesas_totais", np.float64),
+    ("juros", np.float64),
+    ("custo_total", np.float64),
+    ("receita", np.float64),
+    ("lucro", np.float64),
+    ("margem_lucro", np.float64),
+    ("roi", np.float64),
+    ("roi_mensal", np.float64),
+    ("roi_custo", np.float64),
+    ("roi_custo_mensal", np.float64),
+])
+
+INDICADORES_CONFINAMENTO = RESULTADO_CONFINAMENTO.names
+
+
+def calcular_confinamento(
+    peso_inicial,
+    ganho_dia,
+    dias,
+    rendimento_ini,
+    rendimento_fim,
+    preco_compra_kg,
+    preco_venda_kg,
+    diaria,
+    servicos_operacionais,
+    custos_extras,
+    juros_mes,
+):
+    """Calcula os indicadores do confinamento a partir de escalares ou arrays.
+
+    Devolve um dict ``{indicador: np.ndarray}`` com as chaves de
+    ``INDICADORES_CONFINAMENTO``, todos no formato do broadcasting das entradas.
+    """
+    peso_inicial = np.asarray(peso_inicial, dtype=np.float64)
+    dias = np.asarray(dias, dtype=np.float64)
+    custos_extras = np.asarray(custos_extras, dtype=np.float64)
+
+    peso_final = peso_inicial + ganho_dia * dias
+    carcaca_final = peso_final * rendimento_fim
+
+    ganho_peso = peso_final - peso_inicial
+    ganho_carcaca = carcaca_final - (peso_inicial * rendimento_ini)
+    carcaca_dia = dividir(ganho_carcaca, dias)
+
+    valor_compra = peso_inicial * preco_compra_kg
+    custo_nutricional = dias * diaria
+    custo_servicos = dias * servicos_operacionais
+    despesas_totais = custo_nutricional + custo_servicos + custos_extras
+
+    juros = valor_compra * juros_mes * (dias / 30)
+    custo_total = valor_compra + despesas_totais + juros
+
+    receita = carcaca_final * preco_venda_kg
+    lucro = receita - custo_total
+
+    margem_lucro = dividir(lucro, receita) * 100
+    roi = dividir(lucro, valor_compra) * 100
+    roi_mensal = dividir(roi, dias) * 30
+    roi_custo = dividir(lucro, custo_total) * 100
+    roi_custo_mensal = dividir(roi_custo, dias) * 30
+
+    indicadores = (
+        peso_final, carcaca_final, ganho_peso, ganho_carcaca, carcaca_dia,
+        valor_compra, custo_nutricional, custo_servicos, despesas_totais,
+        juros, custo_total, receita, lucro, margem_lucro, roi, roi_mensal,
+        roi_custo, roi_custo_mensal,
+    )
+    return dict(zip(INDICADORES_CONFINAMENTO, np.broadcast_arrays(*indicadores)))
+
+
+def evaluate_confinamento(params: np.ndarray) -> np.ndarray:
+    """Avalia um lote de animais/cenários de confinamento.
+
+    ``params`` é um array estruturado com os campos de ``PARAMS_CONFINAMENTO``
+    ou um array float cujo último eixo traz esses campos na mesma ordem.
+    Devolve um array estruturado ``RESULTADO_CONFINAMENTO`` com o formato dos
+    registros de entrada.
+    """
+    params = np.asarray(params)
+    if params.dtype.names is None:
+        if params.shape[-1:] != (len(PARAMS_CONFINAMENTO.names),):
+            raise ValueError(
+                f"Esperado último eixo com {len(PARAMS_CONFINAMENTO.names)} colunas "
+                f"({', '.join(PARAMS_CONFINAMENTO.names)}), recebido {params.shape}"
+            )
+        colunas = {
+            nome: params[..., i].astype(np.float64, copy=False)
+            for i, nome in enumerate(PARAMS_CONFINAMENTO.names)
+        }
+    else:
+        faltando = set(PARAMS_CONFINAMENTO.names) - set(params.dtype.names)
+        if faltando:
+            raise ValueError(f"Campos ausentes em params: {', '.join(sorted(faltando))}")
+        colunas = {nome: params[nome] for nome in PARAMS_CONFINAMENTO.names}
+
+    indicadores = calcular_confinamento(**colunas)
+
+    resultado = np.empty(next(iter(indicadores.values())).shape, dtype=RESULTADO_CONFINAMENTO)
+    for nome, valores in indicadores.items():
+        resultado[nome] = valores
+    return resultado
+
+
+@functools.lru_cache(maxsize=TAMANHO_CACHE)
+def _cenario_confinamento(chave):
+    return escalar(calcular_confinamento(*chave))
+
+
+def cenario_confinamento(**params):
+    """Versão memoizada (LRU) de ``calcular_confinamento`` para um único cenário.
+
+    Recebe os campos de ``PARAMS_CONFINAMENTO`` por nome e devolve
+    ``{indicador: float}``.
+    """
+    chave = chave_cenario(*(params[nome] for nome in PARAMS_CONFINAMENTO.names))
+    return dict(_cenario_confinamento(chave))
+
+
+def estatisticas_cache_confinamento():
+    return estatisticas_cache(_cenario_confinamento)
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+"""Motores de cada etapa e montagem das colunas de parâmetros.
+
+Ponto único para as ferramentas que aceitam ``etapa`` (``"recria"`` ou
+``"confinamento"``) escolherem o motor, os valores padrão e os indicadores,
+e para completarem os parâmetros informados com os padrões num formato comum.
+"""
+import numpy as np
+
+from confinamento_engine import INDICADORES_CONFINAMENTO, PADROES_CONFINAMENTO, calcular_confinamento
+from recria_engine import INDICADORES_RECRIA, PADROES_RECRIA, evaluate_recria
+
+
+# etapa: (motor, padrões, indicadores)
+ETAPAS = {
+    "recria": (evaluate_recria, PADROES_RECRIA, INDICADORES_RECRIA),
+    "confinamento": (calcular_confinamento, PADROES_CONFINAMENTO, INDICADORES_CONFINAMENTO),
+}
+
+
+def motor_da_etapa(etapa):
+    """``(motor, padrões, indicadores)`` da etapa; ``ValueError`` se não existir."""
+    if etapa not in ETAPAS:
+        raise ValueError(f"Etapa inválida: {etapa!r} (use {', '.join(ETAPAS)})")
+    return ETAPAS[etapa]
+
+
+def colunas_parametros(params, padroes, n=None):
+    """Completa ``params`` com ``padroes`` e devolve ``({campo: array 1-D}, n)``.
+
+    Só os campos de ``padroes`` entram (os de padrão ``None`` só se
+    informados); escalares e arrays são estendidos para ``n`` linhas (padrão:
+    o maior comprimento). Os arrays são vistas somente leitura.
+    """
+    params = {**padroes, **params}
+    colunas = {
+        nome: np.atleast_1d(np.asarray(params[nome], dtype=np.float64))
+        for nome in padroes if params[nome] is not None
+    }
+    n = n or max(len(valor) for valor in colunas.values())
+    return {nome: np.broadcast_to(valor, (n,)) for nome, valor in colunas.items()}, n
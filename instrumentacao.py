@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Instrumentação opcional dos caminhos críticos (tempo por seção).
+
+Desligada por padrão. Liga com a variável de ambiente
+``SIMULADOR_INSTRUMENTACAO=1`` (todas as execuções) ou por execução com
+``iniciar_execucao(ativo=True)`` (o App usa ``?debug=1`` na URL).
+
+Cada ``with secao("recria.calculos"):`` registra:
+
+* a latência na execução corrente (``tempos_execucao()``, para o painel de debug);
+* contadores acumulados do processo, exportáveis em texto Prometheus
+  (``exportar_prometheus`` / ``gravar_prometheus``);
+* uma linha de log estruturado (JSON) no logger ``simulador.instrumentacao``.
+"""
+import contextlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+
+
+ATIVO = os.environ.get("SIMULADOR_INSTRUMENTACAO", "") == "1"
+ARQUIVO_METRICAS = os.environ.get("SIMULADOR_METRICAS_ARQUIVO")
+
+logger = logging.getLogger("simulador.instrumentacao")
+
+_execucao = threading.local()
+_trava = threading.Lock()
+_contadores = {}   # secao -> [execucoes, segundos_total, segundos_max]
+
+
+def iniciar_execucao(ativo=None):
+    """Zera os tempos da execução (rerun) corrente desta thread."""
+    _execucao.ativo = ATIVO if ativo is None else (ativo or ATIVO)
+    _execucao.tempos = []
+
+
+def ativo():
+    return getattr(_execucao, "ativo", ATIVO)
+
+
+def tempos_execucao():
+    """Lista ``[(secao, segundos), ...]`` da execução corrente, em ordem."""
+    return list(getattr(_execucao, "tempos", []))
+
+
+def registrar(nome, segundos):
+    with _trava:
+        contador = _contadores.setdefault(nome, [0, 0.0, 0.0])
+        contador[0] += 1
+        contador[1] += segundos
+        contador[2] = max(contador[2], segundos)
+    if hasattr(_execucao, "tempos"):
+        _execucao.tempos.append((nome, segundos))
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(json.dumps({"secao": nome, "ms": round(segundos * 1000, 3)}))
+
+
+@contextlib.contextmanager
+def secao(nome):
+    """Mede o tempo do bloco quando a instrumentação está ativa."""
+    if not ativo():
+        yield
+        return
+    inicio = time.perf_counter()
+    try:
+        yield
+    finally:
+        registrar(nome, time.perf_counter() - inicio)
+
+
+def contadores():
+    """Cópia dos contadores acumulados ``{secao: (execucoes, total_s, max_s)}``."""
+    with _trava:
+        return {nome: tuple(valores) for nome, valores in _contadores.items()}
+
+
+def _rotulo(valor):
+    return str(valor).replace("\\", "\\\\").replace('"', '\\"')
+
+
+def exportar_prometheus(caches=None):
+    """Contadores no formato de texto do Prometheus.
+
+    ``caches`` opcional: ``{nome: {"hits":..., "misses":..., "entradas":...}}``.
+    """
+    linhas = [
+        "# HELP simulador_secao_execucoes_total Execuções de cada seção instrumentada.",
+        "# TYPE simulador_secao_execucoes_total counter",
+    ]
+    dados = contadores()
+    linhas += [f'simulador_secao_execucoes_total{{secao="{_rotulo(n)}"}} {v[0]}' for n, v in sorted(dados.items())]
+    linhas += [
+        "# HELP simulador_secao_segundos_total Tempo acumulado por seção.",
+        "# TYPE simulador_secao_segundos_total counter",
+    ]
+    linhas += [f'simulador_secao_segundos_total{{secao="{_rotulo(n)}"}} {v[1]:.6f}' for n, v in sorted(dados.items())]
+    linhas += [
+        "# HELP simulador_secao_segundos_max Maior tempo observado por seção.",
+        "# TYPE simulador_secao_segundos_max gauge",
+    ]
+    linhas += [f'simulador_secao_segundos_max{{secao="{_rotulo(n)}"}} {v[2]:.6f}' for n, v in sorted(dados.items())]
+
+    if caches:
+        for metrica, campo, tipo in (("hits_total", "hits", "counter"),
+                                     ("misses_total", "misses", "counter"),
+                                     ("entradas", "entradas", "gauge")):
+            linhas.append(f"# TYPE simulador_cache_{metrica} {tipo}")
+            linhas += [f'simulador_cache_{metrica}{{cache="{_rotulo(n)}"}} {e[campo]}'
+                       for n, e in sorted(caches.items())]
+    return "\n".join(linhas) + "\n"
+
+
+def gravar_prometheus(caminho=None, caches=None):
+    """Grava ``exportar_prometheus`` de forma atômica (para o textfile collector)."""
+    caminho = caminho or ARQUIVO_METRICAS
+    if not caminho:
+        return
+    pasta = os.path.dirname(os.path.abspath(caminho))
+    with tempfile.NamedTemporaryFile("w", dir=pasta, delete=False, encoding="utf-8") as arquivo:
+        arquivo.write(exportar_prometheus(caches))
+    os.replace(arquivo.name, caminho)
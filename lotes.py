@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""Leitura, avaliação e gravação de listas de lotes (CSV/Parquet).
+
+As colunas usam os mesmos nomes e unidades dos motores (juros e rendimentos em
+fração); colunas ausentes ou vazias recebem os valores padrão das abas. No
+ciclo, os campos do confinamento levam o prefixo ``conf_``.
+
+Arquivos grandes passam por ``processar_arquivo``: leitura em blocos de
+tamanho fixo, avaliação vetorizada de cada bloco e gravação incremental, com
+memória constante independentemente do tamanho do arquivo.
+"""
+import os
+
+import numpy as np
+import pandas as pd
+
+from confinamento_engine import PADROES_CONFINAMENTO, calcular_confinamento
+from pipeline import PREFIXO_CONFINAMENTO, evaluate_ciclo
+from recria_engine import PADROES_RECRIA, evaluate_recria
+
+
+EXTENSOES_PARQUET = (".parquet", ".pq")
+
+TIPOS = ("recria", "confinamento", "ciclo")
+
+TAMANHO_BLOCO = 100_000
+
+# Colunas lidas como número no CSV; as demais (lote, cliente, datas...) como texto.
+CAMPOS_NUMERICOS = frozenset(
+    (*PADROES_RECRIA, *PADROES_CONFINAMENTO, *(PREFIXO_CONFINAMENTO + nome for nome in PADROES_CONFINAMENTO))
+)
+
+
+def eh_parquet(caminho):
+    return os.path.splitext(str(caminho))[1].lower() in EXTENSOES_PARQUET
+
+
+def _tipos_csv(caminho):
+    # tipos fixos para o arquivo todo: a inferência do pandas muda de um bloco
+    # para outro (coluna vazia no 1º bloco, "001" virando 1, "A3" depois de "002")
+    colunas = pd.read_csv(caminho, nrows=0).columns
+    if hasattr(caminho, "seek"):
+        caminho.seek(0)
+    return {coluna: np.float64 if coluna in CAMPOS_NUMERICOS else str for coluna in colunas}
+
+
+def ler_tabela(caminho):
+    """Lê um arquivo CSV ou Parquet inteiro num DataFrame."""
+    if eh_parquet(caminho):
+        return pd.read_parquet(caminho)
+    return pd.read_csv(caminho, dtype=_tipos_csv(caminho))
+
+
+def preparar_parametros(tabela, padroes):
+    """Colunas numéricas ``{campo: np.ndarray}`` prontas para o motor.
+
+    ``padroes`` define os campos esperados e o valor usado quando a coluna
+    não existe ou a célula está vazia.
+    """
+    params = {}
+    for campo, padrao in padroes.items():
+        if campo in tabela.columns:
+            coluna = pd.to_numeric(tabela[campo], errors="raise")
+            params[campo] = coluna.fillna(padrao).to_numpy(dtype=np.float64)
+        else:
+            params[campo] = np.full(len(tabela), padrao, dtype=np.float64)
+    return params
+
+
+def ler_datas(valores):
+    """Converte uma coluna de datas em ``datetime64`` (vazias viram ``NaT``).
+
+    Aceita AAAA-MM-DD (ISO, como no resto do simulador) e DD/MM/AAAA só nesse
+    formato exato, para 05/03/2026 nunca virar 3 de maio. Outros formatos
+    levantam ``ValueError``.
+    """
+    texto = pd.Series(valores).astype("string").str.strip()
+    brasileiro = texto.str.fullmatch(r"\d{1,2}/\d{1,2}/\d{4}").fillna(False)
+    datas = pd.to_datetime(texto.where(~brasileiro), format="ISO8601")
+    return datas.where(~brasileiro, pd.to_datetime(texto.where(brasileiro), format="%d/%m/%Y"))
+
+
+def nomes_lotes(tabela, coluna="lote"):
+    """Identificador de cada linha: coluna ``lote`` ou o número da linha."""
+    if coluna in tabela.columns:
+        return tabela[coluna].astype(str).tolist()
+    largura = len(str(len(tabela)))
+    return [str(i + 1).zfill(largura) for i in range(len(tabela))]
+
+
+# ==============================
+# AVALIAÇÃO
+# ==============================
+def avaliar_tabela(tabela, tipo="recria"):
+    """Avalia todas as linhas de uma vez e devolve tabela + parâmetros + indicadores.
+
+    Colunas que não são parâmetros (``lote``, cliente, datas...) são mantidas.
+    """
+    if tipo not in TIPOS:
+        raise ValueError(f"Tipo inválido: {tipo!r} (use {', '.join(TIPOS)})")
+
+    if tipo == "recria":
+        params = preparar_parametros(tabela, PADROES_RECRIA)
+        colunas = {**params, **evaluate_recria(**params)}
+    elif tipo == "confinamento":
+        params = preparar_parametros(tabela, PADROES_CONFINAMENTO)
+        colunas = {**params, **calcular_confinamento(**params)}
+    else:
+        params_recria = preparar_parametros(tabela, PADROES_RECRIA)
+        params_conf = preparar_parametros(
+            tabela, {PREFIXO_CONFINAMENTO + nome: valor for nome, valor in PADROES_CONFINAMENTO.items()}
+        )
+        params_conf = {nome[len(PREFIXO_CONFINAMENTO):]: valor for nome, valor in params_conf.items()}
+        resultado = evaluate_ciclo(params_recria, params_conf)
+        params_conf["peso_inicial"] = resultado["peso_final"]
+        params_conf["preco_compra_kg"] = params_recria["preco_venda_kg"]
+        colunas = {
+            **params_recria,
+            **{PREFIXO_CONFINAMENTO + nome: valor for nome, valor in params_conf.items()},
+            **resultado,
+        }
+
+    saida = tabela.reset_index(drop=True).drop(columns=[c for c in colunas if c in tabela.columns])
+    return pd.concat([saida, pd.DataFrame(colunas)], axis=1)
+
+
+# ==============================
+# STREAMING
+# ==============================
+def ler_blocos(caminho, tamanho_bloco=TAMANHO_BLOCO):
+    """Gera DataFrames de até ``tamanho_bloco`` linhas sem carregar o arquivo todo."""
+    if eh_parquet(caminho):
+        import pyarrow.parquet as pq
+        arquivo = pq.ParquetFile(caminho)
+        for lote in arquivo.iter_batches(batch_size=tamanho_bloco):
+            yield lote.to_pandas()
+    else:
+        with pd.read_csv(caminho, chunksize=tamanho_bloco, dtype=_tipos_csv(caminho)) as leitor:
+            yield from leitor
+
+
+def gravar_blocos(blocos, caminho):
+    """Grava um iterável de DataFrames incrementalmente em CSV ou Parquet.
+
+    Usa os escritores do pyarrow (o ``to_csv`` do pandas é ~10x mais lento
+    para colunas float). O esquema vem do primeiro bloco (colunas vazias viram
+    texto) e a saída é gravada num arquivo temporário, que só substitui
+    ``caminho`` no fim: uma falha no meio não deixa arquivo parcial. Devolve o
+    número de linhas gravadas.
+    """
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+
+    temporario = f"{caminho}.{os.getpid()}.tmp"
+    total = 0
+    escritor = None
+    esquema = None
+    try:
+        for bloco in blocos:
+            if escritor is None:
+                esquema = pa.Schema.from_pandas(bloco, preserve_index=False)
+                esquema = pa.schema([
+                    campo.with_type(pa.string()) if pa.types.is_null(campo.type) else campo for campo in esquema
+                ])
+                if eh_parquet(caminho):
+                    escritor = pq.ParquetWriter(temporario, esquema)
+                else:
+                    escritor = pa_csv.CSVWriter(temporario, esquema)
+            escritor.write_table(pa.Table.from_pandas(bloco, schema=esquema, preserve_index=False))
+            total += len(bloco)
+    except BaseException:
+        if escritor is not None:
+            escritor.close()
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        raise
+    if escritor is None:
+        return 0
+    escritor.close()
+    os.replace(temporario, caminho)
+    return total
+
+
+def processar_arquivo(entrada, saida, tipo="recria", tamanho_bloco=TAMANHO_BLOCO):
+    """Lê ``entrada`` em blocos, avalia cada bloco e grava em ``saida``.
+
+    Devolve o número de linhas processadas.
+    """
+    return gravar_blocos(
+        (avaliar_tabela(bloco, tipo) for bloco in ler_blocos(entrada, tamanho_bloco)),
+        saida,
+    )
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""Modelo diário (passo de 1 dia) da recria e do confinamento.
+
+Em vez de ``peso_final = peso_inicial + gmd * dias`` e custos fixos por dia/mês,
+monta matrizes animais × dias com peso, consumo de matéria seca, custo
+alimentar, rendimento de carcaça e juros acumulados, todas por somas
+acumuladas vetorizadas. Lotes grandes são processados em blocos de animais
+(``resumo_*``), mantendo a memória limitada.
+
+Com GMD e custo constantes e juros só sobre a compra, o último dia reproduz
+exatamente os motores lineares (``evaluate_recria`` / ``calcular_confinamento``).
+O passo é de um dia, então ``dias`` precisa ser inteiro.
+"""
+import numpy as np
+
+from confinamento_engine import PADROES_CONFINAMENTO
+from etapas import colunas_parametros
+from recria_engine import PADROES_RECRIA, dividir
+
+
+# Campos extras do modelo diário (além dos parâmetros de cada motor).
+PADROES_DIARIO_CONFINAMENTO = {
+    "ganho_dia_fim": None,        # GMD no último dia (None = ganho_dia constante)
+    "consumo_pv": 0.023,          # consumo de MS (fração do peso vivo/dia)
+    "custo_kg_ms": 0.0,           # $/kg MS; 0 = usa a diária fixa
+    "juros_sobre_custeio": 0.0,   # 1 = juros também sobre os custos já desembolsados
+}
+
+PADROES_DIARIO_RECRIA = {
+    "gmd_fim": None,              # GMD no último dia (None = gmd constante)
+    "juros_sobre_custeio": 0.0,
+}
+
+# Matrizes devolvidas (animais × dias).
+SERIES_CONFINAMENTO = (
+    "peso", "gmd", "consumo_ms", "custo_alimentar", "rendimento", "carcaca",
+    "juros_acumulado", "custo_acumulado", "receita", "lucro",
+)
+SERIES_RECRIA = (
+    "peso", "gmd", "custo_diario", "juros_acumulado", "custo_acumulado", "receita", "lucro",
+)
+
+# Elementos (animais × dias) por bloco nos resumos.
+TAMANHO_BLOCO = 1_000_000
+
+
+def _colunas(params, padroes):
+    colunas, n = colunas_parametros(params, padroes)
+    return {nome: valor[:, np.newaxis] for nome, valor in colunas.items()}, n
+
+
+def _dias_inteiros(dias_animal):
+    if np.any(dias_animal != np.rint(dias_animal)) or np.any(dias_animal < 1):
+        raise ValueError("O modelo diário exige 'dias' inteiro e maior que zero")
+    return dias_animal
+
+
+def _calendario(dias_animal, dias_max):
+    # t = 1..dias_max; ativo = dia dentro do período de cada animal
+    t = np.arange(1, dias_max + 1, dtype=np.float64)[np.newaxis, :]
+    ativo = t <= dias_animal
+    return t, ativo
+
+
+def _gmd_diario(gmd_ini, gmd_fim, t, dias_animal, ativo):
+    # interpolação linear do GMD entre o primeiro e o último dia
+    fracao = np.clip(dividir(t - 1, dias_animal - 1), 0.0, 1.0)
+    return np.where(ativo, gmd_ini + (gmd_fim - gmd_ini) * fracao, 0.0)
+
+
+def _juros_acumulados(capital_fixo, custeio_acumulado, taxa_dia, sobre_custeio, ativo):
+    # juros simples diários sobre a compra e, opcionalmente, sobre o custeio do dia anterior
+    custeio_anterior = np.concatenate(
+        [np.zeros((custeio_acumulado.shape[0], 1)), custeio_acumulado[:, :-1]], axis=1
+    )
+    juros_dia = np.where(ativo, (capital_fixo + sobre_custeio * custeio_anterior) * taxa_dia, 0.0)
+    return np.cumsum(juros_dia, axis=1)
+
+
+def confinamento_diario(params, dias_max=None):
+    """Séries diárias do confinamento (dict de matrizes animais × dias).
+
+    ``params`` traz os campos de ``PADROES_CONFINAMENTO`` e
+    ``PADROES_DIARIO_CONFINAMENTO`` (escalares ou um valor por animal); dias
+    além do período de cada animal repetem o último valor.
+    """
+    p, n = _colunas(params, {**PADROES_CONFINAMENTO, **PADROES_DIARIO_CONFINAMENTO})
+    dias_animal = _dias_inteiros(p["dias"])
+    if dias_max is None:
+        dias_max = int(dias_animal.max())
+    t, ativo = _calendario(dias_animal, dias_max)
+
+    gmd = _gmd_diario(p["ganho_dia"], p.get("ganho_dia_fim", p["ganho_dia"]), t, dias_animal, ativo)
+    peso = p["peso_inicial"] + np.cumsum(gmd, axis=1)
+
+    # consumo pelo peso médio do dia
+    consumo_ms = np.where(ativo, p["consumo_pv"] * (peso - gmd / 2), 0.0)
+    custo_alimentar = np.where(
+        ativo, np.where(p["custo_kg_ms"] > 0, consumo_ms * p["custo_kg_ms"], p["diaria"]), 0.0
+    )
+    custeio_acumulado = np.cumsum(custo_alimentar + np.where(ativo, p["servicos_operacionais"], 0.0), axis=1)
+
+    rendimento = p["rendimento_ini"] + (p["rendimento_fim"] - p["rendimento_ini"]) * np.clip(
+        dividir(np.minimum(t, dias_animal), dias_animal), 0.0, 1.0
+    )
+    carcaca = peso * rendimento
+
+    valor_compra = p["peso_inicial"] * p["preco_compra_kg"]
+    juros_acumulado = _juros_acumulados(
+        valor_compra, custeio_acumulado, p["juros_mes"] / 30, p["juros_sobre_custeio"], ativo
+    )
+    custo_acumulado = valor_compra + custeio_acumulado + p["custos_extras"] + juros_acumulado
+
+    receita = carcaca * p["preco_venda_kg"]
+    lucro = receita - custo_acumulado
+
+    series = (peso, gmd, consumo_ms, custo_alimentar, rendimento, carcaca,
+              juros_acumulado, custo_acumulado, receita, lucro)
+    return {nome: np.broadcast_to(serie, (n, dias_max)) for nome, serie in zip(SERIES_CONFINAMENTO, series)}
+
+
+def recria_diaria(params, dias_max=None):
+    """Séries diárias da recria (dict de matrizes animais × dias).
+
+    ``params`` traz os campos de ``PADROES_RECRIA`` e ``PADROES_DIARIO_RECRIA``;
+    custos mensais viram diários (÷ 30,5) e juros anuais ÷ 365.
+    """
+    p, n = _colunas(params, {**PADROES_RECRIA, **PADROES_DIARIO_RECRIA})
+    dias_animal = _dias_inteiros(p["dias"])
+    if dias_max is None:
+        dias_max = int(dias_animal.max())
+    t, ativo = _calendario(dias_animal, dias_max)
+
+    gmd = _gmd_diario(p["gmd"], p.get("gmd_fim", p["gmd"]), t, dias_animal, ativo)
+    peso = p["peso_inicial"] + np.cumsum(gmd, axis=1)
+
+    custo_mensal = p["custo_aluguel"] + p["custo_nutricional"] + p["custo_operacional"]
+    custo_diario = np.where(ativo, custo_mensal / 30.5, 0.0)
+    custeio_acumulado = np.cumsum(custo_diario, axis=1)
+
+    valor_compra = dividir(p["peso_inicial"] * p["preco_compra_pyg"], p["cambio"])
+    juros_acumulado = _juros_acumulados(
+        valor_compra, custeio_acumulado, p["juros_anual"] / 365, p["juros_sobre_custeio"], ativo
+    )
+    custo_acumulado = valor_compra + custeio_acumulado + p["frete"] + p["comissao"] + juros_acumulado
+
+    receita = peso * p["preco_venda_kg"]
+    lucro = receita - custo_acumulado
+
+    series = (peso, gmd, custo_diario, juros_acumulado, custo_acumulado, receita, lucro)
+    return {nome: np.broadcast_to(serie, (n, dias_max)) for nome, serie in zip(SERIES_RECRIA, series)}
+
+
+def _resumir(simular, params, padroes, tamanho_bloco):
+    p, n = _colunas(params, padroes)
+    dias_animal = _dias_inteiros(p["dias"][:, 0]).astype(np.int64)
+    dias_max = int(dias_animal.max())
+    passo = max(1, tamanho_bloco // dias_max)
+
+    finais = None
+    rebanho = None
+    for inicio in range(0, n, passo):
+        fim = min(n, inicio + passo)
+        series = simular({nome: valor[inicio:fim, 0] for nome, valor in p.items()}, dias_max)
+        ultimo = dias_animal[inicio:fim] - 1
+        linhas = np.arange(fim - inicio)
+        # totais do rebanho só com animais ainda no período
+        ativos = np.arange(dias_max) <= ultimo[:, np.newaxis]
+        if finais is None:
+            finais = {nome: np.empty(n) for nome in series}
+            rebanho = {nome: np.zeros(dias_max) for nome in series}
+        for nome, serie in series.items():
+            finais[nome][inicio:fim] = serie[linhas, ultimo]
+            rebanho[nome] += np.sum(serie, axis=0, where=ativos)
+
+    contagem = np.bincount(dias_animal, minlength=dias_max + 1)
+    rebanho["animais"] = contagem[::-1].cumsum()[::-1][1:]
+    return {"final": finais, "rebanho": rebanho}
+
+
+def resumo_confinamento_diario(params, tamanho_bloco=TAMANHO_BLOCO):
+    """Resultado final por animal e totais diários do lote, em blocos.
+
+    Devolve ``{"final": {serie: array por animal}, "rebanho": {serie: array
+    por dia, somado sobre os animais ativos; "animais": cabeças ativas}}``.
+    """
+    return _resumir(confinamento_diario, params,
+                    {**PADROES_CONFINAMENTO, **PADROES_DIARIO_CONFINAMENTO}, tamanho_bloco)
+
+
+def resumo_recria_diaria(params, tamanho_bloco=TAMANHO_BLOCO):
+    """Equivalente de ``resumo_confinamento_diario`` para a recria."""
+    return _resumir(recria_diaria, params,
+                    {**PADROES_RECRIA, **PADROES_DIARIO_RECRIA}, tamanho_bloco)
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+"""Camada de câmbio (USD, PYG, BRL) com tabelas históricas/futuras em cache.
+
+A tabela é um CSV com a coluna ``data`` (AAAA-MM-DD) e uma coluna por moeda
+com as unidades da moeda por 1 US$ (``PYG``, ``BRL``; ``USD`` é opcional),
+misturando cotações históricas e curvas futuras (forward)::
+
+    data,PYG,BRL
+    2025-01-02,7810,6.18
+    2026-06-30,7450,5.60
+
+Na primeira leitura o CSV é convertido num ``.npy`` ao lado do arquivo
+(refeito quando o CSV muda, gravado num temporário e trocado com
+``os.replace``) e aberto com ``mmap_mode="r"``; se a pasta não aceita
+escrita, o ``.npy`` vai para a pasta temporária do sistema e, sem ela, a
+tabela fica só em memória. A tabela fica em cache no processo. Entre datas da tabela a taxa é interpolada linearmente e,
+fora dela, mantém o valor da ponta.
+
+``reprecificar_recria`` / ``reprecificar_confinamento`` avaliam um lote de
+cenários (n) em várias datas (m) de uma vez e devolvem matrizes n × m com os
+valores monetários (indicadores e preços/custos de entrada) na moeda pedida.
+"""
+import csv
+import functools
+import hashlib
+import os
+import tempfile
+
+import numpy as np
+
+from confinamento_engine import PADROES_CONFINAMENTO, calcular_confinamento
+from etapas import colunas_parametros
+from recria_engine import PADROES_RECRIA, evaluate_recria
+
+
+MOEDAS = ("USD", "PYG", "BRL")
+MOEDA_BASE = "USD"
+
+# Indicadores em dinheiro (os demais são pesos, dias ou percentuais).
+MONETARIOS_RECRIA = (
+    "valor_compra_usd", "preco_compra_usd_kg", "custo_mensal", "custo_total_periodo",
+    "custo_total", "receita", "juros_valor", "lucro",
+)
+MONETARIOS_CONFINAMENTO = (
+    "valor_compra", "custo_nutricional", "custo_servicos", "despesas_totais",
+    "juros", "custo_total", "receita", "lucro",
+)
+
+# Entradas em dinheiro convertidas junto com os indicadores (o preço de compra
+# da recria segue em ₲, como diz o nome).
+ENTRADAS_MONETARIAS_RECRIA = (
+    "custo_aluguel", "custo_nutricional", "custo_operacional", "frete", "comissao", "preco_venda_kg",
+)
+ENTRADAS_MONETARIAS_CONFINAMENTO = (
+    "preco_compra_kg", "preco_venda_kg", "diaria", "servicos_operacionais", "custos_extras",
+)
+
+# Indicadores da recria com "usd" no nome: reprecificados, saem na moeda pedida.
+NOMES_SEM_MOEDA_RECRIA = {
+    "valor_compra_usd": "valor_compra",
+    "preco_compra_usd_kg": "preco_compra_kg",
+}
+
+ARQUIVO_TABELA = os.environ.get("SIMULADOR_TABELA_CAMBIO")
+
+
+def _validar_moeda(moeda):
+    if moeda not in MOEDAS:
+        raise ValueError(f"Moeda inválida: {moeda!r} (use {', '.join(MOEDAS)})")
+
+
+# ==============================
+# TABELA DE CÂMBIO
+# ==============================
+def caminho_cache(caminho):
+    return f"{caminho}.npy"
+
+
+def caminho_cache_temporario(caminho):
+    # alternativa quando a pasta do CSV não aceita escrita
+    nome = hashlib.sha1(os.path.abspath(caminho).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(tempfile.gettempdir(), f"simulador-cambio-{nome}.npy")
+
+
+def _ler_csv(caminho):
+    with open(caminho, newline="", encoding="utf-8") as arquivo:
+        linhas = list(csv.DictReader(arquivo))
+    if not linhas or "data" not in linhas[0]:
+        raise ValueError(f"Tabela de câmbio sem a coluna 'data': {caminho}")
+
+    tabela = np.empty(len(linhas), dtype=[("data", "M8[D]")] + [(moeda, np.float64) for moeda in MOEDAS])
+    tabela["data"] = [linha["data"] for linha in linhas]
+    for moeda in MOEDAS:
+        if moeda == MOEDA_BASE:
+            tabela[moeda] = 1.0
+        elif moeda in linhas[0]:
+            tabela[moeda] = [float(linha[moeda]) if linha[moeda] not in (None, "") else np.nan for linha in linhas]
+        else:
+            tabela[moeda] = np.nan
+    tabela.sort(order="data")
+    return tabela
+
+
+def _gravar(tabela, destino):
+    # grava ao lado e troca de uma vez: outro processo nunca mapeia um .npy pela metade
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    try:
+        with open(temporario, "wb") as arquivo:
+            np.save(arquivo, tabela)
+        os.replace(temporario, destino)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+
+
+def converter_csv(caminho, destino=None):
+    """Converte o CSV de câmbio num ``.npy`` estruturado, ordenado por data."""
+    destino = destino or caminho_cache(caminho)
+    _gravar(_ler_csv(caminho), destino)
+    return destino
+
+
+@functools.lru_cache(maxsize=8)
+def _tabela(caminho, modificado):
+    tabela = None
+    for cache in (caminho_cache(caminho), caminho_cache_temporario(caminho)):
+        if os.path.exists(cache) and os.path.getmtime(cache) >= modificado:
+            return np.load(cache, mmap_mode="r")
+        if tabela is None:
+            tabela = _ler_csv(caminho)
+        try:
+            _gravar(tabela, cache)
+        except OSError:
+            continue
+        return np.load(cache, mmap_mode="r")
+    # nenhuma das pastas aceita escrita: a tabela fica só em memória
+    return tabela
+
+
+def carregar_tabela(caminho=None):
+    """Tabela de câmbio (array estruturado em memória mapeada), lida uma vez por versão do arquivo."""
+    caminho = caminho or ARQUIVO_TABELA
+    if not caminho:
+        raise ValueError("Informe a tabela de câmbio (ou defina SIMULADOR_TABELA_CAMBIO)")
+    caminho = os.path.abspath(caminho)
+    return _tabela(caminho, os.path.getmtime(caminho))
+
+
+def taxa(tabela, moeda, datas):
+    """Unidades de ``moeda`` por 1 US$ em cada data (array com o formato de ``datas``)."""
+    _validar_moeda(moeda)
+    datas = np.asarray(datas, dtype="datetime64[D]")
+    if moeda == MOEDA_BASE:
+        return np.ones(datas.shape)
+    valida = ~np.isnan(tabela[moeda])
+    if not valida.any():
+        raise ValueError(f"Tabela de câmbio sem cotações de {moeda}")
+    return np.interp(
+        datas.astype(np.int64),
+        tabela["data"][valida].astype(np.int64),
+        tabela[moeda][valida],
+    )
+
+
+def converter(valores, de, para, datas, tabela):
+    """Converte ``valores`` de uma moeda para outra nas ``datas`` (com broadcasting)."""
+    if de == para:
+        return np.asarray(valores, dtype=np.float64) * np.ones(np.shape(datas))
+    return np.asarray(valores, dtype=np.float64) * (taxa(tabela, para, datas) / taxa(tabela, de, datas))
+
+
+# ==============================
+# REPRECIFICAÇÃO DE LOTES
+# ==============================
+def _cenarios(params, padroes):
+    # cenários nas linhas, datas nas colunas
+    colunas, _ = colunas_parametros(params, padroes)
+    return {nome: valor[:, np.newaxis] for nome, valor in colunas.items()}
+
+
+def reprecificar_recria(params, datas, moeda="USD", tabela=None):
+    """Recria de cada cenário em cada data, com o câmbio ₲/US$ da tabela.
+
+    O preço de compra segue em ₲ e os custos/venda em US$, como na aba; o
+    ``cambio`` dos ``params`` é substituído pela cotação PYG da data e os
+    indicadores monetários e as entradas em US$ saem convertidos para
+    ``moeda`` na mesma data. Devolve ``{indicador: array n × m}`` com
+    ``cambio`` e as entradas de ``ENTRADAS_MONETARIAS_RECRIA`` incluídos;
+    os indicadores de ``NOMES_SEM_MOEDA_RECRIA`` perdem o "usd" do nome.
+    """
+    _validar_moeda(moeda)
+    tabela = carregar_tabela() if tabela is None else tabela
+    datas = np.atleast_1d(np.asarray(datas, dtype="datetime64[D]"))
+
+    colunas = _cenarios(params, PADROES_RECRIA)
+    colunas["cambio"] = taxa(tabela, "PYG", datas)[np.newaxis, :]
+    resultado = evaluate_recria(**colunas)
+
+    forma = np.broadcast_shapes(*(valor.shape for valor in resultado.values()), colunas["cambio"].shape)
+    fator = taxa(tabela, moeda, datas)[np.newaxis, :]
+    resultado = {nome: np.broadcast_to(valor, forma) for nome, valor in resultado.items()}
+    for nome in MONETARIOS_RECRIA:
+        resultado[nome] = resultado[nome] * fator
+    for nome in ENTRADAS_MONETARIAS_RECRIA:
+        resultado[nome] = np.broadcast_to(colunas[nome] * fator, forma)
+    resultado["cambio"] = np.broadcast_to(colunas["cambio"], forma)
+    return {NOMES_SEM_MOEDA_RECRIA.get(nome, nome): valor for nome, valor in resultado.items()}
+
+
+def reprecificar_confinamento(params, datas, moeda="USD", moeda_entrada="USD", tabela=None):
+    """Confinamento de cada cenário em cada data, convertido de ``moeda_entrada`` para ``moeda``.
+
+    Como todos os preços do confinamento estão numa mesma moeda, o resultado
+    monetário é proporcional ao câmbio: o motor roda uma vez por cenário e só
+    o fator de conversão varia por data. Devolve ``{indicador: array n × m}``
+    com as entradas de ``ENTRADAS_MONETARIAS_CONFINAMENTO`` também convertidas.
+    """
+    _validar_moeda(moeda)
+    _validar_moeda(moeda_entrada)
+    tabela = carregar_tabela() if tabela is None else tabela
+    datas = np.atleast_1d(np.asarray(datas, dtype="datetime64[D]"))
+
+    colunas = _cenarios(params, PADROES_CONFINAMENTO)
+    resultado = calcular_confinamento(**colunas)
+    fator = converter(1.0, moeda_entrada, moeda, datas, tabela)[np.newaxis, :]
+
+    forma = np.broadcast_shapes(*(np.shape(valor) for valor in resultado.values()), fator.shape)
+    resultado = {nome: np.broadcast_to(valor, forma) for nome, valor in resultado.items()}
+    for nome in MONETARIOS_CONFINAMENTO:
+        resultado[nome] = resultado[nome] * fator
+    for nome in ENTRADAS_MONETARIAS_CONFINAMENTO:
+        resultado[nome] = np.broadcast_to(colunas[nome] * fator, forma)
+    return resultado
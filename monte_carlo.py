@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""Simulação de Monte Carlo do lucro da recria, do confinamento e do ciclo.
+
+Qualquer parâmetro dos motores pode receber uma distribuição; os sorteios são
+feitos em blocos vetorizados (memória limitada) com semente fixa, e o lucro de
+todos os sorteios é guardado para percentis exatos.
+
+Distribuições são dicts, por exemplo::
+
+    {"tipo": "normal", "media": 0.49, "desvio": 0.05}
+    {"tipo": "triangular", "minimo": 2.1, "moda": 2.4, "maximo": 2.6}
+    {"tipo": "uniforme", "minimo": 7100, "maximo": 7500}
+
+No ciclo, parâmetros do confinamento levam o prefixo ``conf_``.
+"""
+import numpy as np
+
+from confinamento_engine import PADROES_CONFINAMENTO, calcular_confinamento
+from pipeline import PREFIXO_CONFINAMENTO, encadear
+from recria_engine import PADROES_RECRIA, evaluate_recria
+
+
+MODOS = ("recria", "confinamento", "ciclo")
+
+TAMANHO_BLOCO = 250_000
+
+BARRAS_HISTOGRAMA = 60
+
+
+def distribuicoes_padrao(modo, base_recria=None, base_confinamento=None, variacao=0.10):
+    """Distribuições normais com desvio ``variacao`` (fração) em torno dos valores base.
+
+    Cobre GMD, preço de venda, câmbio e custo de alimentação (custo nutrição
+    na recria, diária no confinamento).
+    """
+    base_recria = {**PADROES_RECRIA, **(base_recria or {})}
+    base_confinamento = {**PADROES_CONFINAMENTO, **(base_confinamento or {})}
+
+    def normal(valor):
+        return {"tipo": "normal", "media": float(valor), "desvio": abs(float(valor)) * variacao}
+
+    recria = {campo: normal(base_recria[campo])
+              for campo in ("gmd", "preco_venda_kg", "cambio", "custo_nutricional")}
+    confinamento = {campo: normal(base_confinamento[campo])
+                    for campo in ("ganho_dia", "preco_venda_kg", "diaria")}
+
+    if modo == "recria":
+        return recria
+    if modo == "confinamento":
+        return confinamento
+    return {**recria, **{PREFIXO_CONFINAMENTO + campo: dist for campo, dist in confinamento.items()}}
+
+
+def amostrar(rng, distribuicao, n):
+    """Sorteia ``n`` valores de uma distribuição (valores negativos são cortados em 0)."""
+    tipo = distribuicao["tipo"]
+    if tipo == "normal":
+        valores = rng.normal(distribuicao["media"], distribuicao["desvio"], n)
+    elif tipo == "triangular":
+        valores = rng.triangular(distribuicao["minimo"], distribuicao["moda"], distribuicao["maximo"], n)
+    elif tipo == "uniforme":
+        valores = rng.uniform(distribuicao["minimo"], distribuicao["maximo"], n)
+    elif tipo == "fixo":
+        valores = np.full(n, float(distribuicao["valor"]))
+    else:
+        raise ValueError(f"Distribuição desconhecida: {tipo!r}")
+    return np.maximum(valores, 0.0)
+
+
+def parametros_sorteaveis(modo):
+    """Nomes que aceitam distribuição em cada modo.
+
+    No ciclo, ``conf_peso_inicial`` e ``conf_preco_compra_kg`` ficam de fora:
+    vêm da saída da recria.
+    """
+    if modo == "recria":
+        return set(PADROES_RECRIA)
+    if modo == "confinamento":
+        return set(PADROES_CONFINAMENTO)
+    encadeados = {"peso_inicial", "preco_compra_kg"}
+    return set(PADROES_RECRIA) | {PREFIXO_CONFINAMENTO + campo for campo in PADROES_CONFINAMENTO
+                                  if campo not in encadeados}
+
+
+def lucro_bloco(modo, base_recria, base_confinamento, sorteios):
+    """Lucro de um bloco de sorteios ``{parametro: np.ndarray}``."""
+    if modo == "confinamento":
+        params = {**base_confinamento, **sorteios}
+        return calcular_confinamento(**params)["lucro"]
+
+    params_recria = {**base_recria, **{k: v for k, v in sorteios.items() if k in PADROES_RECRIA}}
+    if modo == "recria":
+        return evaluate_recria(**params_recria)["lucro"]
+
+    params_conf = {
+        **base_confinamento,
+        **{k[len(PREFIXO_CONFINAMENTO):]: v for k, v in sorteios.items()
+           if k.startswith(PREFIXO_CONFINAMENTO)},
+    }
+    recria, confinamento, _ = encadear(params_recria, params_conf)
+    return recria["lucro"] + confinamento["lucro"]
+
+
+def simular_risco(
+    modo="ciclo",
+    base_recria=None,
+    base_confinamento=None,
+    distribuicoes=None,
+    n=1_000_000,
+    semente=42,
+    tamanho_bloco=TAMANHO_BLOCO,
+    nivel=0.95,
+    progresso=None,
+    manter_lucros=True,
+):
+    """Roda ``n`` sorteios e resume a distribuição do lucro.
+
+    Devolve um dict com ``lucros`` (array com todos os sorteios; omitido com
+    ``manter_lucros=False``), ``histograma`` (contagens e limites em
+    ``BARRAS_HISTOGRAMA`` faixas), ``media``, ``p5``, ``p50``, ``p95``,
+    ``prob_prejuizo`` (fração) e ``var``: a perda no percentil ``1 - nivel``
+    (0 quando esse percentil ainda é lucro).
+    ``progresso``, se informado, é chamado como ``progresso(feitos, n)`` a cada bloco.
+    """
+    if modo not in MODOS:
+        raise ValueError(f"Modo inválido: {modo!r} (use {', '.join(MODOS)})")
+    base_recria = {**PADROES_RECRIA, **(base_recria or {})}
+    base_confinamento = {**PADROES_CONFINAMENTO, **(base_confinamento or {})}
+    if distribuicoes is None:
+        distribuicoes = distribuicoes_padrao(modo, base_recria, base_confinamento)
+    desconhecidos = sorted(set(distribuicoes) - parametros_sorteaveis(modo))
+    if desconhecidos:
+        raise ValueError(f"Parâmetro inválido no modo {modo!r}: {desconhecidos[0]!r}")
+
+    rng = np.random.default_rng(semente)
+    lucros = np.empty(n, dtype=np.float64)
+    for inicio in range(0, n, tamanho_bloco):
+        tamanho = min(tamanho_bloco, n - inicio)
+        sorteios = {campo: amostrar(rng, dist, tamanho) for campo, dist in distribuicoes.items()}
+        lucros[inicio:inicio + tamanho] = lucro_bloco(modo, base_recria, base_confinamento, sorteios)
+        if progresso is not None:
+            progresso(inicio + tamanho, n)
+
+    p_cauda, p5, p50, p95 = np.percentile(lucros, [(1 - nivel) * 100, 5, 50, 95])
+    resumo = {
+        "histograma": np.histogram(lucros, bins=BARRAS_HISTOGRAMA),
+        "media": float(lucros.mean()),
+        "p5": float(p5),
+        "p50": float(p50),
+        "p95": float(p95),
+        "prob_prejuizo": float(np.count_nonzero(lucros < 0) / n),
+        "var": float(max(0.0, -p_cauda)),
+        "nivel": nivel,
+    }
+    if manter_lucros:
+        resumo["lucros"] = lucros
+    return resumo
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""Encadeamento vetorizado recria → confinamento.
+
+Reproduz o link entre as abas (peso final da recria → peso inicial do
+confinamento, preço de venda da recria → preço de compra) para arrays inteiros
+de cenários, e avalia o ciclo completo sobre grades de dias.
+"""
+import numpy as np
+
+from confinamento_engine import PADROES_CONFINAMENTO, calcular_confinamento
+from recria_engine import PADROES_RECRIA, dividir, evaluate_recria
+
+
+PREFIXO_CONFINAMENTO = "conf_"
+
+INDICADORES_CICLO = (
+    "dias_ciclo",
+    "custo_ciclo",
+    "lucro_ciclo",
+    "lucro_ciclo_mensal",
+    "roi_ciclo",
+    "roi_ciclo_mensal",
+)
+
+CRITERIOS_CICLO = ("lucro_ciclo", "lucro_ciclo_mensal", "roi_ciclo", "roi_ciclo_mensal")
+
+
+def encadear(params_recria, params_confinamento):
+    """Roda a recria e alimenta o confinamento com a sua saída.
+
+    Os parâmetros (escalares ou arrays, com broadcasting entre as duas etapas)
+    são completados com os padrões das abas. Devolve ``(recria, confinamento,
+    params_confinamento)``, com os indicadores de cada etapa e os parâmetros
+    efetivamente usados no confinamento.
+    """
+    params_recria = {**PADROES_RECRIA, **params_recria}
+    recria = evaluate_recria(**params_recria)
+
+    params_confinamento = {
+        **PADROES_CONFINAMENTO,
+        **params_confinamento,
+        "peso_inicial": recria["peso_final"],
+        "preco_compra_kg": np.asarray(params_recria["preco_venda_kg"], dtype=np.float64),
+    }
+    confinamento = calcular_confinamento(**params_confinamento)
+    return recria, confinamento, params_confinamento
+
+
+def evaluate_ciclo(params_recria, params_confinamento):
+    """Indicadores do ciclo completo recria + confinamento.
+
+    O valor de compra do confinamento é a própria receita da recria, então o
+    custo do ciclo soma só o que sai do caixa: custo total e juros da recria
+    mais despesas e juros do confinamento. Devolve um dict com os indicadores
+    da recria, os do confinamento prefixados por ``conf_`` e os de
+    ``INDICADORES_CICLO``.
+    """
+    params_recria = {**PADROES_RECRIA, **params_recria}
+    recria, confinamento, params_conf = encadear(params_recria, params_confinamento)
+
+    dias_ciclo = np.add(params_recria["dias"], params_conf["dias"], dtype=np.float64)
+    custo_ciclo = (recria["custo_total"] + recria["juros_valor"]
+                   + confinamento["despesas_totais"] + confinamento["juros"])
+    lucro_ciclo = recria["lucro"] + confinamento["lucro"]
+    meses_ciclo = dias_ciclo / 30.5
+
+    roi_ciclo = dividir(lucro_ciclo, custo_ciclo) * 100
+    ciclo = {
+        "dias_ciclo": dias_ciclo,
+        "custo_ciclo": custo_ciclo,
+        "lucro_ciclo": lucro_ciclo,
+        "lucro_ciclo_mensal": dividir(lucro_ciclo, meses_ciclo),
+        "roi_ciclo": roi_ciclo,
+        "roi_ciclo_mensal": dividir(roi_ciclo, meses_ciclo),
+    }
+
+    resultado = {
+        **recria,
+        **{PREFIXO_CONFINAMENTO + nome: valor for nome, valor in confinamento.items()},
+        **ciclo,
+    }
+    nomes = list(resultado)
+    return dict(zip(nomes, np.broadcast_arrays(*(resultado[nome] for nome in nomes))))
+
+
+def otimizar_ciclo(base_recria, base_confinamento, dias_recria, dias_confinamento,
+                   criterio="roi_ciclo_mensal"):
+    """Melhor combinação de dias de recria × dias de confinamento.
+
+    Avalia a grade ``len(dias_recria) × len(dias_confinamento)`` numa única
+    passada e devolve um dict com a grade do ``criterio`` (``valores``), os
+    índices/dias ótimos e todos os indicadores do ciclo no ponto ótimo.
+    """
+    if criterio not in CRITERIOS_CICLO:
+        raise ValueError(f"Critério inválido: {criterio!r} (use {', '.join(CRITERIOS_CICLO)})")
+    dias_recria = np.asarray(dias_recria, dtype=np.float64)
+    dias_confinamento = np.asarray(dias_confinamento, dtype=np.float64)
+
+    resultado = evaluate_ciclo(
+        {**base_recria, "dias": dias_recria[:, np.newaxis]},
+        {**base_confinamento, "dias": dias_confinamento[np.newaxis, :]},
+    )
+    valores = resultado[criterio]
+    i, j = np.unravel_index(np.argmax(valores), valores.shape)
+    return {
+        "criterio": criterio,
+        "valores": valores,
+        "dias_recria": float(dias_recria[i]),
+        "dias_confinamento": float(dias_confinamento[j]),
+        "indice": (int(i), int(j)),
+        "otimo": {nome: float(valor[i, j]) for nome, valor in resultado.items()},
+    }
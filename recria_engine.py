@@ -0,0 +1,255 @@
+# -*- coding: utf-8 -*-
+"""Motor de cálculo da Recria a Pasto (NumPy puro, sem Streamlit).
+
+Todas as entradas aceitam escalares ou arrays; os arrays são combinados por
+broadcasting e cada indicador é devolvido como ``np.ndarray`` no formato
+resultante, permitindo avaliar milhares de lotes numa única chamada.
+"""
+import functools
+
+import numpy as np
+
+
+# Parâmetros de entrada de evaluate_recria, na ordem posicional.
+PARAMS_RECRIA = (
+    "peso_inicial",
+    "preco_compra_pyg",
+    "cambio",
+    "dias",
+    "gmd",
+    "custo_aluguel",
+    "custo_nutricional",
+    "custo_operacional",
+    "frete",
+    "comissao",
+    "juros_anual",
+    "preco_venda_kg",
+)
+
+# Valores padrão dos campos da aba Recria (juros_anual em fração).
+PADROES_RECRIA = {
+    "peso_inicial": 175.0,
+    "preco_compra_pyg": 20000.0,
+    "cambio": 7320.0,
+    "dias": 365,
+    "gmd": 0.49,
+    "custo_aluguel": 5.40,
+    "custo_nutricional": 4.0,
+    "custo_operacional": 3.44,
+    "frete": 8.0,
+    "comissao": 4.0,
+    "juros_anual": 0.085,
+    "preco_venda_kg": 2.40,
+}
+
+# Indicadores devolvidos por evaluate_recria, na ordem de exibição.
+INDICADORES_RECRIA = (
+    "valor_compra_usd",
+    "preco_compra_usd_kg",
+    "agio",
+    "peso_final",
+    "gpv",
+    "meses",
+    "custo_mensal",
+    "custo_total_periodo",
+    "custo_total",
+    "receita",
+    "juros_valor",
+    "lucro",
+    "margem_periodo",
+    "margem_mensal",
+    "roi",
+    "roi_mensal",
+    "roi_custo",
+    "roi_custo_mensal",
+)
+
+
+def dividir(numerador, denominador):
+    """Divisão elemento a elemento que devolve 0 onde ``denominador <= 0``.
+
+    Equivale vetorialmente ao padrão ``a / b if b > 0 else 0`` dos simuladores.
+    """
+    numerador, denominador = np.broadcast_arrays(
+        np.asarray(numerador, dtype=np.float64),
+        np.asarray(denominador, dtype=np.float64),
+    )
+    resultado = np.zeros(numerador.shape, dtype=np.float64)
+    np.divide(numerador, denominador, out=resultado, where=denominador > 0)
+    return resultado
+
+
+def evaluate_recria(
+    peso_inicial,
+    preco_compra_pyg,
+    cambio,
+    dias,
+    gmd,
+    custo_aluguel,
+    custo_nutricional,
+    custo_operacional,
+    frete,
+    comissao,
+    juros_anual,
+    preco_venda_kg,
+):
+    """Calcula todos os indicadores da recria de uma vez.
+
+    ``juros_anual`` é a taxa em fração (0.085 = 8,5% a.a.). Devolve um dict
+    ``{indicador: np.ndarray}`` com as chaves de ``INDICADORES_RECRIA``.
+    """
+    peso_inicial = np.asarray(peso_inicial, dtype=np.float64)
+    preco_compra_pyg = np.asarray(preco_compra_pyg, dtype=np.float64)
+    dias = np.asarray(dias, dtype=np.float64)
+    gmd = np.asarray(gmd, dtype=np.float64)
+    juros_anual = np.asarray(juros_anual, dtype=np.float64)
+    preco_venda_kg = np.asarray(preco_venda_kg, dtype=np.float64)
+
+    valor_compra_usd = dividir(peso_inicial * preco_compra_pyg, cambio)
+    preco_compra_usd_kg = dividir(preco_compra_pyg, cambio)
+
+    agio = dividir(preco_compra_usd_kg - preco_venda_kg, preco_venda_kg) * 100
+
+    peso_final = peso_inicial + gmd * dias
+    gpv = peso_final - peso_inicial
+
+    meses = dias / 30.5
+    custo_mensal = np.asarray(custo_aluguel, dtype=np.float64) + custo_nutricional + custo_operacional
+    custo_total_periodo = custo_mensal * meses
+
+    custo_total = valor_compra_usd + custo_total_periodo + frete + comissao
+
+    receita = peso_final * preco_venda_kg
+    juros_valor = valor_compra_usd * juros_anual * (dias / 365)
+
+    lucro = receita - custo_total - juros_valor
+
+    margem_periodo = dividir(lucro, receita) * 100
+    margem_mensal = dividir(margem_periodo, meses)
+
+    roi = dividir(lucro, valor_compra_usd) * 100
+    roi_mensal = dividir(roi, meses)
+
+    roi_custo = dividir(lucro, custo_total) * 100
+    roi_custo_mensal = dividir(roi_custo, meses)
+
+    indicadores = (
+        valor_compra_usd, preco_compra_usd_kg, agio, peso_final, gpv, meses,
+        custo_mensal, custo_total_periodo, custo_total, receita, juros_valor,
+        lucro, margem_periodo, margem_mensal, roi, roi_mensal, roi_custo,
+        roi_custo_mensal,
+    )
+    return dict(zip(INDICADORES_RECRIA, np.broadcast_arrays(*indicadores)))
+
+
+def escalar(resultado):
+    """Converte um resultado de cenário único em ``{indicador: float}``."""
+    return {nome: float(valor) for nome, valor in resultado.items()}
+
+
+# ==============================
+# CACHE DE CENÁRIOS
+# ==============================
+TAMANHO_CACHE = 4096
+
+
+def chave_cenario(*valores):
+    """Tupla normalizada (floats arredondados) usada como chave de cache."""
+    return tuple(round(float(valor), 9) for valor in valores)
+
+
+def estatisticas_cache(funcao):
+    """Contadores de acerto/falha de uma função decorada com ``lru_cache``."""
+    info = funcao.cache_info()
+    return {"hits": info.hits, "misses": info.misses,
+            "entradas": info.currsize, "max_entradas": info.maxsize}
+
+
+@functools.lru_cache(maxsize=TAMANHO_CACHE)
+def _cenario_recria(chave):
+    return escalar(evaluate_recria(*chave))
+
+
+def cenario_recria(**params):
+    """Versão memoizada (LRU) de ``evaluate_recria`` para um único cenário.
+
+    Recebe os parâmetros de ``PARAMS_RECRIA`` por nome e devolve
+    ``{indicador: float}``; cenários repetidos custam uma consulta ao dict.
+    """
+    chave = chave_cenario(*(params[nome] for nome in PARAMS_RECRIA))
+    return dict(_cenario_recria(chave))
+
+
+def estatisticas_cache_recria():
+    return estatisticas_cache(_cenario_recria)
+
+
+# ==============================
+# GRADE DE SENSIBILIDADE
+# ==============================
+# Mesmos limites e passos dos sliders da Análise de Sensibilidade.
+EIXO_PRECO_COMPRA = np.linspace(15000.0, 25000.0, 101)   # ₲/kg PV, passo 100
+EIXO_PRECO_VENDA = np.linspace(1.5, 3.5, 201)            # US$/kg PV, passo 0,01
+EIXO_GMD = np.linspace(0.3, 1.5, 121)                    # kg/dia, passo 0,01
+
+
+def _custo_por_preco_compra(preco_compra_pyg, peso_inicial, cambio, dias,
+                            custo_total_periodo, frete, comissao, juros_anual):
+    valor_compra_usd = dividir(peso_inicial * np.asarray(preco_compra_pyg, dtype=np.float64), cambio)
+    juros_valor = valor_compra_usd * juros_anual * (dias / 365)
+    return valor_compra_usd + custo_total_periodo + frete + comissao + juros_valor
+
+
+def superficie_lucro(
+    peso_inicial,
+    cambio,
+    dias,
+    custo_total_periodo,
+    frete,
+    comissao,
+    juros_anual,
+    precos_compra=EIXO_PRECO_COMPRA,
+    precos_venda=EIXO_PRECO_VENDA,
+    gmds=EIXO_GMD,
+):
+    """Lucro líquido sobre a grade completa preço compra × preço venda × GMD.
+
+    Devolve ``lucro[i, j, k]`` para ``precos_compra[i]``, ``precos_venda[j]``
+    e ``gmds[k]``, com os demais parâmetros fixos (escalares).
+    """
+    custo = _custo_por_preco_compra(
+        precos_compra, peso_inicial, cambio, dias,
+        custo_total_periodo, frete, comissao, juros_anual,
+    )
+    peso_final = peso_inicial + np.asarray(gmds, dtype=np.float64) * dias
+    receita = np.multiply.outer(np.asarray(precos_venda, dtype=np.float64), peso_final)
+    return receita[np.newaxis, :, :] - custo[:, np.newaxis, np.newaxis]
+
+
+def preco_venda_equilibrio(
+    peso_inicial,
+    cambio,
+    dias,
+    custo_total_periodo,
+    frete,
+    comissao,
+    juros_anual,
+    precos_compra=EIXO_PRECO_COMPRA,
+    gmds=EIXO_GMD,
+):
+    """Preço de venda (US$/kg PV) que zera o lucro, para cada par compra × GMD.
+
+    Devolve ``preco[i, k]``; 0 onde o peso final não é positivo.
+    """
+    custo = _custo_por_preco_compra(
+        precos_compra, peso_inicial, cambio, dias,
+        custo_total_periodo, frete, comissao, juros_anual,
+    )
+    peso_final = peso_inicial + np.asarray(gmds, dtype=np.float64) * dias
+    return dividir(custo[:, np.newaxis], peso_final[np.newaxis, :])
+
+
+def indice_eixo(eixo, valor):
+    """Índice do ponto da grade mais próximo de ``valor`` (limitado ao eixo)."""
+    passo = (eixo[-1] - eixo[0]) / (len(eixo) - 1)
+    return int(np.clip(np.rint((valor - eixo[0]) / passo), 0, len(eixo) - 1))
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+"""Relatórios PDF da Recria a Pasto e do Confinamento (reportlab).
+
+Folha de estilos e estilo de tabela são montados uma única vez na importação;
+os bytes do PDF ficam em cache LRU por cenário (parâmetros + data inicial).
+"""
+import datetime
+import functools
+import io
+
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.lib.pagesizes import A4
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import cm
+
+from confinamento_engine import PARAMS_CONFINAMENTO, cenario_confinamento
+from recria_engine import PARAMS_RECRIA, cenario_recria, chave_cenario, estatisticas_cache
+
+
+ESTILOS = getSampleStyleSheet()
+ESTILOS.add(ParagraphStyle(
+    name="TituloSecao",
+    fontSize=12, leading=14,
+    textColor=colors.HexColor("#003366"),
+    spaceBefore=8, spaceAfter=8
+))
+
+ESTILO_TABELA = TableStyle([("GRID", (0, 0), (-1, -1), 0.5, colors.black)])
+
+MARGEM = 2 * cm
+LARGURA_UTIL = A4[0] - 2 * MARGEM
+COLUNAS_TABELA = [LARGURA_UTIL * 0.55, LARGURA_UTIL * 0.35]
+
+TAMANHO_CACHE_PDF = 64
+
+
+def _tabela(linhas):
+    tabela = Table(linhas, colWidths=COLUNAS_TABELA)
+    tabela.setStyle(ESTILO_TABELA)
+    return tabela
+
+
+def elementos_recria(params, data_inicial):
+    """Flowables do relatório de um cenário de recria.
+
+    ``params`` traz os campos de ``PARAMS_RECRIA`` (juros_anual em fração).
+    """
+    r = cenario_recria(**params)
+    dias = params["dias"]
+    data_final = data_inicial + datetime.timedelta(days=int(dias))
+
+    return [
+        Paragraph("Relatório de Viabilidade Econômica – Recria a Pasto", ESTILOS["Heading1"]),
+
+        Paragraph("Parâmetros de Compra", ESTILOS["TituloSecao"]),
+        _tabela([
+            ["Câmbio (₲/US$)", f"{params['cambio']:,.0f}"],
+            ["Preço bezerro (₲/kg PV)", f"{params['preco_compra_pyg']:,.0f}"],
+            ["Preço bezerro (US$/kg PV)", f"{r['preco_compra_usd_kg']:.2f}"],
+            ["Preço de venda (US$/kg PV)", f"{params['preco_venda_kg']:.2f}"],
+            ["Ágio (%)", f"{r['agio']:.2f}%"],
+        ]),
+        Spacer(1, 12),
+
+        Paragraph("Indicadores Zootécnicos", ESTILOS["TituloSecao"]),
+        _tabela([
+            ["Data inicial", data_inicial.strftime('%d/%m/%Y')],
+            ["Data final", data_final.strftime('%d/%m/%Y')],
+            ["Dias em pastejo", f"{dias:g}"],
+            ["Peso inicial (kg)", f"{params['peso_inicial']:.2f}"],
+            ["Peso final (kg)", f"{r['peso_final']:.2f}"],
+            ["GPV (kg)", f"{r['gpv']:.2f}"],
+            ["GMD (kg/dia)", f"{params['gmd']:.2f}"],
+        ]),
+        Spacer(1, 12),
+
+        Paragraph("Custos Detalhados", ESTILOS["TituloSecao"]),
+        _tabela([
+            ["Custo do animal (US$)", f"{r['valor_compra_usd']:,.2f}"],
+            ["Frete (US$)", f"{params['frete']:.2f}"],
+            ["Comissão (US$)", f"{params['comissao']:.2f}"],
+            ["Custo aluguel/mês (US$)", f"{params['custo_aluguel']:.2f}"],
+            ["Custo nutrição/mês (US$)", f"{params['custo_nutricional']:.2f}"],
+            ["Custo operações/mês (US$)", f"{params['custo_operacional']:.2f}"],
+            ["Custo total período (US$)", f"{r['custo_total_periodo']:,.2f}"],
+            ["Juros sobre compra do animal (US$)", f"{r['juros_valor']:.2f}"],
+            ["Custo total (US$)", f"{r['custo_total']:,.2f}"],
+        ]),
+        Spacer(1, 12),
+
+        Paragraph("Resultado Econômico", ESTILOS["TituloSecao"]),
+        _tabela([
+            ["Receita (US$)", f"{r['receita']:,.2f}"],
+            ["Lucro líquido (US$)", f"{r['lucro']:,.2f}"],
+            ["Margem período (%)", f"{r['margem_periodo']:.2f}%"],
+            ["Margem mensal (%)", f"{r['margem_mensal']:.2f}%"],
+            ["ROI (%)", f"{r['roi']:.2f}%"],
+            ["ROI mensal (%)", f"{r['roi_mensal']:.2f}%"],
+            ["ROI sobre custo total (%)", f"{r['roi_custo']:.2f}%"],
+            ["ROI mensal sobre custo total (%)", f"{r['roi_custo_mensal']:.2f}%"],
+        ]),
+    ]
+
+
+def elementos_confinamento(params):
+    """Flowables do relatório de um cenário de confinamento.
+
+    ``params`` traz os campos de ``PARAMS_CONFINAMENTO`` (rendimentos e juros
+    em fração).
+    """
+    r = cenario_confinamento(**params)
+
+    return [
+        Paragraph("Relatório de Viabilidade Econômica – Confinamento", ESTILOS["Heading1"]),
+
+        Paragraph("Indicadores Zootécnicos", ESTILOS["TituloSecao"]),
+        _tabela([
+            ["Peso inicial (kg)", f"{params['peso_inicial']:.2f}"],
+            ["Peso final (kg)", f"{r['peso_final']:.2f}"],
+            ["Dias de trato", f"{params['dias']:g}"],
+            ["Ganho de peso (kg)", f"{r['ganho_peso']:.2f}"],
+            ["Ganho diário (kg/dia)", f"{params['ganho_dia']:.2f}"],
+            ["Carcaça final (kg)", f"{r['carcaca_final']:.2f}"],
+            ["Carcaça/dia (kg/dia)", f"{r['carcaca_dia']:.2f}"],
+        ]),
+        Spacer(1, 12),
+
+        Paragraph("Custos", ESTILOS["TituloSecao"]),
+        _tabela([
+            ["Custo animal ($)", f"{r['valor_compra']:,.2f}"],
+            ["Custo nutricional ($)", f"{r['custo_nutricional']:,.2f}"],
+            ["Serviços ($)", f"{r['custo_servicos']:,.2f}"],
+            ["Custos extras ($)", f"{params['custos_extras']:,.2f}"],
+            ["Juros ($)", f"{r['juros']:,.2f}"],
+            ["Custo total ($)", f"{r['custo_total']:,.2f}"],
+        ]),
+        Spacer(1, 12),
+
+        Paragraph("Resultado Econômico", ESTILOS["TituloSecao"]),
+        _tabela([
+            ["Receita ($)", f"{r['receita']:,.2f}"],
+            ["Lucro ($)", f"{r['lucro']:,.2f}"],
+            ["Margem (%)", f"{r['margem_lucro']:.2f}%"],
+            ["ROI (%)", f"{r['roi']:.2f}%"],
+            ["ROI mensal (%)", f"{r['roi_mensal']:.2f}%"],
+            ["ROI custo total (%)", f"{r['roi_custo']:.2f}%"],
+            ["ROI mensal custo total (%)", f"{r['roi_custo_mensal']:.2f}%"],
+        ]),
+    ]
+
+
+def montar_pdf(elementos):
+    """Diagrama os flowables numa página A4 e devolve os bytes do PDF."""
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer,
+        pagesize=A4,
+        leftMargin=MARGEM, rightMargin=MARGEM,
+        topMargin=MARGEM, bottomMargin=MARGEM
+    )
+    doc.build(elementos)
+    return buffer.getvalue()
+
+
+@functools.lru_cache(maxsize=TAMANHO_CACHE_PDF)
+def _pdf_recria(chave, data_inicial):
+    return montar_pdf(elementos_recria(dict(zip(PARAMS_RECRIA, chave)), data_inicial))
+
+
+def pdf_recria(data_inicial=None, **params):
+    """Bytes do relatório PDF da recria, em cache por cenário e data inicial."""
+    if data_inicial is None:
+        data_inicial = datetime.date.today()
+    chave = chave_cenario(*(params[nome] for nome in PARAMS_RECRIA))
+    return _pdf_recria(chave, data_inicial)
+
+
+@functools.lru_cache(maxsize=TAMANHO_CACHE_PDF)
+def _pdf_confinamento(chave):
+    return montar_pdf(elementos_confinamento(dict(zip(PARAMS_CONFINAMENTO.names, chave))))
+
+
+def pdf_confinamento(**params):
+    """Bytes do relatório PDF do confinamento, em cache por cenário."""
+    chave = chave_cenario(*(params[nome] for nome in PARAMS_CONFINAMENTO.names))
+    return _pdf_confinamento(chave)
+
+
+def estatisticas_cache_pdf():
+    return {
+        "recria": estatisticas_cache(_pdf_recria),
+        "confinamento": estatisticas_cache(_pdf_confinamento),
+    }
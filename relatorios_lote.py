@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+"""Geração em massa de relatórios PDF (um por lote) com ProcessPoolExecutor.
+
+A diagramação do reportlab é CPU-bound e single-thread, então cada lote é
+renderizado num processo separado, que grava o PDF direto no disco.
+
+Uso:
+    python relatorios_lote.py lotes.csv relatorios/ --tipo recria
+"""
+import argparse
+import datetime
+import os
+import re
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+from confinamento_engine import PADROES_CONFINAMENTO
+from lotes import ler_datas, ler_tabela, nomes_lotes, preparar_parametros
+from recria_engine import PADROES_RECRIA
+from relatorio_pdf import pdf_confinamento, pdf_recria
+
+
+PADROES = {
+    "recria": PADROES_RECRIA,
+    "confinamento": PADROES_CONFINAMENTO,
+}
+
+
+def _nome_arquivo(tipo, lote):
+    return f"{tipo}_{re.sub(r'[^0-9A-Za-z_.-]+', '_', lote)}.pdf"
+
+
+def _nomes_arquivos(tipo, lotes):
+    # lotes repetidos ou que viram o mesmo nome ("A/1" e "A 1") levam o número
+    # da linha, senão dois processos gravariam o mesmo arquivo
+    nomes = [_nome_arquivo(tipo, lote) for lote in lotes]
+    contagem = Counter(nomes)
+    nomes = [
+        f"{nome[:-len('.pdf')]}_linha{i + 1}.pdf" if contagem[nome] > 1 else nome
+        for i, nome in enumerate(nomes)
+    ]
+    if len(set(nomes)) < len(nomes):
+        raise ValueError("Nomes de lote geram arquivos PDF repetidos; ajuste a coluna 'lote'")
+    return nomes
+
+
+def _renderizar_lote(tipo, params, data_inicial, caminho):
+    if tipo == "recria":
+        dados = pdf_recria(data_inicial=data_inicial, **params)
+    else:
+        dados = pdf_confinamento(**params)
+    with open(caminho, "wb") as arquivo:
+        arquivo.write(dados)
+    return caminho
+
+
+def _datas_iniciais(tabela):
+    if "data_inicial" not in tabela.columns:
+        return [datetime.date.today()] * len(tabela)
+    datas = ler_datas(tabela["data_inicial"]).dt.date
+    return [d if not pd.isna(d) else datetime.date.today() for d in datas]
+
+
+def gerar_relatorios(tabela, pasta_saida, tipo="recria", max_workers=None, progresso=None):
+    """Renderiza um PDF por linha de ``tabela`` em ``pasta_saida``.
+
+    ``tabela`` é um DataFrame (ou caminho CSV/Parquet) com as colunas do motor
+    escolhido em ``tipo``; a coluna opcional ``lote`` nomeia os arquivos e,
+    na recria, ``data_inicial`` define a data do relatório. ``progresso`` é
+    chamado como ``progresso(concluidos, total, caminho)`` a cada PDF gravado.
+    Devolve a lista de caminhos na ordem das linhas.
+    """
+    if tipo not in PADROES:
+        raise ValueError(f"Tipo de relatório inválido: {tipo!r} (use 'recria' ou 'confinamento')")
+    if not isinstance(tabela, pd.DataFrame):
+        tabela = ler_tabela(tabela)
+
+    os.makedirs(pasta_saida, exist_ok=True)
+    colunas = preparar_parametros(tabela, PADROES[tipo])
+    lotes = nomes_lotes(tabela)
+    datas = _datas_iniciais(tabela)
+    total = len(tabela)
+
+    caminhos = [os.path.join(pasta_saida, nome) for nome in _nomes_arquivos(tipo, lotes)]
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futuros = {
+            executor.submit(
+                _renderizar_lote,
+                tipo,
+                {campo: float(valores[i]) for campo, valores in colunas.items()},
+                datas[i],
+                caminhos[i],
+            ): i
+            for i in range(total)
+        }
+        for concluidos, futuro in enumerate(as_completed(futuros), start=1):
+            caminho = futuro.result()
+            if progresso is not None:
+                progresso(concluidos, total, caminho)
+    return caminhos
+
+
+def _imprimir_progresso(concluidos, total, caminho):
+    print(f"[{concluidos}/{total}] {caminho}", file=sys.stderr)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Gera um relatório PDF por lote.")
+    parser.add_argument("entrada", help="Arquivo CSV ou Parquet com um lote por linha")
+    parser.add_argument("pasta_saida", help="Pasta onde os PDFs serão gravados")
+    parser.add_argument("--tipo", choices=sorted(PADROES), default="recria")
+    parser.add_argument("--processos", type=int, default=None,
+                        help="Número de processos (padrão: todos os núcleos)")
+    args = parser.parse_args(argv)
+
+    caminhos = gerar_relatorios(
+        args.entrada, args.pasta_saida, tipo=args.tipo,
+        max_workers=args.processos, progresso=_imprimir_progresso,
+    )
+    print(f"{len(caminhos)} relatórios gravados em {args.pasta_saida}")
+
+
+if __name__ == "__main__":
+    main()
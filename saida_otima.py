@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Dia ótimo de saída (abate / fim da recria) por varredura vetorizada.
+
+Para cada animal (ou cenário) avalia o motor em todos os dias ``1..dias_max``
+numa matriz animais × dias, processada em blocos de animais para limitar a
+memória, e devolve o dia que maximiza o critério escolhido.
+
+No modelo linear atual o lucro varia uma quantia fixa por dia (ver
+``lucro_marginal`` com ``curvas=True``), então o lucro máximo fica num dos
+extremos; os critérios mensais (lucro/ROI por mês) é que têm ótimo interior.
+"""
+import numpy as np
+
+from etapas import colunas_parametros, motor_da_etapa
+
+
+CRITERIOS_SAIDA = {
+    "recria": ("lucro", "lucro_mensal", "margem_mensal", "roi_mensal", "roi_custo_mensal"),
+    "confinamento": ("lucro", "lucro_mensal", "roi_mensal", "roi_custo_mensal"),
+}
+
+# Elementos (animais × dias) avaliados por bloco.
+TAMANHO_BLOCO = 500_000
+
+DIAS_POR_MES = {"recria": 30.5, "confinamento": 30.0}
+
+
+def _criterio(etapa, resultado, dias, criterio):
+    if criterio == "lucro_mensal":
+        return resultado["lucro"] / (dias / DIAS_POR_MES[etapa])
+    return resultado[criterio]
+
+
+def dia_otimo(etapa, params, dias_max=365, criterio="lucro_mensal", curvas=False):
+    """Dia de saída que maximiza ``criterio`` para cada animal/cenário.
+
+    ``params`` traz escalares ou arrays 1-D (um valor por animal) com os campos
+    do motor da ``etapa``; ``dias`` é ignorado. Devolve um dict com
+    ``dia_otimo``, ``valor_otimo`` e ``lucro_otimo`` por animal; com
+    ``curvas=True`` inclui também ``valores`` e ``lucro`` (animais × dias) e
+    ``lucro_marginal`` (lucro do dia menos o do dia anterior).
+    """
+    motor, padroes, _ = motor_da_etapa(etapa)
+    if criterio not in CRITERIOS_SAIDA[etapa]:
+        raise ValueError(f"Critério inválido: {criterio!r} (use {', '.join(CRITERIOS_SAIDA[etapa])})")
+    colunas, n = colunas_parametros(params, {nome: valor for nome, valor in padroes.items() if nome != "dias"})
+
+    dias_com_zero = np.arange(0, int(dias_max) + 1, dtype=np.float64)
+    dias = dias_com_zero[1:]
+    dia = np.empty(n, dtype=np.int64)
+    valor_otimo = np.empty(n)
+    lucro_otimo = np.empty(n)
+    if curvas:
+        valores_todos = np.empty((n, len(dias)))
+        lucros_todos = np.empty((n, len(dias)))
+        marginais_todos = np.empty((n, len(dias)))
+
+    passo = max(1, TAMANHO_BLOCO // len(dias_com_zero))
+    for inicio in range(0, n, passo):
+        fim = min(n, inicio + passo)
+        bloco = {nome: valor[inicio:fim, np.newaxis] for nome, valor in colunas.items()}
+        # dia 0 incluído só para o lucro marginal do primeiro dia
+        resultado = motor(dias=dias_com_zero[np.newaxis, :], **bloco)
+        lucro = resultado["lucro"]
+        valores = _criterio(etapa, {nome: valor[:, 1:] for nome, valor in resultado.items()}, dias, criterio)
+
+        melhor = np.argmax(valores, axis=1)
+        linhas = np.arange(fim - inicio)
+        dia[inicio:fim] = melhor + 1
+        valor_otimo[inicio:fim] = valores[linhas, melhor]
+        lucro_otimo[inicio:fim] = lucro[linhas, melhor + 1]
+        if curvas:
+            valores_todos[inicio:fim] = valores
+            lucros_todos[inicio:fim] = lucro[:, 1:]
+            marginais_todos[inicio:fim] = np.diff(lucro, axis=1)
+
+    saida = {
+        "criterio": criterio,
+        "dias": dias,
+        "dia_otimo": dia,
+        "valor_otimo": valor_otimo,
+        "lucro_otimo": lucro_otimo,
+    }
+    if curvas:
+        saida["valores"] = valores_todos
+        saida["lucro"] = lucros_todos
+        saida["lucro_marginal"] = marginais_todos
+    return saida
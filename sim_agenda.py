@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+
+from agenda_confinamento import agendar, lotes_da_recria, lotes_de_compra
+from confinamento_engine import PADROES_CONFINAMENTO
+from instrumentacao import secao
+from lotes import eh_parquet, ler_datas, ler_tabela, preparar_parametros
+
+
+ORIGENS = ("Série de compras", "Saída da recria", "Arquivo")
+
+
+def _ler_arquivo(arquivo):
+    # o arquivo enviado é um buffer: o formato vem do nome original
+    if eh_parquet(arquivo.name):
+        return pd.read_parquet(arquivo)
+    return ler_tabela(arquivo)
+
+
+def _lotes_do_arquivo(arquivo, params):
+    # CSV/Parquet com data_entrada, cabecas e, opcionalmente, os campos do confinamento;
+    # campos ausentes usam o cenário atual da aba
+    tabela = _ler_arquivo(arquivo)
+    faltando = {"data_entrada", "cabecas"} - set(tabela.columns)
+    if faltando:
+        raise ValueError(f"Colunas obrigatórias ausentes: {', '.join(sorted(faltando))}")
+    try:
+        datas = ler_datas(tabela["data_entrada"])
+    except ValueError:
+        raise ValueError("data_entrada deve estar em AAAA-MM-DD ou DD/MM/AAAA") from None
+    return lotes_de_compra(
+        datas.to_numpy().astype("datetime64[D]"),
+        pd.to_numeric(tabela["cabecas"], errors="coerce").to_numpy(dtype=np.float64),
+        preparar_parametros(tabela, {**PADROES_CONFINAMENTO, **params}),
+    )
+
+
+@st.fragment
+def render_agenda(params, prefix):
+    """Planejamento de currais: entradas em série, da recria ou de um arquivo; caixa diário e ocupação."""
+    st.markdown("---")
+    if not st.toggle("🗓️ Planejamento de currais (agenda, caixa e ocupação)", key=f"{prefix}_agenda"):
+        return
+
+    with secao(f"{prefix}.agenda"):
+        colA, colB, colC, colD = st.columns(4)
+        with colA:
+            n_currais = st.number_input("Currais", value=20, min_value=1, step=1, key=f"{prefix}_ag_currais")
+            capacidade = st.number_input("Capacidade/curral (cab)", value=120, min_value=1, step=10,
+                                         key=f"{prefix}_ag_capacidade")
+        with colB:
+            data_inicial = st.date_input("Primeira entrada", value=datetime.date.today(), key=f"{prefix}_ag_data")
+            n_lotes = st.number_input("Lotes", value=52, min_value=1, step=1, key=f"{prefix}_ag_lotes")
+        with colC:
+            intervalo = st.number_input("Intervalo entre entradas (dias)", value=7, min_value=0, step=1,
+                                        key=f"{prefix}_ag_intervalo")
+            cabecas = st.number_input("Cabeças por lote", value=100, min_value=1, step=10,
+                                      key=f"{prefix}_ag_cabecas")
+        with colD:
+            juros_giro = st.number_input("Juros capital de giro (% ao mês)", value=params["juros_mes"] * 100,
+                                         min_value=0.0, step=0.05, format="%.2f", key=f"{prefix}_ag_juros") / 100
+            max_espera = st.number_input("Espera máx. por curral (dias)", value=30, min_value=0, step=1,
+                                         key=f"{prefix}_ag_espera")
+
+        params_recria = st.session_state.get("recria_params")
+        origens = [origem for origem in ORIGENS if params_recria is not None or origem != "Saída da recria"]
+        origem = st.radio("Entradas", origens, horizontal=True, key=f"{prefix}_ag_origem")
+        try:
+            if origem == "Arquivo":
+                arquivo = st.file_uploader(
+                    "Lista de compras (CSV/Parquet com data_entrada, cabecas e campos do confinamento)",
+                    type=["csv", "parquet", "pq"], key=f"{prefix}_ag_arquivo",
+                )
+                if arquivo is None:
+                    return
+                lotes = _lotes_do_arquivo(arquivo, params)
+            else:
+                datas = np.datetime64(data_inicial, "D") + np.arange(int(n_lotes)) * int(intervalo)
+                if origem == "Saída da recria":
+                    st.caption("Datas da série = compra dos bezerros; cada lote entra no curral ao fim "
+                               "da recria, com o peso final e o preço de venda da aba Recria.")
+                    lotes = lotes_da_recria(datas, int(cabecas), params_recria, params)
+                else:
+                    lotes = lotes_de_compra(datas, int(cabecas), params)
+            agenda = agendar(lotes, np.full(int(n_currais), int(capacidade)), juros_giro,
+                             max_espera=int(max_espera))
+        except ValueError as erro:
+            st.error(f"Lista de compras inválida: {erro}")
+            return
+        resumo = agenda["resumo"]
+
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("Lucro operacional", f"${resumo['lucro_operacional']:,.0f}")
+        col2.metric("Juros capital de giro", f"${resumo['juros_capital_giro']:,.0f}")
+        col3.metric("Lucro após juros", f"${resumo['lucro']:,.0f}")
+        col4.metric("Pico de capital", f"${resumo['pico_capital']:,.0f}")
+        col5.metric("Ocupação média", f"{resumo['ocupacao_media'] * 100:.1f}%")
+        if resumo["sublotes_nao_alocados"]:
+            st.warning(f"{resumo['sublotes_nao_alocados']} lote(s) sem curral dentro da espera máxima.")
+
+        diario = agenda["diario"]
+        indice = pd.Index(agenda["datas"], name="Data")
+        st.line_chart(pd.DataFrame({
+            "Saldo de caixa": diario["saldo"],
+            "Saldo após juros": diario["saldo_com_juros"],
+        }, index=indice))
+        st.area_chart(pd.DataFrame({"Ocupação (%)": diario["ocupacao"] * 100}, index=indice))
+
+        alocacao = agenda["lotes"]
+        st.dataframe(pd.DataFrame({
+            "Lote": alocacao["lote"] + 1,
+            "Curral": np.where(alocacao["curral"] >= 0, alocacao["curral"] + 1, -1),
+            "Cabeças": alocacao["cabecas"],
+            "Chegada": alocacao["data_entrada"],
+            "Entrada": alocacao["entrada"],
+            "Saída": alocacao["saida"],
+            "Espera (dias)": alocacao["espera"],
+            "Lucro operacional": alocacao["lucro_operacional"],
+        }), hide_index=True, width="stretch")
+        st.caption(f"Espera média para entrar: {resumo['espera_media']:.1f} dias · "
+                   f"{resumo['cabecas_alocadas']:,} cabeças alocadas. Curral -1 = não alocado.")
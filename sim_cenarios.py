@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+import datetime
+
+import streamlit as st
+import pandas as pd
+
+from cenarios import buscar_resultado, conectar, consultar, salvar_cenarios
+
+
+TITULOS = {"recria": "Recria", "confinamento": "Confinamento"}
+
+# parâmetro do motor -> (sufixo da key do widget, escala do widget)
+WIDGETS = {
+    "recria": {
+        "peso_inicial": ("peso_inicial", 1),
+        "preco_compra_pyg": ("preco_compra_pyg", 1),
+        "cambio": ("cambio", 1),
+        "dias": ("dias", 1),
+        "gmd": ("gmd", 1),
+        "custo_aluguel": ("custo_aluguel", 1),
+        "custo_nutricional": ("custo_nutricional", 1),
+        "custo_operacional": ("custo_operacional", 1),
+        "frete": ("frete", 1),
+        "comissao": ("comissao", 1),
+        "juros_anual": ("juros_anual", 100),
+        "preco_venda_kg": ("preco_venda_kg", 1),
+    },
+    "confinamento": {
+        "peso_inicial": ("peso_inicial", 1),
+        "ganho_dia": ("ganho_dia", 1),
+        "dias": ("dias", 1),
+        "rendimento_ini": ("rend_ini", 100),
+        "rendimento_fim": ("rend_fim", 100),
+        "preco_compra_kg": ("preco_compra", 1),
+        "preco_venda_kg": ("preco_venda", 1),
+        "diaria": ("diaria", 1),
+        "servicos_operacionais": ("servicos", 1),
+        "custos_extras": ("extras", 1),
+        "juros_mes": ("juros", 100),
+    },
+}
+
+
+def _conexao():
+    # uma conexão por sessão: as transações do SQLite são por conexão, então
+    # sessões que salvam ao mesmo tempo não podem dividir a mesma
+    if "_cen_conexao" not in st.session_state:
+        st.session_state["_cen_conexao"] = conectar()
+    return st.session_state["_cen_conexao"]
+
+
+def _carregar(etapa, prefix, valores):
+    # callback: roda antes do rerun, então os widgets já nascem com os valores gravados
+    for nome, (sufixo, escala) in WIDGETS[etapa].items():
+        valor = valores[nome] * escala
+        st.session_state[f"{prefix}_{sufixo}"] = int(round(valor)) if nome == "dias" else float(valor)
+    st.session_state[f"{prefix}_cen_carregado"] = True
+
+
+def render_cenarios(etapa, params, prefix):
+    """Salvar o cenário atual e recarregar cenários gravados (no sidebar)."""
+    conexao = _conexao()
+    with st.sidebar.expander(f"💾 Cenários salvos — {TITULOS[etapa]}", expanded=False):
+        if st.session_state.pop(f"{prefix}_cen_carregado", False):
+            # resultado gravado do cenário recarregado, pelo hash dos parâmetros
+            salvo = buscar_resultado(conexao, etapa, params)
+            if salvo is None:
+                st.warning("Os campos arredondaram o cenário carregado; resultado recalculado.")
+            else:
+                st.info(f"Cenário carregado: lucro gravado {salvo['lucro']:,.2f} · "
+                        f"ROI mensal {salvo['roi_mensal']:.2f}%")
+
+        cliente = st.text_input("Cliente", key=f"{prefix}_cen_cliente").strip()
+        lote = st.text_input("Lote", key=f"{prefix}_cen_lote").strip()
+        data = st.date_input("Data", value=datetime.date.today(), key=f"{prefix}_cen_data")
+
+        if st.button("Salvar cenário atual", key=f"{prefix}_cen_salvar"):
+            salvar_cenarios(conexao, etapa, params, cliente, lote, data)
+            st.success("Cenário salvo.")
+
+        gravados = consultar(conexao, etapa, cliente=cliente or None, limite=50)
+        if not len(gravados["hash"]):
+            st.caption("Nenhum cenário salvo" + (f" para {cliente}." if cliente else "."))
+            return
+
+        tabela = pd.DataFrame({
+            "Cliente": gravados["cliente"], "Lote": gravados["lote"], "Data": gravados["data"],
+            "Lucro": gravados["lucro"], "ROI mensal (%)": gravados["roi_mensal"],
+        })
+        st.dataframe(tabela, hide_index=True, width="stretch")
+
+        indice = st.selectbox(
+            "Carregar cenário", range(len(tabela)), key=f"{prefix}_cen_escolha",
+            format_func=lambda i: f"{tabela['Cliente'][i] or '—'} / {tabela['Lote'][i] or '—'} / "
+                                  f"{tabela['Data'][i]} — lucro {tabela['Lucro'][i]:,.2f}",
+        )
+        st.button(
+            "Carregar nos campos", key=f"{prefix}_cen_carregar",
+            on_click=_carregar,
+            args=(etapa, prefix, {nome: float(gravados[nome][indice]) for nome in WIDGETS[etapa]}),
+        )
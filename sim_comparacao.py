@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+import streamlit as st
+import pandas as pd
+
+from confinamento_engine import PADROES_CONFINAMENTO
+from instrumentacao import secao
+from lotes import avaliar_tabela
+from recria_engine import PADROES_RECRIA
+from sim_tornado import ROTULOS_PARAMETROS
+
+
+ETAPAS_COMPARACAO = {
+    "Recria a pasto": ("recria", PADROES_RECRIA, "recria_params"),
+    "Confinamento": ("confinamento", PADROES_CONFINAMENTO, "confinamento_params"),
+}
+
+INDICADORES_COMPARACAO = {
+    "recria": {
+        "peso_final": "Peso final (kg)",
+        "custo_total": "Custo total (US$)",
+        "receita": "Receita (US$)",
+        "lucro": "Lucro (US$)",
+        "margem_mensal": "Margem mensal (%)",
+        "roi_mensal": "ROI mensal (%/mês)",
+    },
+    "confinamento": {
+        "peso_final": "Peso final (kg)",
+        "carcaca_final": "Carcaça final (kg)",
+        "custo_total": "Custo total ($)",
+        "receita": "Receita ($)",
+        "lucro": "Lucro ($)",
+        "roi_mensal": "ROI mensal (%/mês)",
+    },
+}
+
+CENARIOS_INICIAIS = 3
+
+
+def _tabela_inicial(padroes, base):
+    linha = {nome: float(base.get(nome, padrao)) for nome, padrao in padroes.items()}
+    return pd.DataFrame(
+        [{"cenario": f"Cenário {i + 1}", **linha} for i in range(CENARIOS_INICIAIS)]
+    )
+
+
+@st.fragment
+def render_comparacao(prefix: str = "comp"):
+    st.markdown("<h2 style='text-align:center;'>⚖️ Comparação de Cenários</h2>", unsafe_allow_html=True)
+    st.markdown("---")
+
+    rotulo_etapa = st.radio("Etapa", list(ETAPAS_COMPARACAO), horizontal=True, key=f"{prefix}_etapa")
+    etapa, padroes, chave_base = ETAPAS_COMPARACAO[rotulo_etapa]
+
+    # a tabela inicial parte do cenário atual da aba e fica fixa na sessão;
+    # depois disso o editor guarda as alterações do usuário
+    chave_inicial = f"{prefix}_{etapa}_inicial"
+    if chave_inicial not in st.session_state:
+        st.session_state[chave_inicial] = _tabela_inicial(padroes, st.session_state.get(chave_base) or {})
+
+    with secao(f"{prefix}.entradas"):
+        rotulos = ROTULOS_PARAMETROS[etapa]
+        editada = st.data_editor(
+            st.session_state[chave_inicial],
+            num_rows="dynamic",
+            hide_index=True,
+            width="stretch",
+            key=f"{prefix}_{etapa}_editor",
+            column_config={
+                "cenario": st.column_config.TextColumn("Cenário"),
+                **{nome: st.column_config.NumberColumn(rotulo) for nome, rotulo in rotulos.items()},
+            },
+        )
+    if editada.empty:
+        st.info("Adicione ao menos um cenário na tabela.")
+        return
+
+    with secao(f"{prefix}.calculos"):
+        # uma única avaliação vetorizada para todas as linhas (células vazias = padrão da aba)
+        resultado = avaliar_tabela(editada, etapa)
+
+    with secao(f"{prefix}.saidas"):
+        indicadores = INDICADORES_COMPARACAO[etapa]
+        nomes = resultado["cenario"].fillna("").astype(str)
+        nomes = nomes.where(nomes != "", [f"Linha {i + 1}" for i in range(len(nomes))])
+        comparacao = resultado[list(indicadores)].rename(columns=indicadores)
+        comparacao.insert(0, "Cenário", nomes)
+
+        st.subheader("📊 Resultados")
+        st.dataframe(
+            comparacao.style.format({rotulo: "{:,.2f}" for rotulo in indicadores.values()}),
+            hide_index=True, width="stretch",
+        )
+        st.bar_chart(comparacao.set_index("Cenário")[[indicadores["lucro"]]], horizontal=True)
@@ -1,4 +1,30 @@
 import streamlit as st
+import numpy as np
+import pandas as pd
+
+from confinamento_engine import cenario_confinamento
+from instrumentacao import secao
+from sim_agenda import render_agenda
+from sim_cenarios import render_cenarios
+from pipeline import otimizar_ciclo
+from saida_otima import dia_otimo
+from sim_tornado import render_tornado
+
+
+CRITERIOS_CICLO_ROTULOS = {
+    "ROI mensal do ciclo (%/mês)": "roi_ciclo_mensal",
+    "ROI do ciclo (%)": "roi_ciclo",
+    "Lucro mensal do ciclo ($/mês)": "lucro_ciclo_mensal",
+    "Lucro do ciclo ($)": "lucro_ciclo",
+}
+
+CRITERIOS_SAIDA_ROTULOS = {
+    "Lucro mensal ($/mês)": "lucro_mensal",
+    "ROI mensal custo total (%/mês)": "roi_custo_mensal",
+    "ROI mensal (%/mês)": "roi_mensal",
+    "Lucro ($)": "lucro",
+}
+
 
 def render_confinamento(prefix: str = "conf"):
 
@@ -8,139 +34,249 @@ def render_confinamento(prefix: str = "conf"):
     # ==============================
     # 1) PEGAR AUTOMATICAMENTE OS DADOS DA RECRIA
     # ==============================
-    dados_recria = st.session_state.get("recria_output", None)
+    with secao(f"{prefix}.link"):
+        dados_recria = st.session_state.get("recria_output", None)
 
-    if dados_recria is not None:
-        peso_inicial_padrao = float(dados_recria.get("peso_final", 350.0))
-        preco_compra_padrao = float(dados_recria.get("preco_venda_kg", 11.30))
-        st.info(f"Link automático: entrada do confinamento = saída da recria "
-                f"(Peso: {peso_inicial_padrao:.2f} kg | Preço: {preco_compra_padrao:.2f} $/kg PV)")
-    else:
-        peso_inicial_padrao = 350.0
-        preco_compra_padrao = 11.30
-        st.warning("Ainda não existe saída da Recria. Use a aba Recria primeiro.")
+        if dados_recria is not None:
+            peso_inicial_padrao = float(dados_recria.get("peso_final", 350.0))
+            preco_compra_padrao = float(dados_recria.get("preco_venda_kg", 11.30))
+            st.info(f"Link automático: entrada do confinamento = saída da recria "
+                    f"(Peso: {peso_inicial_padrao:.2f} kg | Preço: {preco_compra_padrao:.2f} $/kg PV)")
+        else:
+            peso_inicial_padrao = 350.0
+            preco_compra_padrao = 11.30
+            st.warning("Ainda não existe saída da Recria. Use a aba Recria primeiro.")
 
     # ==============================
     # 2) ENTRADAS (COM VALORES PADRÃO VINDO DA RECRIA)
     # ==============================
-    st.sidebar.header("Parâmetros de Entrada")
+    with secao(f"{prefix}.entradas"):
+        st.sidebar.header("Parâmetros de Entrada")
 
-    with st.sidebar.expander("🏭 Confinamento", expanded=True):
+        with st.sidebar.expander("🏭 Confinamento", expanded=True):
 
-        peso_inicial = st.number_input(
-            "Peso inicial (kg)", value=peso_inicial_padrao, min_value=0.0, step=1.0,
-            format="%.2f", key=f"{prefix}_peso_inicial"
-        )
+            peso_inicial = st.number_input(
+                "Peso inicial (kg)", value=peso_inicial_padrao, min_value=0.0, step=1.0,
+                format="%.2f", key=f"{prefix}_peso_inicial"
+            )
 
-        ganho_dia = st.number_input(
-            "Ganho de peso/dia (kg)", value=1.40, min_value=0.0, step=0.05,
-            format="%.2f", key=f"{prefix}_ganho_dia"
-        )
+            ganho_dia = st.number_input(
+                "Ganho de peso/dia (kg)", value=1.40, min_value=0.0, step=0.05,
+                format="%.2f", key=f"{prefix}_ganho_dia"
+            )
 
-        dias = st.number_input(
-            "Período de trato (dias)", value=110, min_value=1, step=1,
-            key=f"{prefix}_dias"
-        )
+            dias = st.number_input(
+                "Período de trato (dias)", value=110, min_value=1, step=1,
+                key=f"{prefix}_dias"
+            )
 
-        rendimento_ini = st.number_input(
-            "Rendimento inicial (%)", value=50.0, min_value=0.0, max_value=100.0,
-            step=0.1, format="%.2f", key=f"{prefix}_rend_ini"
-        ) / 100
+            rendimento_ini = st.number_input(
+                "Rendimento inicial (%)", value=50.0, min_value=0.0, max_value=100.0,
+                step=0.1, format="%.2f", key=f"{prefix}_rend_ini"
+            ) / 100
 
-        rendimento_fim = st.number_input(
-            "Rendimento final (%)", value=56.0, min_value=0.0, max_value=100.0,
-            step=0.1, format="%.2f", key=f"{prefix}_rend_fim"
-        ) / 100
+            rendimento_fim = st.number_input(
+                "Rendimento final (%)", value=56.0, min_value=0.0, max_value=100.0,
+                step=0.1, format="%.2f", key=f"{prefix}_rend_fim"
+            ) / 100
 
-        preco_compra_kg = st.number_input(
-            "Valor de compra ($/kg PV)",
-            value=preco_compra_padrao,
-            min_value=0.0, step=0.01, format="%.2f",
-            key=f"{prefix}_preco_compra"
-        )
+            preco_compra_kg = st.number_input(
+                "Valor de compra ($/kg PV)",
+                value=preco_compra_padrao,
+                min_value=0.0, step=0.01, format="%.2f",
+                key=f"{prefix}_preco_compra"
+            )
 
-        preco_venda_kg = st.number_input(
-            "Valor de venda ($/kg carcaça)", value=21.40, min_value=0.0, step=0.01,
-            format="%.2f", key=f"{prefix}_preco_venda"
-        )
+            preco_venda_kg = st.number_input(
+                "Valor de venda ($/kg carcaça)", value=21.40, min_value=0.0, step=0.01,
+                format="%.2f", key=f"{prefix}_preco_venda"
+            )
 
-        diaria = st.number_input(
-            "Custo nutricional ($/dia)", value=14.50, min_value=0.0, step=0.1,
-            format="%.2f", key=f"{prefix}_diaria"
-        )
+            diaria = st.number_input(
+                "Custo nutricional ($/dia)", value=14.50, min_value=0.0, step=0.1,
+                format="%.2f", key=f"{prefix}_diaria"
+            )
 
-        servicos_operacionais = st.number_input(
-            "Serviços operacionais ($/animal/dia)", value=1.0, min_value=0.0,
-            step=0.10, format="%.2f", key=f"{prefix}_servicos"
-        )
+            servicos_operacionais = st.number_input(
+                "Serviços operacionais ($/animal/dia)", value=1.0, min_value=0.0,
+                step=0.10, format="%.2f", key=f"{prefix}_servicos"
+            )
 
-        custos_extras = st.number_input(
-            "Custos extras ($/animal)", value=0.0, min_value=0.0,
-            step=0.10, format="%.2f", key=f"{prefix}_extras"
-        )
+            custos_extras = st.number_input(
+                "Custos extras ($/animal)", value=0.0, min_value=0.0,
+                step=0.10, format="%.2f", key=f"{prefix}_extras"
+            )
 
-        juros_mes = st.number_input(
-            "Juros sobre custo do animal (% ao mês)", value=0.50, min_value=0.0,
-            step=0.05, format="%.2f", key=f"{prefix}_juros"
-        ) / 100
+            juros_mes = st.number_input(
+                "Juros sobre custo do animal (% ao mês)", value=0.50, min_value=0.0,
+                step=0.05, format="%.2f", key=f"{prefix}_juros"
+            ) / 100
 
     # ==============================
     # CÁLCULOS
     # ==============================
-    peso_final = peso_inicial + ganho_dia * dias
-    carcaca_final = peso_final * rendimento_fim
+    with secao(f"{prefix}.calculos"):
+        params = {
+            "peso_inicial": peso_inicial,
+            "ganho_dia": ganho_dia,
+            "dias": dias,
+            "rendimento_ini": rendimento_ini,
+            "rendimento_fim": rendimento_fim,
+            "preco_compra_kg": preco_compra_kg,
+            "preco_venda_kg": preco_venda_kg,
+            "diaria": diaria,
+            "servicos_operacionais": servicos_operacionais,
+            "custos_extras": custos_extras,
+            "juros_mes": juros_mes,
+        }
+        resultado = cenario_confinamento(**params)
+        st.session_state["confinamento_params"] = params
+
+        peso_final = resultado["peso_final"]
+        carcaca_final = resultado["carcaca_final"]
 
-    ganho_peso = peso_final - peso_inicial
-    ganho_carcaca = carcaca_final - (peso_inicial * rendimento_ini)
-    carcaca_dia = ganho_carcaca / dias if dias > 0 else 0
+        ganho_peso = resultado["ganho_peso"]
+        carcaca_dia = resultado["carcaca_dia"]
 
-    valor_compra = peso_inicial * preco_compra_kg
-    custo_nutricional = diaria * dias
-    custo_servicos = servicos_operacionais * dias
-    despesas_totais = custo_nutricional + custo_servicos + custos_extras
+        valor_compra = resultado["valor_compra"]
+        custo_nutricional = resultado["custo_nutricional"]
+        custo_servicos = resultado["custo_servicos"]
 
-    juros = valor_compra * juros_mes * (dias / 30)
-    custo_total = valor_compra + despesas_totais + juros
+        juros = resultado["juros"]
+        custo_total = resultado["custo_total"]
 
-    receita = carcaca_final * preco_venda_kg
-    lucro = receita - custo_total
+        receita = resultado["receita"]
+        lucro = resultado["lucro"]
 
-    margem_lucro = (lucro / receita * 100) if receita > 0 else 0
-    roi = (lucro / valor_compra * 100) if valor_compra > 0 else 0
-    roi_mensal = (roi / dias) * 30 if dias > 0 else 0
-    roi_custo = (lucro / custo_total * 100) if custo_total > 0 else 0
-    roi_custo_mensal = (roi_custo / dias) * 30 if dias > 0 else 0
+        margem_lucro = resultado["margem_lucro"]
+        roi = resultado["roi"]
+        roi_mensal = resultado["roi_mensal"]
+        roi_custo = resultado["roi_custo"]
+        roi_custo_mensal = resultado["roi_custo_mensal"]
 
     # ==============================
     # SAÍDAS
     # ==============================
-    col1, col2, col3 = st.columns([1.2, 1.2, 1.2])
-
-    with col1:
-        st.subheader("⚖️ Indicadores Zootécnicos")
-        st.write(f"Peso inicial: **{peso_inicial:.2f} kg**")
-        st.write(f"Peso final: **{peso_final:.2f} kg**")
-        st.write(f"Dias de trato: **{dias}**")
-        st.write(f"Ganho de peso: **{ganho_peso:.2f} kg**")
-        st.write(f"Ganho diário: **{ganho_dia:.2f} kg/dia**")
-        st.write(f"Carcaça final: **{carcaca_final:.2f} kg**")
-        st.write(f"Carcaça/dia: **{carcaca_dia:.2f} kg/dia**")
-
-    with col2:
-        st.subheader("💰 Custos")
-        st.write(f"Custo animal: **${valor_compra:,.2f}**")
-        st.write(f"Custo nutricional: **${custo_nutricional:,.2f}**")
-        st.write(f"Serviços: **${custo_servicos:,.2f}**")
-        st.write(f"Custos extras: **${custos_extras:,.2f}**")
-        st.write(f"Juros: **${juros:,.2f}**")
-        st.write(f"🔴 Custo total: **${custo_total:,.2f}**")
-
-    with col3:
-        st.subheader("📊 Resultado Econômico")
-        st.write(f"Receita: **${receita:,.2f}**")
-        st.write(f"Lucro: **${lucro:,.2f}**")
-        st.write(f"Margem: **{margem_lucro:.2f}%**")
-        st.write(f"ROI: **{roi:.2f}%**")
-        st.write(f"ROI mensal: **{roi_mensal:.2f}%/mês**")
-        st.write(f"ROI custo total: **{roi_custo:.2f}%**")
-        st.write(f"ROI mensal custo total: **{roi_custo_mensal:.2f}%/mês**")
+    with secao(f"{prefix}.saidas"):
+        col1, col2, col3 = st.columns([1.2, 1.2, 1.2])
+
+        with col1:
+            st.subheader("⚖️ Indicadores Zootécnicos")
+            st.write(f"Peso inicial: **{peso_inicial:.2f} kg**")
+            st.write(f"Peso final: **{peso_final:.2f} kg**")
+            st.write(f"Dias de trato: **{dias}**")
+            st.write(f"Ganho de peso: **{ganho_peso:.2f} kg**")
+            st.write(f"Ganho diário: **{ganho_dia:.2f} kg/dia**")
+            st.write(f"Carcaça final: **{carcaca_final:.2f} kg**")
+            st.write(f"Carcaça/dia: **{carcaca_dia:.2f} kg/dia**")
+
+        with col2:
+            st.subheader("💰 Custos")
+            st.write(f"Custo animal: **${valor_compra:,.2f}**")
+            st.write(f"Custo nutricional: **${custo_nutricional:,.2f}**")
+            st.write(f"Serviços: **${custo_servicos:,.2f}**")
+            st.write(f"Custos extras: **${custos_extras:,.2f}**")
+            st.write(f"Juros: **${juros:,.2f}**")
+            st.write(f"🔴 Custo total: **${custo_total:,.2f}**")
+
+        with col3:
+            st.subheader("📊 Resultado Econômico")
+            st.write(f"Receita: **${receita:,.2f}**")
+            st.write(f"Lucro: **${lucro:,.2f}**")
+            st.write(f"Margem: **{margem_lucro:.2f}%**")
+            st.write(f"ROI: **{roi:.2f}%**")
+            st.write(f"ROI mensal: **{roi_mensal:.2f}%/mês**")
+            st.write(f"ROI custo total: **{roi_custo:.2f}%**")
+            st.write(f"ROI mensal custo total: **{roi_custo_mensal:.2f}%/mês**")
+
+    render_cenarios("confinamento", params, prefix)
+
+    # ==============================
+    # DIA ÓTIMO DE SAÍDA
+    # ==============================
+    with secao(f"{prefix}.saida_otima"):
+        st.markdown("---")
+        if st.toggle("⏱️ Dia ótimo de saída do confinamento", key=f"{prefix}_saida"):
+            colA, colB = st.columns(2)
+            with colA:
+                dias_max = st.number_input(
+                    "Máx. dias de trato", value=250, min_value=1, step=10,
+                    key=f"{prefix}_saida_max"
+                )
+            with colB:
+                rotulo_saida = st.selectbox(
+                    "Maximizar", list(CRITERIOS_SAIDA_ROTULOS), key=f"{prefix}_saida_criterio"
+                )
+
+            saida = dia_otimo(
+                "confinamento", params, int(dias_max),
+                CRITERIOS_SAIDA_ROTULOS[rotulo_saida], curvas=True
+            )
+            st.write(f"Dia ótimo de saída: **{saida['dia_otimo'][0]} dias** | "
+                     f"{rotulo_saida}: **{saida['valor_otimo'][0]:,.2f}** | "
+                     f"Lucro: **${saida['lucro_otimo'][0]:,.2f}**")
+            st.write(f"Lucro marginal no dia ótimo: "
+                     f"**${saida['lucro_marginal'][0, saida['dia_otimo'][0] - 1]:,.2f}/dia**")
+            st.line_chart(pd.DataFrame(
+                {rotulo_saida: saida["valores"][0], "Lucro marginal ($/dia)": saida["lucro_marginal"][0]},
+                index=pd.Index(saida["dias"].astype(int), name="Dias de trato"),
+            ))
+
+    # ==============================
+    # OTIMIZAÇÃO DO CICLO RECRIA → CONFINAMENTO
+    # ==============================
+    with secao(f"{prefix}.ciclo"):
+        params_recria = st.session_state.get("recria_params")
+        st.markdown("---")
+        if params_recria is not None and st.toggle(
+            "🔗 Otimizar ciclo recria → confinamento (dias de cada fase)", key=f"{prefix}_ciclo"
+        ):
+            colA, colB, colC = st.columns(3)
+            with colA:
+                max_dias_recria = st.number_input(
+                    "Máx. dias de recria", value=540, min_value=1, step=10,
+                    key=f"{prefix}_ciclo_max_recria"
+                )
+            with colB:
+                max_dias_conf = st.number_input(
+                    "Máx. dias de confinamento", value=200, min_value=1, step=10,
+                    key=f"{prefix}_ciclo_max_conf"
+                )
+            with colC:
+                rotulo_criterio = st.selectbox(
+                    "Maximizar", list(CRITERIOS_CICLO_ROTULOS), key=f"{prefix}_ciclo_criterio"
+                )
+                criterio = CRITERIOS_CICLO_ROTULOS[rotulo_criterio]
+
+            otimo = otimizar_ciclo(
+                params_recria, params,
+                np.arange(1, int(max_dias_recria) + 1), np.arange(1, int(max_dias_conf) + 1),
+                criterio,
+            )
+            o = otimo["otimo"]
+            st.write(f"Melhor combinação: **{otimo['dias_recria']:.0f} dias de recria + "
+                     f"{otimo['dias_confinamento']:.0f} dias de confinamento** "
+                     f"({otimo['valores'].size:,} combinações avaliadas)")
+            st.write(f"Lucro do ciclo: **${o['lucro_ciclo']:,.2f}** | "
+                     f"Lucro mensal: **${o['lucro_ciclo_mensal']:,.2f}/mês**")
+            st.write(f"ROI do ciclo: **{o['roi_ciclo']:.2f}%** | "
+                     f"ROI mensal: **{o['roi_ciclo_mensal']:.2f}%/mês**")
+
+            i_recria = otimo["indice"][0]
+            st.line_chart(
+                pd.DataFrame(
+                    {rotulo_criterio: otimo["valores"][i_recria]},
+                    index=pd.Index(np.arange(1, int(max_dias_conf) + 1), name="Dias de confinamento"),
+                ),
+            )
+            st.caption(f"Curva com a recria fixada em {otimo['dias_recria']:.0f} dias.")
+
+    # ==============================
+    # TORNADO E EQUILÍBRIO
+    # ==============================
+    render_tornado("confinamento", params, prefix)
+
+    # ==============================
+    # PLANEJAMENTO DE CURRAIS
+    # ==============================
+    render_agenda(params, prefix)
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import sys
+import uuid
+
+import streamlit as st
+import pandas as pd
+
+import instrumentacao
+import tarefas
+from confinamento_engine import estatisticas_cache_confinamento
+from recria_engine import estatisticas_cache_recria
+
+
+def estatisticas_caches():
+    """Acertos/falhas dos caches de cenário (e do PDF, se o módulo já foi carregado)."""
+    caches = {
+        "recria": estatisticas_cache_recria(),
+        "confinamento": estatisticas_cache_confinamento(),
+    }
+    # não força o import do reportlab só para mostrar contadores zerados
+    if "relatorio_pdf" in sys.modules:
+        pdf = sys.modules["relatorio_pdf"].estatisticas_cache_pdf()
+        caches.update({f"pdf_{nome}": valores for nome, valores in pdf.items()})
+    return caches
+
+
+def render_debug():
+    """Painel com a latência de cada seção na execução atual (só com instrumentação ativa)."""
+    if not instrumentacao.ativo():
+        return
+
+    caches = estatisticas_caches()
+    instrumentacao.gravar_prometheus(caches=caches)
+
+    with st.expander("🛠️ Debug: tempo por seção (execução atual)"):
+        tempos = instrumentacao.tempos_execucao()
+        tabela = pd.DataFrame(tempos, columns=["Seção", "ms"])
+        tabela["ms"] *= 1000
+        st.dataframe(tabela.style.format({"ms": "{:.2f}"}), hide_index=True, width="stretch")
+        st.write(f"Total instrumentado: **{tabela['ms'].sum():.2f} ms**")
+
+        st.markdown("**Caches**")
+        st.dataframe(pd.DataFrame(caches).T, width="stretch")
+
+        # só as tarefas desta sessão, com o mesmo dono que sim_risco passa a ``enviar``
+        registros = tarefas.listar(st.session_state.setdefault("sessao_id", uuid.uuid4().hex))
+        if registros:
+            st.markdown("**Tarefas em segundo plano**")
+            st.dataframe(
+                pd.DataFrame(registros)[["id", "descricao", "estado", "progresso", "erro"]],
+                hide_index=True, width="stretch",
+            )
+
+        st.markdown("**Contadores acumulados (Prometheus)**")
+        st.code(instrumentacao.exportar_prometheus(caches), language="text")
@@ -1,167 +1,378 @@
 # -*- coding: utf-8 -*-
 import streamlit as st
 import datetime
-import io
+import functools
+
+import altair as alt
+import numpy as np
+import pandas as pd
+
+from instrumentacao import secao
+from sim_cenarios import render_cenarios
+from sim_tornado import render_tornado
+from recria_engine import (
+    EIXO_GMD,
+    EIXO_PRECO_COMPRA,
+    EIXO_PRECO_VENDA,
+    cenario_recria,
+    indice_eixo,
+    preco_venda_equilibrio,
+    superficie_lucro,
+)
+
+
+@st.cache_resource(max_entries=8, ttl=3600, show_spinner=False)
+def _superficie_sensibilidade(peso_inicial, cambio, dias, custo_total_periodo, frete, comissao, juros_anual):
+    # Grade 3-D (~2,4M pontos) calculada uma vez por cenário base; os sliders só fatiam.
+    superficie = superficie_lucro(
+        peso_inicial, cambio, dias, custo_total_periodo, frete, comissao, juros_anual
+    )
+    superficie.flags.writeable = False
+    return superficie
+
+
+def _pdf_recria(**params):
+    # reportlab só é importado quando um PDF é de fato pedido
+    from relatorio_pdf import pdf_recria
+    with secao("recria.pdf_gerar"):
+        return pdf_recria(**params)
+
+
+def _mapa_lucro(lucro, eixo_x, equilibrio, titulo_x, campo_x):
+    # lucro[x, venda] -> mapa de calor com a linha de equilíbrio sobreposta
+    xx, yy = np.meshgrid(eixo_x, EIXO_PRECO_VENDA, indexing="ij")
+    dados = pd.DataFrame({campo_x: xx.ravel(), "preco_venda": yy.ravel(), "lucro": lucro.ravel()})
+    passo_x = (eixo_x[-1] - eixo_x[0]) / (len(eixo_x) - 1)
+    passo_y = (EIXO_PRECO_VENDA[-1] - EIXO_PRECO_VENDA[0]) / (len(EIXO_PRECO_VENDA) - 1)
+    dados[f"{campo_x}_fim"] = dados[campo_x] + passo_x
+    dados["preco_venda_fim"] = dados["preco_venda"] + passo_y
+
+    mapa = alt.Chart(dados).mark_rect().encode(
+        x=alt.X(f"{campo_x}:Q", title=titulo_x),
+        x2=f"{campo_x}_fim:Q",
+        y=alt.Y("preco_venda:Q", title="Preço venda (US$/kg PV)"),
+        y2="preco_venda_fim:Q",
+        color=alt.Color("lucro:Q", title="Lucro (US$)",
+                        scale=alt.Scale(scheme="redyellowgreen", domainMid=0)),
+        tooltip=[f"{campo_x}:Q", "preco_venda:Q", alt.Tooltip("lucro:Q", format=",.2f")],
+    )
 
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib.pagesizes import A4
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import cm
+    visivel = (equilibrio >= EIXO_PRECO_VENDA[0]) & (equilibrio <= EIXO_PRECO_VENDA[-1])
+    linha = alt.Chart(pd.DataFrame({
+        campo_x: eixo_x[visivel], "preco_venda": equilibrio[visivel]
+    })).mark_line(color="black", strokeWidth=2).encode(
+        x=f"{campo_x}:Q", y="preco_venda:Q"
+    )
+    return mapa + linha
 
 
-def render_recria(prefix: str = "recria"):
-    st.markdown("<h2 style='text-align: center;'>🐂 Análise Econômica da Recria a Pasto</h2>", unsafe_allow_html=True)
-    st.markdown("---")
+@st.fragment
+def _sensibilidade(prefix, params, resultado):
+    # Fragmento: os sliders reexecutam só esta seção, a partir do cenário base em cache.
+    peso_inicial, cambio, dias = params["peso_inicial"], params["cambio"], params["dias"]
+    preco_compra_pyg, gmd = params["preco_compra_pyg"], params["gmd"]
+    preco_venda_kg, juros_anual = params["preco_venda_kg"], params["juros_anual"]
+    frete, comissao = params["frete"], params["comissao"]
+    custo_total_periodo = resultado["custo_total_periodo"]
 
-    # ==============================
-    # ENTRADAS (no sidebar, isoladas por prefix/key)
-    # ==============================
-    st.sidebar.header("Parâmetros de Entrada")
+    with secao(f"{prefix}.sensibilidade"):
+        st.subheader("📉 Análise de Sensibilidade Interativa")
 
-    with st.sidebar.expander("🌱 Recria a Pasto", expanded=True):
-        peso_inicial = st.number_input(
-            "Peso inicial (kg)", value=175.0, min_value=0.0, step=1.0, format="%.2f",
-            key=f"{prefix}_peso_inicial"
-        )
-        preco_compra_pyg = st.number_input(
-            "Preço compra (₲/kg PV)", value=20000.0, min_value=0.0, step=100.0, format="%.2f",
-            key=f"{prefix}_preco_compra_pyg"
-        )
-        cambio = st.number_input(
-            "Câmbio (₲/US$)", value=7320.0, min_value=0.0, step=10.0, format="%.2f",
-            key=f"{prefix}_cambio"
+        modo_grade = st.toggle(
+            "🧊 Superfície completa (grade pré-calculada com mapas de calor)",
+            key=f"{prefix}_sens_grade"
         )
 
-        dias = st.number_input(
-            "Período (dias em pastejo)", value=365, min_value=1, step=1,
-            key=f"{prefix}_dias"
-        )
-        gmd = st.number_input(
-            "Ganho médio diário (kg/dia)", value=0.490, min_value=0.0, step=0.01, format="%.2f",
-            key=f"{prefix}_gmd"
+        colA, colB, colC = st.columns(3)
+
+        with colA:
+            sens_preco_compra = st.slider(
+                "Preço compra (₲/kg PV)",
+                min_value=15000, max_value=25000,
+                value=int(preco_compra_pyg), step=100,
+                key=f"{prefix}_sens_preco_compra"
+            )
+
+        with colB:
+            sens_preco_venda = st.slider(
+                "Preço venda (US$/kg PV)",
+                min_value=1.5, max_value=3.5,
+                value=float(preco_venda_kg), step=0.01,
+                key=f"{prefix}_sens_preco_venda"
+            )
+
+        with colC:
+            sens_gmd = st.slider(
+                "GMD (kg/dia)",
+                min_value=0.3, max_value=1.5,
+                value=float(gmd), step=0.01,
+                key=f"{prefix}_sens_gmd"
+            )
+
+        if modo_grade:
+            superficie = _superficie_sensibilidade(
+                peso_inicial, cambio, dias, custo_total_periodo, frete, comissao, juros_anual
+            )
+            i_compra = indice_eixo(EIXO_PRECO_COMPRA, sens_preco_compra)
+            j_venda = indice_eixo(EIXO_PRECO_VENDA, sens_preco_venda)
+            k_gmd = indice_eixo(EIXO_GMD, sens_gmd)
+            lucro_sens = float(superficie[i_compra, j_venda, k_gmd])
+        else:
+            valor_compra_usd_sens = (peso_inicial * sens_preco_compra) / cambio if cambio > 0 else 0
+            peso_final_sens = peso_inicial + sens_gmd * dias
+            receita_sens = peso_final_sens * sens_preco_venda
+            custo_total_sens = valor_compra_usd_sens + custo_total_periodo + frete + comissao
+            juros_sens = valor_compra_usd_sens * juros_anual * (dias / 365)
+            lucro_sens = receita_sens - custo_total_sens - juros_sens
+
+        st.markdown("### 🔮 Resultado do Cenário")
+        st.write(f"🐂 Preço compra: **₲ {sens_preco_compra:,.0f} | ${(sens_preco_compra/cambio) if cambio>0 else 0:.2f}/kg PV**")
+        st.write(f"💵 Preço venda: **${sens_preco_venda:.2f}/kg PV**")
+        st.write(f"📈 GMD: **{sens_gmd:.2f} kg/dia**")
+        st.write(f"🟢 Lucro líquido: **${lucro_sens:,.2f}**")
+
+        if modo_grade:
+            equilibrio = preco_venda_equilibrio(
+                peso_inicial, cambio, dias, custo_total_periodo, frete, comissao, juros_anual
+            )
+            colH1, colH2 = st.columns(2)
+            with colH1:
+                st.markdown(f"**Lucro (US$): preço compra × preço venda** — GMD {EIXO_GMD[k_gmd]:.2f} kg/dia")
+                st.altair_chart(_mapa_lucro(
+                    superficie[:, :, k_gmd], EIXO_PRECO_COMPRA, equilibrio[:, k_gmd],
+                    "Preço compra (₲/kg PV)", "preco_compra",
+                ), width="stretch")
+            with colH2:
+                st.markdown(f"**Lucro (US$): GMD × preço venda** — compra ₲ {EIXO_PRECO_COMPRA[i_compra]:,.0f}/kg PV")
+                st.altair_chart(_mapa_lucro(
+                    superficie[i_compra, :, :].T, EIXO_GMD, equilibrio[i_compra, :],
+                    "GMD (kg/dia)", "gmd",
+                ), width="stretch")
+            st.caption("Linha preta: preço de venda de equilíbrio (lucro = 0).")
+
+
+@st.fragment
+def _impacto(prefix, params, resultado):
+    dias, preco_venda_kg, juros_anual = params["dias"], params["preco_venda_kg"], params["juros_anual"]
+    frete, comissao = params["frete"], params["comissao"]
+    valor_compra_usd, custo_total_periodo = resultado["valor_compra_usd"], resultado["custo_total_periodo"]
+    receita, lucro, peso_final = resultado["receita"], resultado["lucro"], resultado["peso_final"]
+
+    with secao(f"{prefix}.impacto"):
+        st.subheader("📈 Análise de Impacto")
+
+        incremento_gmd = 0.01  # 10 g/dia
+        ganho_extra = incremento_gmd * dias
+        lucro_extra = ganho_extra * preco_venda_kg
+
+        st.markdown(f"- ⚖️ A cada **+10 g/dia** no ganho de peso, o lucro **aumenta** em ~ **${lucro_extra:,.2f}** no período de **{dias} dias**.")
+        st.markdown(f"- ⚖️ A cada **-10 g/dia** no ganho de peso, o lucro **reduz** em ~ **${lucro_extra:,.2f}** no período de **{dias} dias**.")
+        st.markdown("---")
+
+        colX, colY = st.columns(2)
+        with colX:
+            variacao_compra = st.slider(
+                "Variação (%) no valor de compra",
+                min_value=0.0, max_value=10.0,
+                value=2.0, step=0.1,
+                key=f"{prefix}_var_compra"
+            )
+        with colY:
+            variacao_venda = st.slider(
+                "Variação (%) no preço de venda",
+                min_value=0.0, max_value=10.0,
+                value=2.0, step=0.1,
+                key=f"{prefix}_var_venda"
+            )
+
+        novo_valor_compra = valor_compra_usd * (1 + variacao_compra / 100)
+        novo_juros = novo_valor_compra * juros_anual * (dias / 365)
+        novo_custo_total = novo_valor_compra + custo_total_periodo + frete + comissao + novo_juros
+        novo_lucro = receita - novo_custo_total
+
+        impacto_compra_abs = lucro - novo_lucro
+        impacto_compra_pct = (impacto_compra_abs / lucro * 100) if lucro != 0 else 0
+        st.markdown(
+            f"- 🐂 A cada **+{variacao_compra:.1f}%** no valor de compra do animal, "
+            f"o lucro **reduz** em ~ **${impacto_compra_abs:,.2f} ({impacto_compra_pct:.2f}%)**."
         )
 
-        custo_aluguel = st.number_input(
-            "Custo aluguel (US$/mês)", value=5.40, min_value=0.0, step=0.1, format="%.2f",
-            key=f"{prefix}_custo_aluguel"
-        )
-        custo_nutricional = st.number_input(
-            "Custo nutrição (US$/mês)", value=4.0, min_value=0.0, step=0.1, format="%.2f",
-            key=f"{prefix}_custo_nutricional"
-        )
-        custo_operacional = st.number_input(
-            "Custo operações (US$/mês)", value=3.44, min_value=0.0, step=0.1, format="%.2f",
-            key=f"{prefix}_custo_operacional"
-        )
+        novo_preco_venda = preco_venda_kg * (1 + variacao_venda / 100)
+        nova_receita = peso_final * novo_preco_venda
+        novo_lucro_venda = nova_receita - novo_custo_total
 
-        frete = st.number_input(
-            "Frete (US$/cab)", value=8.0, min_value=0.0, step=0.5, format="%.2f",
-            key=f"{prefix}_frete"
-        )
-        comissao = st.number_input(
-            "Comissão (US$/cab)", value=4.0, min_value=0.0, step=0.5, format="%.2f",
-            key=f"{prefix}_comissao"
+        impacto_venda_abs = novo_lucro_venda - novo_lucro
+        impacto_venda_pct = (impacto_venda_abs / novo_lucro * 100) if novo_lucro != 0 else 0
+        st.markdown(
+            f"- 💵 A cada **+{variacao_venda:.1f}%** no preço de venda, "
+            f"o lucro **aumenta** em ~ **${impacto_venda_abs:,.2f} ({impacto_venda_pct:.2f}%)**."
         )
 
-        juros_anual = st.number_input(
-            "Juros anual (%)", value=8.5, min_value=0.0, step=0.1, format="%.2f",
-            key=f"{prefix}_juros_anual"
-        ) / 100.0
 
-        preco_venda_kg = st.number_input(
-            "Preço venda (US$/kg PV)", value=2.40, min_value=0.0, step=0.01, format="%.2f",
-            key=f"{prefix}_preco_venda_kg"
-        )
+def render_recria(prefix: str = "recria"):
+    st.markdown("<h2 style='text-align: center;'>🐂 Análise Econômica da Recria a Pasto</h2>", unsafe_allow_html=True)
+    st.markdown("---")
 
     # ==============================
-    # CÁLCULOS
+    # ENTRADAS (no sidebar, isoladas por prefix/key)
     # ==============================
-    valor_compra_usd = (peso_inicial * preco_compra_pyg) / cambio if cambio > 0 else 0
-    preco_compra_usd_kg = (preco_compra_pyg / cambio) if cambio > 0 else 0
-
-    agio = ((preco_compra_usd_kg - preco_venda_kg) / preco_venda_kg * 100) if preco_venda_kg > 0 else 0
-
-    peso_final = peso_inicial + gmd * dias
-    gpv = peso_final - peso_inicial
-
-    meses = dias / 30.5
-    custo_mensal = custo_aluguel + custo_nutricional + custo_operacional
-    custo_total_periodo = custo_mensal * meses
-
-    custo_total = valor_compra_usd + custo_total_periodo + frete + comissao
-
-    receita = peso_final * preco_venda_kg
-    juros_valor = valor_compra_usd * juros_anual * (dias / 365)
-
-    lucro = receita - custo_total - juros_valor
-
-    margem_periodo = (lucro / receita * 100) if receita > 0 else 0
-    margem_mensal = (margem_periodo / meses) if meses > 0 else 0
-
-    roi = (lucro / valor_compra_usd * 100) if valor_compra_usd > 0 else 0
-    roi_mensal = (roi / meses) if meses > 0 else 0
-
-    roi_custo = (lucro / custo_total * 100) if custo_total > 0 else 0
-    roi_custo_mensal = (roi_custo / meses) if meses > 0 else 0
-
-    data_inicial = datetime.date.today()
-    data_final = data_inicial + datetime.timedelta(days=int(dias))
+    with secao(f"{prefix}.entradas"):
+        st.sidebar.header("Parâmetros de Entrada")
+
+        with st.sidebar.expander("🌱 Recria a Pasto", expanded=True):
+            peso_inicial = st.number_input(
+                "Peso inicial (kg)", value=175.0, min_value=0.0, step=1.0, format="%.2f",
+                key=f"{prefix}_peso_inicial"
+            )
+            preco_compra_pyg = st.number_input(
+                "Preço compra (₲/kg PV)", value=20000.0, min_value=0.0, step=100.0, format="%.2f",
+                key=f"{prefix}_preco_compra_pyg"
+            )
+            cambio = st.number_input(
+                "Câmbio (₲/US$)", value=7320.0, min_value=0.0, step=10.0, format="%.2f",
+                key=f"{prefix}_cambio"
+            )
+
+            dias = st.number_input(
+                "Período (dias em pastejo)", value=365, min_value=1, step=1,
+                key=f"{prefix}_dias"
+            )
+            gmd = st.number_input(
+                "Ganho médio diário (kg/dia)", value=0.490, min_value=0.0, step=0.01, format="%.2f",
+                key=f"{prefix}_gmd"
+            )
+
+            custo_aluguel = st.number_input(
+                "Custo aluguel (US$/mês)", value=5.40, min_value=0.0, step=0.1, format="%.2f",
+                key=f"{prefix}_custo_aluguel"
+            )
+            custo_nutricional = st.number_input(
+                "Custo nutrição (US$/mês)", value=4.0, min_value=0.0, step=0.1, format="%.2f",
+                key=f"{prefix}_custo_nutricional"
+            )
+            custo_operacional = st.number_input(
+                "Custo operações (US$/mês)", value=3.44, min_value=0.0, step=0.1, format="%.2f",
+                key=f"{prefix}_custo_operacional"
+            )
+
+            frete = st.number_input(
+                "Frete (US$/cab)", value=8.0, min_value=0.0, step=0.5, format="%.2f",
+                key=f"{prefix}_frete"
+            )
+            comissao = st.number_input(
+                "Comissão (US$/cab)", value=4.0, min_value=0.0, step=0.5, format="%.2f",
+                key=f"{prefix}_comissao"
+            )
+
+            juros_anual = st.number_input(
+                "Juros anual (%)", value=8.5, min_value=0.0, step=0.1, format="%.2f",
+                key=f"{prefix}_juros_anual"
+            ) / 100.0
+
+            preco_venda_kg = st.number_input(
+                "Preço venda (US$/kg PV)", value=2.40, min_value=0.0, step=0.01, format="%.2f",
+                key=f"{prefix}_preco_venda_kg"
+            )
 
     # ==============================
-    # QUADRO DE COMPRA
+    # CÁLCULOS
     # ==============================
-    st.subheader("📋 Parâmetros de Compra")
-    st.write(f"💱 Câmbio: **₲ {cambio:,.0f}/US$**")
-    st.write(f"🐄 Preço bezerro: **₲ {preco_compra_pyg:,.0f}/kg PV**")
-    st.write(f"💵 Preço bezerro: **${preco_compra_usd_kg:.2f}/kg PV**")
-    st.write(f"🏷️ Preço de venda: **${preco_venda_kg:.2f}/kg PV**")
-    st.write(f"📊 Ágio: **{agio:.2f}%**")
-    st.markdown("---")
+    with secao(f"{prefix}.calculos"):
+        params = {
+            "peso_inicial": peso_inicial,
+            "preco_compra_pyg": preco_compra_pyg,
+            "cambio": cambio,
+            "dias": dias,
+            "gmd": gmd,
+            "custo_aluguel": custo_aluguel,
+            "custo_nutricional": custo_nutricional,
+            "custo_operacional": custo_operacional,
+            "frete": frete,
+            "comissao": comissao,
+            "juros_anual": juros_anual,
+            "preco_venda_kg": preco_venda_kg,
+        }
+        resultado = cenario_recria(**params)
+
+        valor_compra_usd = resultado["valor_compra_usd"]
+        preco_compra_usd_kg = resultado["preco_compra_usd_kg"]
+        agio = resultado["agio"]
+
+        peso_final = resultado["peso_final"]
+        gpv = resultado["gpv"]
+
+        custo_total_periodo = resultado["custo_total_periodo"]
+        custo_total = resultado["custo_total"]
+
+        receita = resultado["receita"]
+        juros_valor = resultado["juros_valor"]
+        lucro = resultado["lucro"]
+
+        margem_periodo = resultado["margem_periodo"]
+        margem_mensal = resultado["margem_mensal"]
+        roi = resultado["roi"]
+        roi_mensal = resultado["roi_mensal"]
+        roi_custo = resultado["roi_custo"]
+        roi_custo_mensal = resultado["roi_custo_mensal"]
+
+        data_inicial = datetime.date.today()
+        data_final = data_inicial + datetime.timedelta(days=int(dias))
 
     # ==============================
-    # SAÍDAS EM 3 COLUNAS
+    # QUADRO DE COMPRA
     # ==============================
-    col1, col2, col3 = st.columns([1.2, 1.2, 1.2])
-
-    with col1:
-        st.subheader("⚖️ Indicadores Zootécnicos")
-        st.write(f"📆 Data inicial: **{data_inicial.strftime('%d/%m/%Y')}**")
-        st.write(f"📆 Data final: **{data_final.strftime('%d/%m/%Y')}**")
-        st.write(f"📆 Dias em pastejo: **{dias}**")
-        st.write(f"🐄 Peso inicial: **{peso_inicial:.2f} kg**")
-        st.write(f"⚖️ Peso final: **{peso_final:.2f} kg**")
-        st.write(f"➕ GPV: **{gpv:.2f} kg**")
-        st.write(f"📈 GMD: **{gmd:.2f} kg/dia**")
-
-    with col2:
-        st.subheader("💰 Custos Detalhados")
-
-        st.markdown("<h5>🐂 Custos de Compra</h5>", unsafe_allow_html=True)
-        st.write(f"• Custo do animal: **${valor_compra_usd:,.2f}**")
-        st.write(f"• 🚚 Frete: **${frete:.2f}**")
-        st.write(f"• 🤝 Comissão: **${comissao:.2f}**")
-
-        st.markdown("<h5>🌱 Custos Variáveis de Produção</h5>", unsafe_allow_html=True)
-        st.write(f"• Custo aluguel/mês: **${custo_aluguel:.2f}**")
-        st.write(f"• Custo nutrição/mês: **${custo_nutricional:.2f}**")
-        st.write(f"• Custo operações/mês: **${custo_operacional:.2f}**")
-
-        st.markdown("<h5>📊 Totais</h5>", unsafe_allow_html=True)
-        st.write(f"• 🗓️ Custo total período: **${custo_total_periodo:,.2f}**")
-        st.write(f"• 🏦 Juros sobre compra do animal: **${juros_valor:.2f}**")
-        st.write(f"• 🔴 **Custo total: ${custo_total:,.2f}**")
-
-    with col3:
-        st.subheader("📊 Resultado Econômico")
-        st.write(f"💵 Receita de venda: **${receita:,.2f}**")
-        st.markdown(f"🟢 <span style='color:green'>**Lucro líquido: ${lucro:,.2f}**</span>", unsafe_allow_html=True)
-        st.write(f"📈 Margem de lucro: **{margem_periodo:.2f}%**")
-        st.write(f"📆 Margem mensal: **{margem_mensal:.2f}%**")
-        st.write(f"📊 Retorno sobre investimento: **{roi:.2f}%**")
-        st.write(f"📆 ROI mensal: **{roi_mensal:.2f}%/mês**")
-        st.write(f"📊 Retorno sobre custo total: **{roi_custo:.2f}%**")
-        st.write(f"📆 ROI mensal sobre custo total: **{roi_custo_mensal:.2f}%/mês**")
+    with secao(f"{prefix}.saidas"):
+        st.subheader("📋 Parâmetros de Compra")
+        st.write(f"💱 Câmbio: **₲ {cambio:,.0f}/US$**")
+        st.write(f"🐄 Preço bezerro: **₲ {preco_compra_pyg:,.0f}/kg PV**")
+        st.write(f"💵 Preço bezerro: **${preco_compra_usd_kg:.2f}/kg PV**")
+        st.write(f"🏷️ Preço de venda: **${preco_venda_kg:.2f}/kg PV**")
+        st.write(f"📊 Ágio: **{agio:.2f}%**")
+        st.markdown("---")
+
+        # ==============================
+        # SAÍDAS EM 3 COLUNAS
+        # ==============================
+        col1, col2, col3 = st.columns([1.2, 1.2, 1.2])
+
+        with col1:
+            st.subheader("⚖️ Indicadores Zootécnicos")
+            st.write(f"📆 Data inicial: **{data_inicial.strftime('%d/%m/%Y')}**")
+            st.write(f"📆 Data final: **{data_final.strftime('%d/%m/%Y')}**")
+            st.write(f"📆 Dias em pastejo: **{dias}**")
+            st.write(f"🐄 Peso inicial: **{peso_inicial:.2f} kg**")
+            st.write(f"⚖️ Peso final: **{peso_final:.2f} kg**")
+            st.write(f"➕ GPV: **{gpv:.2f} kg**")
+            st.write(f"📈 GMD: **{gmd:.2f} kg/dia**")
+
+        with col2:
+            st.subheader("💰 Custos Detalhados")
+
+            st.markdown("<h5>🐂 Custos de Compra</h5>", unsafe_allow_html=True)
+            st.write(f"• Custo do animal: **${valor_compra_usd:,.2f}**")
+            st.write(f"• 🚚 Frete: **${frete:.2f}**")
+            st.write(f"• 🤝 Comissão: **${comissao:.2f}**")
+
+            st.markdown("<h5>🌱 Custos Variáveis de Produção</h5>", unsafe_allow_html=True)
+            st.write(f"• Custo aluguel/mês: **${custo_aluguel:.2f}**")
+            st.write(f"• Custo nutrição/mês: **${custo_nutricional:.2f}**")
+            st.write(f"• Custo operações/mês: **${custo_operacional:.2f}**")
+
+            st.markdown("<h5>📊 Totais</h5>", unsafe_allow_html=True)
+            st.write(f"• 🗓️ Custo total período: **${custo_total_periodo:,.2f}**")
+            st.write(f"• 🏦 Juros sobre compra do animal: **${juros_valor:.2f}**")
+            st.write(f"• 🔴 **Custo total: ${custo_total:,.2f}**")
+
+        with col3:
+            st.subheader("📊 Resultado Econômico")
+            st.write(f"💵 Receita de venda: **${receita:,.2f}**")
+            st.markdown(f"🟢 <span style='color:green'>**Lucro líquido: ${lucro:,.2f}**</span>", unsafe_allow_html=True)
+            st.write(f"📈 Margem de lucro: **{margem_periodo:.2f}%**")
+            st.write(f"📆 Margem mensal: **{margem_mensal:.2f}%**")
+            st.write(f"📊 Retorno sobre investimento: **{roi:.2f}%**")
+            st.write(f"📆 ROI mensal: **{roi_mensal:.2f}%/mês**")
+            st.write(f"📊 Retorno sobre custo total: **{roi_custo:.2f}%**")
+            st.write(f"📆 ROI mensal sobre custo total: **{roi_custo_mensal:.2f}%/mês**")
 
 
 
@@ -170,6 +381,8 @@ def render_recria(prefix: str = "recria"):
         "peso_final": peso_final,
         "preco_venda_kg": preco_venda_kg
     }
+    st.session_state["recria_params"] = params
+    render_cenarios("recria", params, prefix)
 
 
 
@@ -180,186 +393,22 @@ def render_recria(prefix: str = "recria"):
     # ==============================
     # PDF EXPORT
     # ==============================
-    def gerar_pdf():
-        buffer = io.BytesIO()
-        doc = SimpleDocTemplate(
-            buffer,
-            pagesize=A4,
-            leftMargin=2 * cm, rightMargin=2 * cm,
-            topMargin=2 * cm, bottomMargin=2 * cm
-        )
-
-        styles = getSampleStyleSheet()
-        styles.add(ParagraphStyle(
-            name="TituloSecao",
-            fontSize=12, leading=14,
-            textColor=colors.HexColor("#003366"),
-            spaceBefore=8, spaceAfter=8
-        ))
-
-        elementos = []
-        elementos.append(Paragraph("Relatório de Viabilidade Econômica – Recria a Pasto", styles["Heading1"]))
-
-        elementos.append(Paragraph("Parâmetros de Compra", styles["TituloSecao"]))
-        tabela_params = Table([
-            ["Câmbio (₲/US$)", f"{cambio:,.0f}"],
-            ["Preço bezerro (₲/kg PV)", f"{preco_compra_pyg:,.0f}"],
-            ["Preço bezerro (US$/kg PV)", f"{preco_compra_usd_kg:.2f}"],
-            ["Preço de venda (US$/kg PV)", f"{preco_venda_kg:.2f}"],
-            ["Ágio (%)", f"{agio:.2f}%"],
-        ], colWidths=[doc.width * 0.55, doc.width * 0.35])
-        tabela_params.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.5, colors.black)]))
-        elementos.append(tabela_params)
-        elementos.append(Spacer(1, 12))
-
-        elementos.append(Paragraph("Indicadores Zootécnicos", styles["TituloSecao"]))
-        tabela_ind = Table([
-            ["Data inicial", data_inicial.strftime('%d/%m/%Y')],
-            ["Data final", data_final.strftime('%d/%m/%Y')],
-            ["Dias em pastejo", f"{dias}"],
-            ["Peso inicial (kg)", f"{peso_inicial:.2f}"],
-            ["Peso final (kg)", f"{peso_final:.2f}"],
-            ["GPV (kg)", f"{gpv:.2f}"],
-            ["GMD (kg/dia)", f"{gmd:.2f}"],
-        ], colWidths=[doc.width * 0.55, doc.width * 0.35])
-        tabela_ind.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.5, colors.black)]))
-        elementos.append(tabela_ind)
-        elementos.append(Spacer(1, 12))
-
-        elementos.append(Paragraph("Custos Detalhados", styles["TituloSecao"]))
-        tbl_custos = Table([
-            ["Custo do animal (US$)", f"{valor_compra_usd:,.2f}"],
-            ["Frete (US$)", f"{frete:.2f}"],
-            ["Comissão (US$)", f"{comissao:.2f}"],
-            ["Custo aluguel/mês (US$)", f"{custo_aluguel:.2f}"],
-            ["Custo nutrição/mês (US$)", f"{custo_nutricional:.2f}"],
-            ["Custo operações/mês (US$)", f"{custo_operacional:.2f}"],
-            ["Custo total período (US$)", f"{custo_total_periodo:,.2f}"],
-            ["Juros sobre compra do animal (US$)", f"{juros_valor:.2f}"],
-            ["Custo total (US$)", f"{custo_total:,.2f}"],
-        ], colWidths=[doc.width * 0.55, doc.width * 0.35])
-        tbl_custos.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.5, colors.black)]))
-        elementos.append(tbl_custos)
-        elementos.append(Spacer(1, 12))
-
-        elementos.append(Paragraph("Resultado Econômico", styles["TituloSecao"]))
-        tbl_res = Table([
-            ["Receita (US$)", f"{receita:,.2f}"],
-            ["Lucro líquido (US$)", f"{lucro:,.2f}"],
-            ["Margem período (%)", f"{margem_periodo:.2f}%"],
-            ["Margem mensal (%)", f"{margem_mensal:.2f}%"],
-            ["ROI (%)", f"{roi:.2f}%"],
-            ["ROI mensal (%)", f"{roi_mensal:.2f}%"],
-            ["ROI sobre custo total (%)", f"{roi_custo:.2f}%"],
-            ["ROI mensal sobre custo total (%)", f"{roi_custo_mensal:.2f}%"],
-        ], colWidths=[doc.width * 0.55, doc.width * 0.35])
-        tbl_res.setStyle(TableStyle([("GRID", (0, 0), (-1, -1), 0.5, colors.black)]))
-        elementos.append(tbl_res)
-
-        doc.build(elementos)
-        buffer.seek(0)
-        return buffer
-
-    st.markdown("---")
-    if st.button("📥 Exportar Relatório PDF", key=f"{prefix}_btn_pdf"):
-        pdf_final = gerar_pdf()
+    with secao(f"{prefix}.pdf"):
+        st.markdown("---")
+        # O PDF só é diagramado quando o download é de fato pedido (callable),
+        # e fica em cache por cenário em relatorio_pdf.
         st.download_button(
-            "⬇️ Baixar PDF",
-            data=pdf_final,
+            "📥 Exportar Relatório PDF",
+            data=functools.partial(_pdf_recria, data_inicial=data_inicial, **params),
             file_name="recria_pasto.pdf",
             mime="application/pdf",
+            on_click="ignore",
             key=f"{prefix}_download_pdf"
         )
 
     # ==============================
-    # Sensibilidade
+    # Sensibilidade e impacto (fragmentos: os sliders não reexecutam o App inteiro)
     # ==============================
-    st.subheader("📉 Análise de Sensibilidade Interativa")
-
-    colA, colB, colC = st.columns(3)
-
-    with colA:
-        sens_preco_compra = st.slider(
-            "Preço compra (₲/kg PV)",
-            min_value=15000, max_value=25000,
-            value=int(preco_compra_pyg), step=100,
-            key=f"{prefix}_sens_preco_compra"
-        )
-
-    with colB:
-        sens_preco_venda = st.slider(
-            "Preço venda (US$/kg PV)",
-            min_value=1.5, max_value=3.5,
-            value=float(preco_venda_kg), step=0.01,
-            key=f"{prefix}_sens_preco_venda"
-        )
-
-    with colC:
-        sens_gmd = st.slider(
-            "GMD (kg/dia)",
-            min_value=0.3, max_value=1.5,
-            value=float(gmd), step=0.01,
-            key=f"{prefix}_sens_gmd"
-        )
-
-    valor_compra_usd_sens = (peso_inicial * sens_preco_compra) / cambio if cambio > 0 else 0
-    peso_final_sens = peso_inicial + sens_gmd * dias
-    receita_sens = peso_final_sens * sens_preco_venda
-    custo_total_sens = valor_compra_usd_sens + custo_total_periodo + frete + comissao
-    juros_sens = valor_compra_usd_sens * juros_anual * (dias / 365)
-    lucro_sens = receita_sens - custo_total_sens - juros_sens
-
-    st.markdown("### 🔮 Resultado do Cenário")
-    st.write(f"🐂 Preço compra: **₲ {sens_preco_compra:,.0f} | ${(sens_preco_compra/cambio) if cambio>0 else 0:.2f}/kg PV**")
-    st.write(f"💵 Preço venda: **${sens_preco_venda:.2f}/kg PV**")
-    st.write(f"📈 GMD: **{sens_gmd:.2f} kg/dia**")
-    st.write(f"🟢 Lucro líquido: **${lucro_sens:,.2f}**")
-
-    st.subheader("📈 Análise de Impacto")
-
-    incremento_gmd = 0.01  # 10 g/dia
-    ganho_extra = incremento_gmd * dias
-    lucro_extra = ganho_extra * preco_venda_kg
-
-    st.markdown(f"- ⚖️ A cada **+10 g/dia** no ganho de peso, o lucro **aumenta** em ~ **${lucro_extra:,.2f}** no período de **{dias} dias**.")
-    st.markdown(f"- ⚖️ A cada **-10 g/dia** no ganho de peso, o lucro **reduz** em ~ **${lucro_extra:,.2f}** no período de **{dias} dias**.")
-    st.markdown("---")
-
-    colX, colY = st.columns(2)
-    with colX:
-        variacao_compra = st.slider(
-            "Variação (%) no valor de compra",
-            min_value=0.0, max_value=10.0,
-            value=2.0, step=0.1,
-            key=f"{prefix}_var_compra"
-        )
-    with colY:
-        variacao_venda = st.slider(
-            "Variação (%) no preço de venda",
-            min_value=0.0, max_value=10.0,
-            value=2.0, step=0.1,
-            key=f"{prefix}_var_venda"
-        )
-
-    novo_valor_compra = valor_compra_usd * (1 + variacao_compra / 100)
-    novo_juros = novo_valor_compra * juros_anual * (dias / 365)
-    novo_custo_total = novo_valor_compra + custo_total_periodo + frete + comissao + novo_juros
-    novo_lucro = receita - novo_custo_total
-
-    impacto_compra_abs = lucro - novo_lucro
-    impacto_compra_pct = (impacto_compra_abs / lucro * 100) if lucro != 0 else 0
-    st.markdown(
-        f"- 🐂 A cada **+{variacao_compra:.1f}%** no valor de compra do animal, "
-        f"o lucro **reduz** em ~ **${impacto_compra_abs:,.2f} ({impacto_compra_pct:.2f}%)**."
-    )
-
-    novo_preco_venda = preco_venda_kg * (1 + variacao_venda / 100)
-    nova_receita = peso_final * novo_preco_venda
-    novo_lucro_venda = nova_receita - novo_custo_total
-
-    impacto_venda_abs = novo_lucro_venda - novo_lucro
-    impacto_venda_pct = (impacto_venda_abs / novo_lucro * 100) if novo_lucro != 0 else 0
-    st.markdown(
-        f"- 💵 A cada **+{variacao_venda:.1f}%** no preço de venda, "
-        f"o lucro **aumenta** em ~ **${impacto_venda_abs:,.2f} ({impacto_venda_pct:.2f}%)**."
-    )
+    _sensibilidade(prefix, params, resultado)
+    _impacto(prefix, params, resultado)
+    render_tornado("recria", params, prefix)
@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+import uuid
+
+import streamlit as st
+import numpy as np
+import pandas as pd
+
+import instrumentacao
+import tarefas
+from instrumentacao import secao
+from monte_carlo import distribuicoes_padrao, simular_risco
+
+
+MODOS_RISCO = {
+    "Ciclo completo (recria + confinamento)": "ciclo",
+    "Recria a pasto": "recria",
+    "Confinamento": "confinamento",
+}
+
+
+def _rodar_simulacao(modo, base_recria, base_confinamento, variacao, n, semente, progresso=None,
+                     instrumentar=False):
+    # só o resumo (percentis + histograma) volta da tarefa: os sorteios brutos
+    # ocupariam até 40 MB por resultado guardado. Roda na thread da fila, então
+    # a instrumentação da sessão (?debug=1) vem por ``instrumentar``.
+    instrumentacao.iniciar_execucao(ativo=instrumentar)
+    distribuicoes = distribuicoes_padrao(modo, base_recria, base_confinamento, variacao)
+    with secao("risco.monte_carlo"):
+        resultado = simular_risco(
+            modo, base_recria, base_confinamento, distribuicoes, n=n, semente=semente,
+            progresso=progresso, manter_lucros=False,
+        )
+    resultado["distribuicoes"] = distribuicoes
+    return resultado
+
+
+@st.fragment(run_every=1.0)
+def _acompanhar(id_tarefa):
+    # consulta a tarefa a cada segundo; ao terminar, reexecuta o App para exibir o resultado
+    info = tarefas.estado(id_tarefa)
+    if info is None or info["estado"] not in tarefas.PENDENTES:
+        st.rerun()
+    st.progress(info["progresso"], text=f"{info['descricao']} — {info['estado'].replace('_', ' ')}")
+
+
+@st.fragment(run_every=1.0)
+def _aguardar_vaga(dono):
+    # uma tarefa cancelada segura a vaga até parar; quando liberar, reexecuta o App para reenviar
+    if tarefas.pendentes(dono) < tarefas.MAX_POR_DONO:
+        st.rerun()
+
+
+def _simular_em_segundo_plano(prefix, modo, base_recria, base_confinamento, variacao, n, semente):
+    """Envia a simulação à fila (uma por combinação de entradas) e devolve o resultado quando pronto.
+
+    O resultado lido sai da fila e fica na sessão; entradas novas cancelam a
+    tarefa anterior, mesmo em execução.
+    """
+    chave = (modo, variacao, n, semente, tuple(base_recria.items()), tuple(base_confinamento.items()))
+    pronto = st.session_state.get(f"{prefix}_resultado")
+    if pronto is not None and pronto[0] == chave:
+        return pronto[1]
+
+    tarefa = st.session_state.get(f"{prefix}_tarefa")
+    if tarefa is None or tarefa[0] != chave or tarefas.estado(tarefa[1]) is None:
+        if tarefa is not None:
+            tarefas.cancelar(tarefa[1])
+        dono = st.session_state.setdefault("sessao_id", uuid.uuid4().hex)
+        try:
+            id_tarefa = tarefas.enviar(
+                _rodar_simulacao, modo, base_recria, base_confinamento, variacao, n, semente,
+                dono=dono, descricao=f"Monte Carlo ({n:,} sorteios)", instrumentar=instrumentacao.ativo(),
+            )
+        except tarefas.LimiteTarefas as erro:
+            st.warning(f"{erro}. Aguarde as simulações em andamento.")
+            _aguardar_vaga(dono)
+            return None
+        tarefa = (chave, id_tarefa)
+        st.session_state[f"{prefix}_tarefa"] = tarefa
+
+    info = tarefas.estado(tarefa[1])
+    if info["estado"] == "concluida":
+        resultado = tarefas.resultado(tarefa[1], liberar=True)
+        del st.session_state[f"{prefix}_tarefa"]
+        if resultado is None:
+            # expirou sem ser lido: envia de novo
+            return _simular_em_segundo_plano(prefix, modo, base_recria, base_confinamento, variacao, n, semente)
+        st.session_state[f"{prefix}_resultado"] = (chave, resultado)
+        return resultado
+    if info["estado"] == "erro":
+        st.error(f"Falha na simulação: {info['erro']}")
+        return None
+    _acompanhar(tarefa[1])
+    return None
+
+
+@st.fragment
+def render_risco(prefix: str = "risco"):
+    st.markdown("<h2 style='text-align:center;'>🎲 Análise de Risco (Monte Carlo)</h2>", unsafe_allow_html=True)
+    st.markdown("---")
+
+    # o Monte Carlo só roda quando ligado: as abas rodam em toda execução do App
+    if not st.toggle("🎲 Rodar simulação Monte Carlo", key=f"{prefix}_ativo"):
+        st.caption("Ligue a simulação para sortear os cenários em torno das abas Recria e Confinamento.")
+        return
+
+    base_recria = st.session_state.get("recria_params")
+    base_confinamento = st.session_state.get("confinamento_params")
+    if base_recria is None or base_confinamento is None:
+        st.warning("Preencha as abas Recria e Confinamento para definir o cenário base.")
+        return
+
+    st.info("GMD, preço de venda, câmbio e custo de alimentação são sorteados em torno "
+            "dos valores das abas Recria e Confinamento (distribuição normal).")
+
+    with secao(f"{prefix}.entradas"):
+        colA, colB, colC, colD = st.columns(4)
+        with colA:
+            modo = MODOS_RISCO[st.selectbox("Simulação", list(MODOS_RISCO), key=f"{prefix}_modo")]
+        with colB:
+            n = st.number_input(
+                "Sorteios", value=1_000_000, min_value=10_000, max_value=5_000_000,
+                step=100_000, key=f"{prefix}_n"
+            )
+        with colC:
+            variacao = st.slider(
+                "Desvio padrão (% do valor base)", min_value=1.0, max_value=30.0,
+                value=10.0, step=0.5, key=f"{prefix}_variacao"
+            ) / 100
+        with colD:
+            semente = st.number_input("Semente", value=42, min_value=0, step=1, key=f"{prefix}_semente")
+
+    with secao(f"{prefix}.simulacao"):
+        # a simulação roda no pool de tarefas: a sessão nunca espera os sorteios
+        resultado = _simular_em_segundo_plano(
+            prefix, modo, base_recria, base_confinamento, variacao, int(n), int(semente)
+        )
+    if resultado is None:
+        return
+
+    with secao(f"{prefix}.saidas"):
+        col1, col2, col3, col4, col5 = st.columns(5)
+        col1.metric("Lucro P5", f"${resultado['p5']:,.2f}")
+        col2.metric("Lucro P50", f"${resultado['p50']:,.2f}")
+        col3.metric("Lucro P95", f"${resultado['p95']:,.2f}")
+        col4.metric("Prob. de prejuízo", f"{resultado['prob_prejuizo'] * 100:.2f}%")
+        col5.metric(f"VaR {resultado['nivel'] * 100:.0f}%", f"${resultado['var']:,.2f}")
+
+        contagens, limites = resultado["histograma"]
+        st.bar_chart(
+            pd.DataFrame({"Sorteios": contagens}, index=np.round((limites[:-1] + limites[1:]) / 2, 2)),
+            x_label="Lucro (US$)", y_label="Sorteios",
+        )
+        st.caption(
+            f"{int(n):,} sorteios · média ${resultado['media']:,.2f} · variáveis sorteadas: "
+            + ", ".join(resultado["distribuicoes"])
+        )
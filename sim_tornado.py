@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+import streamlit as st
+import altair as alt
+import pandas as pd
+
+from instrumentacao import secao
+from tornado import pontos_equilibrio, tornado
+
+
+# Moeda dos resultados de cada aba (a recria fecha em US$).
+MOEDAS = {"recria": "US$", "confinamento": "$"}
+
+ROTULOS_PARAMETROS = {
+    "recria": {
+        "peso_inicial": "Peso inicial (kg)",
+        "preco_compra_pyg": "Preço compra (₲/kg PV)",
+        "cambio": "Câmbio (₲/US$)",
+        "dias": "Período (dias)",
+        "gmd": "GMD (kg/dia)",
+        "custo_aluguel": "Custo aluguel (US$/mês)",
+        "custo_nutricional": "Custo nutrição (US$/mês)",
+        "custo_operacional": "Custo operações (US$/mês)",
+        "frete": "Frete (US$/cab)",
+        "comissao": "Comissão (US$/cab)",
+        "juros_anual": "Juros anual (fração)",
+        "preco_venda_kg": "Preço venda (US$/kg PV)",
+    },
+    "confinamento": {
+        "peso_inicial": "Peso inicial (kg)",
+        "ganho_dia": "Ganho de peso/dia (kg)",
+        "dias": "Período de trato (dias)",
+        "rendimento_ini": "Rendimento inicial (fração)",
+        "rendimento_fim": "Rendimento final (fração)",
+        "preco_compra_kg": "Valor de compra ($/kg PV)",
+        "preco_venda_kg": "Valor de venda ($/kg carcaça)",
+        "diaria": "Custo nutricional ($/dia)",
+        "servicos_operacionais": "Serviços operacionais ($/animal/dia)",
+        "custos_extras": "Custos extras ($/animal)",
+        "juros_mes": "Juros ao mês (fração)",
+    },
+}
+
+
+def _grafico_tornado(tabela, lucro_base, moeda):
+    # barras horizontais a partir do lucro base: uma para -X%, outra para +X%
+    dados = pd.concat([
+        pd.DataFrame({"Parâmetro": tabela["Parâmetro"], "Cenário": "-X%", "lucro": tabela["Lucro -X%"]}),
+        pd.DataFrame({"Parâmetro": tabela["Parâmetro"], "Cenário": "+X%", "lucro": tabela["Lucro +X%"]}),
+    ])
+    dados["base"] = lucro_base
+    return alt.Chart(dados).mark_bar().encode(
+        y=alt.Y("Parâmetro:N", sort=list(tabela["Parâmetro"]), title=None),
+        x=alt.X("lucro:Q", title=f"Lucro ({moeda})"),
+        x2="base:Q",
+        color=alt.Color("Cenário:N", scale=alt.Scale(domain=["-X%", "+X%"], range=["#d62728", "#2ca02c"])),
+        tooltip=["Parâmetro:N", "Cenário:N", alt.Tooltip("lucro:Q", format=",.2f")],
+    )
+
+
+@st.fragment
+def render_tornado(etapa, params, prefix):
+    """Tornado (±X% em cada entrada) e equilíbrio de cada entrada, sob um toggle."""
+    st.markdown("---")
+    if not st.toggle("🌪️ Tornado e pontos de equilíbrio (todas as entradas)", key=f"{prefix}_tornado"):
+        return
+
+    with secao(f"{prefix}.tornado"):
+        variacao = st.slider(
+            "Variação (±%) aplicada a cada entrada", min_value=1.0, max_value=50.0,
+            value=10.0, step=1.0, key=f"{prefix}_tornado_variacao"
+        ) / 100
+
+        resultado = tornado(etapa, params, variacao)
+        equilibrio = pontos_equilibrio(etapa, params)
+        rotulos = ROTULOS_PARAMETROS[etapa]
+        moeda = MOEDAS[etapa]
+
+        tabela = pd.DataFrame({
+            "Parâmetro": [rotulos[c] for c in resultado["campos"]],
+            "Valor base": resultado["valor_base"],
+            "Lucro -X%": resultado["baixo"],
+            "Lucro +X%": resultado["alto"],
+            "Amplitude": resultado["amplitude"],
+            "Elasticidade": resultado["elasticidade"],
+            "Equilíbrio (lucro = 0)": [equilibrio[c] for c in resultado["campos"]],
+        })
+
+        st.altair_chart(_grafico_tornado(tabela, resultado["indicador_base"], moeda), width="stretch")
+        st.dataframe(
+            tabela.style.format({
+                "Valor base": "{:,.4g}", "Lucro -X%": "{:,.2f}", "Lucro +X%": "{:,.2f}",
+                "Amplitude": "{:,.2f}", "Elasticidade": "{:.2f}", "Equilíbrio (lucro = 0)": "{:,.4g}",
+            }, na_rep="—"),
+            hide_index=True, width="stretch",
+        )
+        st.caption(
+            f"Lucro base: {moeda}{resultado['indicador_base']:,.2f}. Elasticidade: variação % do lucro "
+            "por 1% na entrada. Equilíbrio: valor da entrada que zera o lucro com as demais fixas "
+            "(— quando não existe)."
+        )
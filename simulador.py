@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+"""API e CLI sem interface (headless) dos simuladores.
+
+Importa apenas NumPy e os motores; Streamlit nunca é carregado e reportlab e
+pandas só entram nos caminhos de PDF, Parquet e streaming (``--bloco``).
+
+Uso:
+    python -m simulador recria lotes.csv -o resultado.csv
+    python -m simulador confinamento animais.json
+    python -m simulador ciclo cenarios.csv -o ciclo.json
+    python -m simulador recria lotes.parquet -o resultado.parquet --bloco 100000
+    python -m simulador relatorios lotes.csv relatorios/ --tipo recria
+    python -m simulador recria lotes.csv --tabela-cambio cambio.csv --datas 2026-01-01,2026-07-01 --moeda BRL
+    python -m simulador confinamento lotes.csv --diario -o diario.csv
+
+No ``ciclo`` a recria alimenta o confinamento como no link entre as abas
+(peso final → peso inicial, preço de venda → preço de compra); os demais campos
+do confinamento levam o prefixo ``conf_`` na entrada e na saída.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+
+import numpy as np
+
+from confinamento_engine import PADROES_CONFINAMENTO, calcular_confinamento
+from modelo_diario import (
+    PADROES_DIARIO_CONFINAMENTO, PADROES_DIARIO_RECRIA, resumo_confinamento_diario, resumo_recria_diaria,
+)
+from moedas import carregar_tabela, reprecificar_confinamento, reprecificar_recria
+from pipeline import PREFIXO_CONFINAMENTO, evaluate_ciclo
+from recria_engine import PADROES_RECRIA, evaluate_recria
+
+
+def _numero(valor, chave, indice):
+    try:
+        return float(valor)
+    except (TypeError, ValueError):
+        raise ValueError(f"Valor não numérico em {chave!r} (linha {indice + 1}): {valor!r}") from None
+
+
+def _vazio(valor):
+    # células vazias: ``None``/"" em JSON e CSV, NaN nas linhas lidas de Parquet
+    if isinstance(valor, float):
+        return bool(np.isnan(valor))
+    return valor is None or (isinstance(valor, str) and valor == "")
+
+
+def _colunas(linhas, padroes, prefixo=""):
+    params = {}
+    for campo, padrao in padroes.items():
+        chave = prefixo + campo
+        params[campo] = np.array(
+            [padrao if _vazio(linha.get(chave)) else _numero(linha[chave], chave, i)
+             for i, linha in enumerate(linhas)],
+            dtype=np.float64,
+        )
+    return params
+
+
+def _linhas(colunas, prefixo="", entrada=None):
+    # com ``entrada``, os campos que não são parâmetros (lote, cliente...) de
+    # cada linha vêm antes e inalterados, como em ``lotes.avaliar_tabela``
+    nomes = list(colunas)
+    valores = np.column_stack([np.asarray(colunas[nome], dtype=np.float64) for nome in nomes])
+    calculadas = [
+        {prefixo + nome: valor for nome, valor in zip(nomes, linha)}
+        for linha in valores.tolist()
+    ]
+    if entrada is None:
+        return calculadas
+    return [
+        {**{chave: valor for chave, valor in original.items() if chave not in linha}, **linha}
+        for original, linha in zip(entrada, calculadas)
+    ]
+
+
+def simular_recria(linhas):
+    """Avalia cenários de recria (lista de dicts) e devolve entradas + indicadores."""
+    params = _colunas(linhas, PADROES_RECRIA)
+    return _linhas({**params, **evaluate_recria(**params)}, entrada=linhas)
+
+
+def simular_confinamento(linhas):
+    """Avalia cenários de confinamento (lista de dicts) e devolve entradas + indicadores."""
+    params = _colunas(linhas, PADROES_CONFINAMENTO)
+    return _linhas({**params, **calcular_confinamento(**params)}, entrada=linhas)
+
+
+def simular_ciclo(linhas):
+    """Recria → confinamento encadeados, com o confinamento prefixado por ``conf_``.
+
+    Inclui os indicadores do ciclo completo (``lucro_ciclo``, ``roi_ciclo``...).
+    """
+    params_recria = _colunas(linhas, PADROES_RECRIA)
+    params_conf = _colunas(linhas, PADROES_CONFINAMENTO, PREFIXO_CONFINAMENTO)
+    resultado = evaluate_ciclo(params_recria, params_conf)
+
+    params_conf["peso_inicial"] = resultado["peso_final"]
+    params_conf["preco_compra_kg"] = params_recria["preco_venda_kg"]
+    entradas = {**params_recria, **{PREFIXO_CONFINAMENTO + nome: valor for nome, valor in params_conf.items()}}
+    return _linhas({**entradas, **resultado}, entrada=linhas)
+
+
+SIMULACOES = {
+    "recria": simular_recria,
+    "confinamento": simular_confinamento,
+    "ciclo": simular_ciclo,
+}
+
+
+MODELOS_DIARIOS = {
+    # etapa: (padrões, resumo, campo do GMD final -> GMD inicial)
+    "recria": ({**PADROES_RECRIA, **PADROES_DIARIO_RECRIA}, resumo_recria_diaria, ("gmd_fim", "gmd")),
+    "confinamento": (
+        {**PADROES_CONFINAMENTO, **PADROES_DIARIO_CONFINAMENTO}, resumo_confinamento_diario,
+        ("ganho_dia_fim", "ganho_dia"),
+    ),
+}
+
+
+PREFIXO_FINAL = "final_"
+
+
+def simular_diario(tipo, linhas):
+    """Cenários pelo modelo diário: entradas + valores do último dia de cada um.
+
+    ``dias`` precisa ser inteiro; o GMD final vazio repete o GMD inicial. Os
+    valores do último dia levam o prefixo ``final_`` (``final_peso``,
+    ``final_gmd``...), para nunca sobrescrever uma entrada de mesmo nome.
+    """
+    if tipo not in MODELOS_DIARIOS:
+        raise ValueError(f"Modelo diário não disponível para {tipo!r}")
+    padroes, resumir, (campo_fim, campo_ini) = MODELOS_DIARIOS[tipo]
+    params = _colunas(linhas, {nome: valor for nome, valor in padroes.items() if valor is not None})
+    gmd_fim = _colunas(linhas, {campo_fim: np.nan})[campo_fim]
+    params[campo_fim] = np.where(np.isnan(gmd_fim), params[campo_ini], gmd_fim)
+    final = resumir(params)["final"]
+    return _linhas({**params, **{PREFIXO_FINAL + nome: valor for nome, valor in final.items()}}, entrada=linhas)
+
+
+def simular_em_datas(tipo, linhas, datas, moeda="USD", moeda_entrada="USD", tabela=None):
+    """Cada cenário reprecificado em cada data pela tabela de câmbio.
+
+    Devolve uma linha por cenário × data, com ``data`` e ``moeda``: indicadores
+    e preços/custos de entrada saem em ``moeda`` (só ``preco_compra_pyg`` fica
+    em ₲). Na recria o câmbio vem da tabela; no confinamento os preços de
+    entrada estão em ``moeda_entrada``.
+    """
+    datas = np.asarray(datas, dtype="datetime64[D]")
+    if tipo == "recria":
+        params = _colunas(linhas, PADROES_RECRIA)
+        resultado = reprecificar_recria(params, datas, moeda, tabela)
+    elif tipo == "confinamento":
+        params = _colunas(linhas, PADROES_CONFINAMENTO)
+        resultado = reprecificar_confinamento(params, datas, moeda, moeda_entrada, tabela)
+    else:
+        raise ValueError(f"Reprecificação por data não disponível para {tipo!r}")
+
+    forma = (len(linhas), len(datas))
+    colunas = {nome: np.broadcast_to(np.asarray(valor)[:, np.newaxis], forma).ravel()
+               for nome, valor in params.items() if nome not in resultado}
+    colunas.update({nome: np.broadcast_to(valor, forma).ravel() for nome, valor in resultado.items()})
+    saida = _linhas(colunas, entrada=[linha for linha in linhas for _ in datas])
+    rotulos = [str(data) for data in datas] * len(linhas)
+    for linha, data in zip(saida, rotulos):
+        linha["data"] = data
+        linha["moeda"] = moeda
+    return saida
+
+
+# ==============================
+# ENTRADA / SAÍDA
+# ==============================
+def _cenarios_json(dados):
+    linhas = [dados] if isinstance(dados, dict) else dados
+    if not isinstance(linhas, list) or not all(isinstance(linha, dict) for linha in linhas):
+        raise ValueError("O JSON deve ser um objeto ou uma lista de objetos (um cenário por objeto)")
+    return linhas
+
+
+def ler_linhas(caminho):
+    """Lê cenários de JSON (objeto ou lista), CSV ou Parquet; ``-`` = JSON no stdin.
+
+    Levanta ``ValueError`` se o JSON não for um objeto ou uma lista de objetos.
+    """
+    if caminho == "-":
+        return _cenarios_json(json.load(sys.stdin))
+
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao == ".json":
+        with open(caminho, encoding="utf-8") as arquivo:
+            return _cenarios_json(json.load(arquivo))
+    if extensao == ".csv":
+        with open(caminho, newline="", encoding="utf-8") as arquivo:
+            return list(csv.DictReader(arquivo))
+
+    from lotes import eh_parquet, ler_tabela
+    if eh_parquet(caminho):
+        return ler_tabela(caminho).to_dict(orient="records")
+    raise ValueError(f"Formato de entrada não suportado: {caminho}")
+
+
+def gravar_linhas(linhas, caminho=None):
+    """Grava os resultados em CSV (``.csv``) ou JSON (demais casos / stdout)."""
+    if caminho and os.path.splitext(caminho)[1].lower() == ".csv":
+        with open(caminho, "w", newline="", encoding="utf-8") as arquivo:
+            colunas = dict.fromkeys(chave for linha in linhas for chave in linha)
+            escritor = csv.DictWriter(arquivo, fieldnames=list(colunas))
+            escritor.writeheader()
+            escritor.writerows(linhas)
+        return
+
+    if caminho:
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(linhas, arquivo, ensure_ascii=False, indent=2, default=str)
+    else:
+        json.dump(linhas, sys.stdout, ensure_ascii=False, indent=2, default=str)
+        sys.stdout.write("\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="simulador", description="Simuladores econômicos sem interface.")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    for nome in SIMULACOES:
+        p = sub.add_parser(nome, help=f"Simulação de {nome}")
+        p.add_argument("entrada", help="JSON, CSV ou Parquet com um cenário por linha ('-' = stdin)")
+        p.add_argument("-o", "--saida", default=None, help="Arquivo .csv ou .json (padrão: JSON no stdout)")
+        p.add_argument("--bloco", type=int, default=None,
+                       help="Processa em blocos de N linhas (streaming CSV/Parquet → CSV/Parquet)")
+        p.add_argument("--tabela-cambio", default=None,
+                       help="CSV de câmbio (data, PYG, BRL por US$) para reprecificar em --datas")
+        p.add_argument("--datas", default=None, help="Datas AAAA-MM-DD separadas por vírgula")
+        p.add_argument("--moeda", default="USD", help="Moeda dos resultados (USD, PYG, BRL)")
+        p.add_argument("--moeda-entrada", default="USD", help="Moeda dos preços do confinamento")
+        p.add_argument("--diario", action="store_true",
+                       help="Modelo diário (passo de 1 dia, dias inteiros): valores do último dia (final_*)")
+
+    p = sub.add_parser("relatorios", help="Um relatório PDF por lote")
+    p.add_argument("argumentos", nargs=argparse.REMAINDER)
+
+    args = parser.parse_args(argv)
+
+    if args.comando == "relatorios":
+        from relatorios_lote import main as main_relatorios
+        main_relatorios(args.argumentos)
+        return
+
+    if args.diario:
+        if args.comando not in MODELOS_DIARIOS:
+            parser.error(f"--diario não está disponível para {args.comando}")
+        if args.bloco or args.datas or args.tabela_cambio:
+            parser.error("--diario não combina com --bloco, --datas ou --tabela-cambio")
+        try:
+            linhas = simular_diario(args.comando, ler_linhas(args.entrada))
+        except (OSError, ValueError) as erro:
+            parser.error(str(erro))
+        gravar_linhas(linhas, args.saida)
+        return
+
+    if args.bloco:
+        if not args.saida or args.entrada == "-":
+            parser.error("--bloco exige arquivos de entrada e saída (-o)")
+        from lotes import processar_arquivo
+        try:
+            total = processar_arquivo(args.entrada, args.saida, args.comando, args.bloco)
+        except (OSError, ValueError) as erro:
+            parser.error(str(erro))
+        print(f"{total} linhas gravadas em {args.saida}", file=sys.stderr)
+        return
+
+    if args.tabela_cambio or args.datas:
+        if not (args.tabela_cambio and args.datas):
+            parser.error("--tabela-cambio e --datas devem ser usados juntos")
+        if args.comando == "ciclo":
+            parser.error("--datas está disponível para recria e confinamento, não para ciclo")
+        datas = [data.strip() for data in args.datas.split(",") if data.strip()]
+        try:
+            linhas = simular_em_datas(
+                args.comando, ler_linhas(args.entrada), datas, args.moeda, args.moeda_entrada,
+                carregar_tabela(args.tabela_cambio),
+            )
+        except (OSError, ValueError) as erro:
+            parser.error(str(erro))
+        gravar_linhas(linhas, args.saida)
+        return
+
+    try:
+        linhas = SIMULACOES[args.comando](ler_linhas(args.entrada))
+    except (OSError, ValueError) as erro:
+        parser.error(str(erro))
+    gravar_linhas(linhas, args.saida)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+# -*- coding: utf-8 -*-
+"""Fila de tarefas em segundo plano para o App (hoje, o Monte Carlo da aba Risco).
+
+Um pool local de threads com concorrência limitada executa as tarefas; a
+tabela de tarefas guarda estado, progresso, resultado e erro de cada uma, e o
+App consulta ``estado`` periodicamente em vez de bloquear a sessão.
+
+Os limites vêm de ``SIMULADOR_TRABALHADORES`` (threads do pool, padrão 2) e
+``SIMULADOR_TAREFAS_POR_DONO`` (tarefas pendentes por sessão, padrão 1),
+que precisa ficar abaixo do número de threads para uma sessão não ocupar o
+pool inteiro.
+Funções que aceitam o argumento ``progresso`` recebem um callback chamado
+como ``progresso(feitos, total, ...)``; é nele que uma tarefa cancelada
+durante a execução é interrompida. Resultados não lidos expiram depois de
+``VALIDADE_RESULTADO`` segundos, e ``resultado(..., liberar=True)`` os
+descarta assim que são lidos.
+"""
+import concurrent.futures
+import inspect
+import itertools
+import os
+import threading
+import time
+
+
+MAX_TRABALHADORES = int(os.environ.get("SIMULADOR_TRABALHADORES", "2"))
+MAX_POR_DONO = int(os.environ.get("SIMULADOR_TAREFAS_POR_DONO", "1"))
+if not 1 <= MAX_POR_DONO < max(MAX_TRABALHADORES, 2):
+    raise ValueError(
+        f"SIMULADOR_TAREFAS_POR_DONO ({MAX_POR_DONO}) deve ser ao menos 1 e menor que "
+        f"SIMULADOR_TRABALHADORES ({MAX_TRABALHADORES}), salvo com uma única thread"
+    )
+# Tarefas terminadas mantidas na tabela (as mais antigas saem primeiro).
+MAX_CONCLUIDAS = 200
+# Segundos que o resultado de uma tarefa concluída fica guardado sem ser lido.
+VALIDADE_RESULTADO = 600
+
+PENDENTES = ("na_fila", "executando")
+
+_trava = threading.Lock()
+_tabela = {}
+_contador = itertools.count(1)
+_executor = None
+
+
+class LimiteTarefas(RuntimeError):
+    """O dono já tem ``MAX_POR_DONO`` tarefas pendentes."""
+
+
+class TarefaCancelada(Exception):
+    """Levantada pelo callback de progresso de uma tarefa cancelada."""
+
+
+def _pool():
+    global _executor
+    if _executor is None:
+        _executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=MAX_TRABALHADORES, thread_name_prefix="simulador-tarefa"
+        )
+    return _executor
+
+
+def _atualizar(id_tarefa, **campos):
+    with _trava:
+        if id_tarefa in _tabela:
+            _tabela[id_tarefa].update(campos)
+
+
+def _executar(id_tarefa, funcao, args, kwargs):
+    with _trava:
+        registro = _tabela.get(id_tarefa)
+        if registro is None or registro["estado"] == "cancelada":
+            return None
+        registro.update(estado="executando", iniciada_em=time.time())
+
+    if "progresso" in inspect.signature(funcao).parameters:
+        def progresso(feitos, total, *_):
+            with _trava:
+                registro = _tabela.get(id_tarefa)
+                if registro is None or registro["estado"] == "cancelada":
+                    raise TarefaCancelada
+                registro["progresso"] = feitos / total if total else 1.0
+        kwargs = {**kwargs, "progresso": progresso}
+
+    try:
+        resultado = funcao(*args, **kwargs)
+    except TarefaCancelada:
+        return None
+    except Exception as erro:
+        _atualizar(id_tarefa, estado="erro", erro=f"{type(erro).__name__}: {erro}", concluida_em=time.time())
+        return None
+    with _trava:
+        registro = _tabela.get(id_tarefa)
+        # cancelada durante a execução: o resultado é descartado
+        if registro is None or registro["estado"] == "cancelada":
+            return None
+        registro.update(estado="concluida", progresso=1.0, resultado=resultado, concluida_em=time.time())
+    return resultado
+
+
+def _ocupa_trabalhador(registro):
+    # cancelada em execução: segura a thread até o próximo ``progresso``
+    if registro["estado"] in PENDENTES:
+        return True
+    futuro = registro.get("futuro")
+    return registro["estado"] == "cancelada" and futuro is not None and not futuro.done()
+
+
+def _pendentes(dono):
+    return sum(1 for r in _tabela.values() if r["dono"] == dono and _ocupa_trabalhador(r))
+
+
+def _descartar_antigas():
+    vencimento = time.time() - VALIDADE_RESULTADO
+    for registro in _tabela.values():
+        if registro["resultado"] is not None and registro["concluida_em"] < vencimento:
+            registro["resultado"] = None
+    concluidas = sorted(
+        (registro["concluida_em"] or 0, id_tarefa)
+        for id_tarefa, registro in _tabela.items() if not _ocupa_trabalhador(registro)
+    )
+    for _, id_tarefa in concluidas[:max(0, len(concluidas) - MAX_CONCLUIDAS)]:
+        del _tabela[id_tarefa]
+
+
+def enviar(funcao, *args, dono=None, descricao="", **kwargs):
+    """Agenda ``funcao(*args, **kwargs)`` no pool e devolve o id da tarefa.
+
+    Levanta ``LimiteTarefas`` se ``dono`` (ex.: a sessão) já tiver
+    ``MAX_POR_DONO`` tarefas na fila ou executando (inclusive canceladas que
+    ainda não pararam).
+    """
+    with _trava:
+        if dono is not None:
+            if _pendentes(dono) >= MAX_POR_DONO:
+                raise LimiteTarefas(f"Limite de {MAX_POR_DONO} tarefas simultâneas atingido")
+        _descartar_antigas()
+        id_tarefa = next(_contador)
+        _tabela[id_tarefa] = {
+            "id": id_tarefa, "dono": dono, "descricao": descricao, "estado": "na_fila",
+            "progresso": 0.0, "criada_em": time.time(), "iniciada_em": None,
+            "concluida_em": None, "resultado": None, "erro": None,
+        }
+    futuro = _pool().submit(_executar, id_tarefa, funcao, args, kwargs)
+    _atualizar(id_tarefa, futuro=futuro)
+    return id_tarefa
+
+
+def estado(id_tarefa):
+    """Cópia do registro da tarefa (sem o resultado), ou ``None`` se não existir."""
+    with _trava:
+        registro = _tabela.get(id_tarefa)
+        if registro is None:
+            return None
+        return {chave: valor for chave, valor in registro.items() if chave not in ("resultado", "futuro")}
+
+
+def resultado(id_tarefa, liberar=False):
+    """Resultado de uma tarefa concluída (``None`` enquanto não terminar ou após expirar).
+
+    Com ``liberar=True`` o resultado sai da tabela: quem o lê passa a guardá-lo.
+    """
+    with _trava:
+        registro = _tabela.get(id_tarefa)
+        if registro is None:
+            return None
+        valor = registro["resultado"]
+        if liberar:
+            registro["resultado"] = None
+        return valor
+
+
+def cancelar(id_tarefa):
+    """Cancela uma tarefa na fila ou em execução; devolve se conseguiu.
+
+    Em execução, a tarefa para no próximo ``progresso`` (se aceitar o
+    callback) e, de todo modo, seu resultado é descartado.
+    """
+    with _trava:
+        registro = _tabela.get(id_tarefa)
+        if registro is None or registro["estado"] not in PENDENTES:
+            return False
+        registro.update(estado="cancelada", concluida_em=time.time(), resultado=None)
+        futuro = registro.get("futuro")
+    if futuro is not None:
+        futuro.cancel()
+    return True
+
+
+def pendentes(dono):
+    """Tarefas do dono que ainda ocupam o pool (na fila, executando ou canceladas sem ter parado)."""
+    with _trava:
+        return _pendentes(dono)
+
+
+def listar(dono=None):
+    """Registros (sem resultado) das tarefas, do dono ou de todos, mais recentes primeiro."""
+    with _trava:
+        _descartar_antigas()
+        ids = [i for i, r in _tabela.items() if dono is None or r["dono"] == dono]
+    registros = (estado(i) for i in sorted(ids, reverse=True))
+    return [registro for registro in registros if registro is not None]
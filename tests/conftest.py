@@ -0,0 +1,8 @@
+# -*- coding: utf-8 -*-
+"""Testes de regressão dos motores e da leitura/gravação de lotes."""
+import os
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if RAIZ not in sys.path:
+    sys.path.insert(0, RAIZ)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Fórmulas escalares originais das abas (um cenário por vez), referência dos motores.
+
+Usadas pelos testes de paridade e pelos benchmarks do caminho escalar.
+"""
+from recria_engine import INDICADORES_RECRIA
+
+
+def recria_escalar(peso_inicial, preco_compra_pyg, cambio, dias, gmd, custo_aluguel, custo_nutricional,
+                   custo_operacional, frete, comissao, juros_anual, preco_venda_kg):
+    # mesmas fórmulas do bloco CÁLCULOS original de render_recria
+    valor_compra_usd = (peso_inicial * preco_compra_pyg) / cambio if cambio > 0 else 0
+    preco_compra_usd_kg = (preco_compra_pyg / cambio) if cambio > 0 else 0
+    agio = ((preco_compra_usd_kg - preco_venda_kg) / preco_venda_kg * 100) if preco_venda_kg > 0 else 0
+    peso_final = peso_inicial + gmd * dias
+    gpv = peso_final - peso_inicial
+    meses = dias / 30.5
+    custo_mensal = custo_aluguel + custo_nutricional + custo_operacional
+    custo_total_periodo = custo_mensal * meses
+    custo_total = valor_compra_usd + custo_total_periodo + frete + comissao
+    receita = peso_final * preco_venda_kg
+    juros_valor = valor_compra_usd * juros_anual * (dias / 365)
+    lucro = receita - custo_total - juros_valor
+    margem_periodo = (lucro / receita * 100) if receita > 0 else 0
+    margem_mensal = (margem_periodo / meses) if meses > 0 else 0
+    roi = (lucro / valor_compra_usd * 100) if valor_compra_usd > 0 else 0
+    roi_mensal = (roi / meses) if meses > 0 else 0
+    roi_custo = (lucro / custo_total * 100) if custo_total > 0 else 0
+    roi_custo_mensal = (roi_custo / meses) if meses > 0 else 0
+    return dict(zip(INDICADORES_RECRIA, (
+        valor_compra_usd, preco_compra_usd_kg, agio, peso_final, gpv, meses, custo_mensal,
+        custo_total_periodo, custo_total, receita, juros_valor, lucro, margem_periodo,
+        margem_mensal, roi, roi_mensal, roi_custo, roi_custo_mensal,
+    )))
+
+
+def confinamento_escalar(peso_inicial, ganho_dia, dias, rendimento_ini, rendimento_fim, preco_compra_kg,
+                         preco_venda_kg, diaria, servicos_operacionais, custos_extras, juros_mes):
+    # mesmas fórmulas do bloco CÁLCULOS original de render_confinamento
+    peso_final = peso_inicial + ganho_dia * dias
+    carcaca_final = peso_final * rendimento_fim
+    valor_compra = peso_inicial * preco_compra_kg
+    despesas_totais = diaria * dias + servicos_operacionais * dias + custos_extras
+    juros = valor_compra * juros_mes * (dias / 30)
+    custo_total = valor_compra + despesas_totais + juros
+    receita = carcaca_final * preco_venda_kg
+    lucro = receita - custo_total
+    return {
+        "peso_final": peso_final,
+        "custo_total": custo_total,
+        "lucro": lucro,
+        "margem_lucro": (lucro / receita * 100) if receita > 0 else 0,
+        "roi_custo_mensal": ((lucro / custo_total * 100) / dias) * 30 if dias > 0 and custo_total > 0 else 0,
+    }
@@ -0,0 +1,110 @@
+# -*- coding: utf-8 -*-
+"""Agenda de currais: divisão de lotes, alocação, juros do capital de giro e arquivo enviado."""
+import datetime
+import io
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from agenda_confinamento import _dividir_lotes, agendar, alocar, lotes_da_recria, lotes_de_compra
+from pipeline import encadear
+from recria_engine import PADROES_RECRIA
+from sim_agenda import _lotes_do_arquivo
+
+
+def _serie(n, cabecas, intervalo=7, **params):
+    datas = np.datetime64("2026-01-05") + np.arange(n) * intervalo
+    return lotes_de_compra(datas, cabecas, params)
+
+
+def test_lote_maior_que_o_curral_e_dividido():
+    sublotes = _dividir_lotes(_serie(3, [250, 100, 30]), 100)
+    assert sublotes["cabecas"].tolist() == [100, 100, 50, 100, 30]
+    assert sublotes["lote"].tolist() == [0, 0, 0, 1, 2]
+    assert (sublotes["data_entrada"][:3] == np.datetime64("2026-01-05")).all()
+
+
+def test_ocupacao_nunca_passa_da_capacidade():
+    rng = np.random.default_rng(0)
+    lotes = _serie(40, rng.integers(20, 300, 40), intervalo=3, dias=rng.integers(60, 150, 40))
+    capacidades = np.array([80, 120, 150, 200, 200])
+    agenda = agendar(lotes, capacidades, 0.01)
+
+    assert (agenda["ocupacao_currais"] <= capacidades[:, np.newaxis]).all()
+    alocados = agenda["lotes"]
+    for curral in range(len(capacidades)):
+        no_curral = alocados["curral"] == curral
+        entrada, saida = alocados["entrada"][no_curral], alocados["saida"][no_curral]
+        ordem = np.argsort(entrada)
+        assert (entrada[ordem][1:] >= saida[ordem][:-1]).all()   # um lote por vez
+    assert agenda["resumo"]["cabecas_alocadas"] + alocados["cabecas"][alocados["curral"] < 0].sum() == lotes["cabecas"].sum()
+
+
+def test_espera_maxima():
+    lotes = _serie(3, 100, intervalo=0, dias=100)
+    alocados = alocar(lotes, [100, 100], max_espera=30)
+    assert (alocados["curral"][:2] >= 0).all() and alocados["curral"][2] == -1
+    assert alocar(lotes, [100, 100], max_espera=100)["espera"].tolist() == [0, 0, 100]
+
+
+def test_juros_so_sobre_saldo_negativo():
+    agenda = agendar(_serie(10, 100, intervalo=20), [150] * 3, 0.02)
+    diario = agenda["diario"]
+    np.testing.assert_allclose(diario["juros_capital_giro"], np.maximum(-diario["saldo"], 0) * 0.02 / 30)
+    assert (diario["juros_capital_giro"][diario["saldo"] >= 0] == 0).all()
+    assert (diario["saldo"] < 0).any() and (diario["saldo"] > 0).any()
+    np.testing.assert_allclose(diario["saldo_com_juros"], diario["saldo"] - np.cumsum(diario["juros_capital_giro"]))
+    assert agenda["resumo"]["lucro"] == pytest.approx(
+        agenda["resumo"]["lucro_operacional"] - agenda["resumo"]["juros_capital_giro"])
+
+
+@pytest.mark.parametrize("cabecas", [np.nan, 1.5, 0])
+def test_cabecas_invalidas(cabecas):
+    with pytest.raises(ValueError, match="cabecas"):
+        lotes_de_compra(["2026-01-05", "2026-01-12"], [100, cabecas])
+
+
+def test_lotes_da_recria():
+    lotes = lotes_da_recria(["2026-01-05", "2026-02-05"], 80, {"dias": 300})
+    recria, _, _ = encadear({"dias": 300}, {})
+    assert lotes["data_entrada"].tolist() == [datetime.date(2026, 11, 1), datetime.date(2026, 12, 2)]
+    np.testing.assert_allclose(lotes["peso_inicial"], recria["peso_final"])
+    np.testing.assert_allclose(lotes["preco_compra_kg"], PADROES_RECRIA["preco_venda_kg"])
+
+
+def _enviado(tabela, nome):
+    arquivo = io.BytesIO()
+    if nome.endswith(".parquet"):
+        tabela.to_parquet(arquivo)
+    else:
+        arquivo.write(tabela.to_csv(index=False).encode())
+    arquivo.seek(0)
+    arquivo.name = nome
+    return arquivo
+
+
+@pytest.mark.parametrize("nome", ["compras.parquet", "compras.csv"])
+def test_arquivo_enviado(nome):
+    tabela = pd.DataFrame({"data_entrada": ["2026-03-05", "05/03/2026"], "cabecas": ["120", "80"],
+                           "dias": [100.0, None]})
+    lotes = _lotes_do_arquivo(_enviado(tabela, nome), {"dias": 90.0})
+    assert (lotes["data_entrada"] == np.datetime64("2026-03-05")).all()
+    assert lotes["cabecas"].tolist() == [120, 80] and lotes["dias"].tolist() == [100.0, 90.0]
+
+
+@pytest.mark.parametrize("coluna, valor", [("data_entrada", "5.3.2026"), ("cabecas", "muitas"), ("cabecas", "")])
+def test_arquivo_enviado_invalido(coluna, valor):
+    tabela = pd.DataFrame({"data_entrada": ["2026-03-05", "2026-03-12"], "cabecas": ["120", "80"]})
+    tabela.loc[1, coluna] = valor
+    with pytest.raises(ValueError, match=coluna):
+        _lotes_do_arquivo(_enviado(tabela, "compras.parquet"), {})
+
+
+@pytest.mark.parametrize("nome", ["compras.parquet", "compras.csv"])
+def test_arquivo_enviado_sem_lotes(nome):
+    tabela = pd.DataFrame({"data_entrada": pd.Series([], dtype=str), "cabecas": pd.Series([], dtype=str)})
+    with pytest.raises(ValueError, match="nenhum lote"):
+        _lotes_do_arquivo(_enviado(tabela, nome), {})
+    with pytest.raises(ValueError, match="nenhum lote"):
+        agendar({"cabecas": np.array([], dtype=np.int64)}, [100])
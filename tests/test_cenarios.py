@@ -0,0 +1,60 @@
+# -*- coding: utf-8 -*-
+"""Armazém de cenários: gravação, consulta, hash e busca do resultado gravado."""
+import contextlib
+import datetime
+
+import numpy as np
+import pytest
+
+from cenarios import buscar_resultado, conectar, consultar, hash_parametros, salvar_cenarios
+from confinamento_engine import PADROES_CONFINAMENTO, calcular_confinamento
+
+
+@pytest.fixture
+def conexao(tmp_path):
+    with contextlib.closing(conectar(str(tmp_path / "cenarios.sqlite3"))) as conexao:
+        yield conexao
+
+
+def test_salvar_e_consultar(conexao):
+    dias = np.array([90.0, 110.0, 130.0])
+    hashes = salvar_cenarios(conexao, "confinamento", {"dias": dias}, "ACME", ["L1", "L2", "L3"],
+                             datetime.date(2026, 3, 5))
+    salvar_cenarios(conexao, "confinamento", {}, "Outro", "L9", "2026-04-01")
+
+    gravados = consultar(conexao, "confinamento", cliente="ACME")
+    assert sorted(gravados["hash"]) == sorted(hashes)
+    ordem = np.argsort(gravados["dias"])
+    assert list(gravados["lote"][ordem]) == ["L1", "L2", "L3"] and set(gravados["data"]) == {"2026-03-05"}
+    np.testing.assert_allclose(gravados["lucro"][ordem], calcular_confinamento(**{**PADROES_CONFINAMENTO, "dias": dias})["lucro"])
+
+    assert len(consultar(conexao, "confinamento")["hash"]) == 4
+    assert list(consultar(conexao, "confinamento", data_inicial="2026-04-01")["lote"]) == ["L9"]
+    assert len(consultar(conexao, "recria")["hash"]) == 0
+
+
+def test_mesmo_cenario_substituido(conexao):
+    salvar_cenarios(conexao, "recria", {"gmd": 0.5}, "ACME", "L1", "2026-01-01")
+    salvar_cenarios(conexao, "recria", {"gmd": 0.5 + 1e-12}, "ACME", "L1", "2026-01-01")
+    assert len(consultar(conexao, "recria")["hash"]) == 1
+
+
+def test_hash_estavel():
+    assert hash_parametros("recria", {"gmd": 0.5}) == hash_parametros("recria", {"gmd": 0.5 + 1e-12})
+    assert hash_parametros("recria", {"frete": -0.0}) == hash_parametros("recria", {"frete": 0.0})
+    assert hash_parametros("recria", {"gmd": 0.5}) != hash_parametros("recria", {"gmd": 0.6})
+    assert len(hash_parametros("confinamento", {"dias": [90, 110]})) == 2
+
+
+def test_buscar_resultado(conexao):
+    assert buscar_resultado(conexao, "confinamento", {"dias": 95}) is None
+    salvar_cenarios(conexao, "confinamento", {"dias": 95})
+    salvo = buscar_resultado(conexao, "confinamento", {"dias": 95})
+    esperado = calcular_confinamento(**{**PADROES_CONFINAMENTO, "dias": 95})
+    assert salvo["lucro"] == pytest.approx(float(esperado["lucro"]))
+    assert set(salvo) == set(esperado)
+
+
+def test_etapa_invalida(conexao):
+    with pytest.raises(ValueError):
+        consultar(conexao, "engorda")
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""evaluate_confinamento: entrada estruturada ou float, validação, paridade escalar e memo."""
+import numpy as np
+import pytest
+
+from confinamento_engine import (
+    INDICADORES_CONFINAMENTO,
+    PADROES_CONFINAMENTO,
+    PARAMS_CONFINAMENTO,
+    RESULTADO_CONFINAMENTO,
+    calcular_confinamento,
+    cenario_confinamento,
+    estatisticas_cache_confinamento,
+    evaluate_confinamento,
+)
+from referencia import confinamento_escalar
+
+
+def _registros(n, **colunas):
+    params = np.empty(n, dtype=PARAMS_CONFINAMENTO)
+    for nome in PARAMS_CONFINAMENTO.names:
+        params[nome] = colunas.get(nome, PADROES_CONFINAMENTO[nome])
+    return params
+
+
+def test_estruturado_e_float_equivalentes():
+    rng = np.random.default_rng(0)
+    params = _registros(200, peso_inicial=rng.uniform(300, 420, 200), dias=rng.integers(60, 180, 200))
+    resultado = evaluate_confinamento(params)
+    assert resultado.dtype == RESULTADO_CONFINAMENTO and resultado.shape == (200,)
+
+    planos = np.column_stack([params[nome] for nome in PARAMS_CONFINAMENTO.names])
+    np.testing.assert_array_equal(evaluate_confinamento(planos), resultado)
+
+    for i in range(0, 200, 17):
+        escalar = confinamento_escalar(**{nome: float(params[nome][i]) for nome in PARAMS_CONFINAMENTO.names})
+        for nome, valor in escalar.items():
+            assert resultado[nome][i] == pytest.approx(valor, rel=1e-12), nome
+
+
+def test_formato_multidimensional_preservado():
+    planos = np.tile([PADROES_CONFINAMENTO[nome] for nome in PARAMS_CONFINAMENTO.names], (3, 4, 1))
+    resultado = evaluate_confinamento(planos)
+    assert resultado.shape == (3, 4)
+    esperado = calcular_confinamento(**PADROES_CONFINAMENTO)
+    for nome in INDICADORES_CONFINAMENTO:
+        assert np.all(resultado[nome] == esperado[nome])
+
+
+def test_campo_ausente():
+    params = np.zeros(2, dtype=[(nome, np.float64) for nome in PARAMS_CONFINAMENTO.names if nome != "diaria"])
+    with pytest.raises(ValueError, match="diaria"):
+        evaluate_confinamento(params)
+
+
+def test_largura_errada():
+    with pytest.raises(ValueError, match="colunas"):
+        evaluate_confinamento(np.zeros((5, len(PARAMS_CONFINAMENTO.names) - 1)))
+
+
+def test_divisoes_protegidas():
+    resultado = evaluate_confinamento(_registros(2, dias=[0.0, 100.0], preco_venda_kg=[21.4, 0.0]))
+    for nome in INDICADORES_CONFINAMENTO:
+        assert np.all(np.isfinite(resultado[nome])), nome
+    assert resultado["carcaca_dia"][0] == 0 and resultado["roi_mensal"][0] == 0
+    assert resultado["roi_custo_mensal"][0] == 0
+    assert resultado["receita"][1] == 0 and resultado["margem_lucro"][1] == 0
+
+
+def test_cenario_memoizado_pela_chave_arredondada():
+    params = {**PADROES_CONFINAMENTO, "diaria": 14.123}
+    cenario_confinamento(**params)
+    antes = estatisticas_cache_confinamento()
+
+    # diferença abaixo do arredondamento de ``chave_cenario``: mesmo cenário
+    resultado = cenario_confinamento(**{**params, "diaria": 14.123 + 1e-12})
+    depois = estatisticas_cache_confinamento()
+    assert depois["hits"] == antes["hits"] + 1
+    assert resultado["lucro"] == pytest.approx(calcular_confinamento(**params)["lucro"])
+
+    cenario_confinamento(**{**params, "diaria": 14.124})
+    assert estatisticas_cache_confinamento()["misses"] == depois["misses"] + 1
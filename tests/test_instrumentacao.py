@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+"""Instrumentação: acúmulo dos tempos por seção e exportação Prometheus."""
+import pytest
+
+import instrumentacao
+
+
+@pytest.fixture
+def execucao_instrumentada():
+    instrumentacao.iniciar_execucao(ativo=True)
+    yield
+    instrumentacao.iniciar_execucao(ativo=False)
+
+
+def test_secao_acumula_e_exporta(execucao_instrumentada):
+    nome = 'teste.secao "aspas"'
+    for _ in range(3):
+        with instrumentacao.secao(nome):
+            pass
+
+    assert [secao for secao, _ in instrumentacao.tempos_execucao()] == [nome] * 3
+    execucoes, total, maximo = instrumentacao.contadores()[nome]
+    assert execucoes == 3 and 0.0 <= maximo <= total
+
+    texto = instrumentacao.exportar_prometheus({"recria": {"hits": 5, "misses": 2, "entradas": 2}})
+    assert 'simulador_secao_execucoes_total{secao="teste.secao \\"aspas\\""} 3\n' in texto
+    assert 'simulador_secao_segundos_max{secao="teste.secao \\"aspas\\""} ' in texto
+    assert 'simulador_cache_hits_total{cache="recria"} 5\n' in texto
+    assert "# TYPE simulador_cache_entradas gauge\n" in texto
+
+
+def test_secao_inativa_nao_registra(monkeypatch):
+    monkeypatch.setattr(instrumentacao, "ATIVO", False)
+    instrumentacao.iniciar_execucao(ativo=False)
+    with instrumentacao.secao("teste.inativa"):
+        pass
+    assert instrumentacao.tempos_execucao() == []
+    assert "teste.inativa" not in instrumentacao.contadores()
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+"""Leitura em blocos com tipos fixos e gravação incremental (CSV/Parquet)."""
+import datetime
+
+import pandas as pd
+import pytest
+
+from lotes import ler_datas, ler_tabela, processar_arquivo
+from recria_engine import PADROES_RECRIA
+
+
+@pytest.mark.parametrize("extensao", ["csv", "parquet"])
+def test_colunas_de_texto_estaveis_entre_blocos(tmp_path, extensao):
+    entrada = tmp_path / "lotes.csv"
+    # cliente vazio no 1º bloco; lote "001"/"002" e depois "A3"/"A4"
+    entrada.write_text("lote,cliente,gmd\n001,,0.5\n002,,0.6\nA3,ACME,0.7\nA4,ACME,\n")
+    saida = tmp_path / f"saida.{extensao}"
+
+    assert processar_arquivo(entrada, saida, "recria", tamanho_bloco=2) == 4
+
+    resultado = pd.read_parquet(saida) if extensao == "parquet" else pd.read_csv(saida, dtype={"lote": str})
+    assert resultado["lote"].tolist() == ["001", "002", "A3", "A4"]
+    assert resultado["cliente"].tolist()[2:] == ["ACME", "ACME"]
+    assert resultado["gmd"].iloc[3] == PADROES_RECRIA["gmd"]   # vazio = padrão da aba
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_falha_nao_deixa_arquivo_parcial(tmp_path):
+    entrada = tmp_path / "lotes.csv"
+    entrada.write_text("lote,gmd\n1,0.5\n2,0.6\n3,abc\n")
+    saida = tmp_path / "saida.csv"
+
+    with pytest.raises(ValueError):
+        processar_arquivo(entrada, saida, "recria", tamanho_bloco=2)
+    assert list(tmp_path.iterdir()) == [entrada]
+
+
+def test_ler_tabela_mantem_identificadores(tmp_path):
+    entrada = tmp_path / "lotes.csv"
+    entrada.write_text("lote,gmd\n001,0.5\n010,0.6\n")
+    assert ler_tabela(entrada)["lote"].tolist() == ["001", "010"]
+
+
+def test_ler_datas_iso_e_dia_mes_ano():
+    datas = ler_datas(["2026-03-05", "05/03/2026", ""]).dt.date.tolist()
+    assert datas[:2] == [datetime.date(2026, 3, 5)] * 2 and pd.isna(datas[2])
+    with pytest.raises(ValueError):
+        ler_datas(["2026-03-05", "5.3.2026"])
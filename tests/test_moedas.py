@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+"""Reprecificação por data: entradas e indicadores na mesma moeda; cache da tabela."""
+import numpy as np
+import pytest
+
+import moedas
+from moedas import carregar_tabela
+from simulador import main, simular_em_datas
+
+
+@pytest.fixture
+def tabela_cambio(tmp_path):
+    caminho = tmp_path / "cambio.csv"
+    caminho.write_text("data,PYG,BRL\n2026-01-01,7500,5.0\n2026-07-01,7300,5.5\n")
+    return caminho
+
+
+def test_entradas_monetarias_convertidas(tabela_cambio):
+    tabela = carregar_tabela(str(tabela_cambio))
+    assert not list(tabela_cambio.parent.glob("*.tmp"))
+
+    usd, brl = (
+        simular_em_datas("confinamento", [{"lote": "L1"}], ["2026-07-01"], moeda, tabela=tabela)[0]
+        for moeda in ("USD", "BRL")
+    )
+    assert brl["lote"] == "L1" and brl["moeda"] == "BRL"
+    for campo in ("preco_compra_kg", "preco_venda_kg", "diaria", "lucro"):
+        assert brl[campo] == pytest.approx(usd[campo] * 5.5)
+    assert np.isclose(brl["peso_final"], usd["peso_final"])
+
+
+def test_recria_sem_usd_nos_nomes(tabela_cambio):
+    tabela = carregar_tabela(str(tabela_cambio))
+    usd, brl = (
+        simular_em_datas("recria", [{"lote": "L1"}], ["2026-07-01"], moeda, tabela=tabela)[0]
+        for moeda in ("USD", "BRL")
+    )
+    assert not [nome for nome in brl if "usd" in nome]
+    assert brl["valor_compra"] == pytest.approx(usd["valor_compra"] * 5.5)
+    assert brl["preco_compra_kg"] == pytest.approx(usd["preco_compra_kg"] * 5.5)
+    assert brl["preco_compra_pyg"] == usd["preco_compra_pyg"] and brl["cambio"] == 7300
+
+
+def test_ciclo_com_datas_e_erro_de_uso(tabela_cambio, tmp_path, capsys):
+    entrada = tmp_path / "lotes.csv"
+    entrada.write_text("lote\nL1\n")
+    with pytest.raises(SystemExit) as saida:
+        main(["ciclo", str(entrada), "--tabela-cambio", str(tabela_cambio), "--datas", "2026-01-01"])
+    assert saida.value.code == 2
+    assert "ciclo" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("pasta_temporaria", [True, False])
+def test_pasta_sem_escrita(tabela_cambio, tmp_path, monkeypatch, pasta_temporaria):
+    # o .npy ao lado do CSV (e, no segundo caso, na pasta temporária) não pode ser gravado
+    monkeypatch.setattr(moedas, "caminho_cache", lambda caminho: str(tmp_path / "sem_escrita" / "cambio.npy"))
+    temporaria = tmp_path / "tmp"
+    if pasta_temporaria:
+        temporaria.mkdir()
+    monkeypatch.setattr(moedas.tempfile, "gettempdir", lambda: str(temporaria))
+
+    tabela = carregar_tabela(str(tabela_cambio))
+    assert tabela["BRL"].tolist() == [5.0, 5.5]
+    if pasta_temporaria:
+        assert len(list(temporaria.glob("*.npy"))) == 1
@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""Monte Carlo: reprodutibilidade pela semente, sorteios não negativos e resumo."""
+import numpy as np
+import pytest
+
+from monte_carlo import BARRAS_HISTOGRAMA, amostrar, simular_risco
+
+
+@pytest.mark.parametrize("modo", ["recria", "confinamento", "ciclo"])
+def test_mesma_semente_mesmo_resultado(modo):
+    a = simular_risco(modo, n=20_000, semente=7, tamanho_bloco=6_000)
+    b = simular_risco(modo, n=20_000, semente=7, tamanho_bloco=6_000)
+    np.testing.assert_array_equal(a["lucros"], b["lucros"])
+    assert a["p50"] == b["p50"] and a["var"] == b["var"]
+    assert not np.array_equal(a["lucros"], simular_risco(modo, n=20_000, semente=8)["lucros"])
+
+
+def test_resumo_sem_lucros():
+    completo = simular_risco("recria", n=10_000, semente=1)
+    resumo = simular_risco("recria", n=10_000, semente=1, manter_lucros=False)
+    assert "lucros" not in resumo
+    contagens, limites = resumo["histograma"]
+    assert contagens.sum() == 10_000 and len(limites) == BARRAS_HISTOGRAMA + 1
+    assert resumo["p5"] == np.percentile(completo["lucros"], 5)
+    assert resumo["prob_prejuizo"] == np.mean(completo["lucros"] < 0)
+
+
+@pytest.mark.parametrize("distribuicao", [
+    {"tipo": "normal", "media": 0.0, "desvio": 1.0},
+    {"tipo": "uniforme", "minimo": -5.0, "maximo": 1.0},
+    {"tipo": "triangular", "minimo": -2.0, "moda": 0.0, "maximo": 1.0},
+    {"tipo": "fixo", "valor": -3.0},
+])
+def test_amostrar_corta_negativos(distribuicao):
+    valores = amostrar(np.random.default_rng(0), distribuicao, 5_000)
+    assert valores.shape == (5_000,) and valores.min() == 0.0
+
+
+def test_distribuicao_desconhecida():
+    with pytest.raises(ValueError):
+        amostrar(np.random.default_rng(0), {"tipo": "lognormal"}, 10)
+
+
+@pytest.mark.parametrize("modo, chave", [
+    ("confinamento", "gmd"),
+    ("confinamento", "conf_ganho_dia"),
+    ("recria", "ganho_dia"),
+    ("ciclo", "conf_ganho_diaa"),
+    ("ciclo", "conf_peso_inicial"),
+])
+def test_parametro_invalido_no_modo(modo, chave):
+    with pytest.raises(ValueError, match=chave):
+        simular_risco(modo, distribuicoes={chave: {"tipo": "fixo", "valor": 1.0}}, n=10)
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""Ciclo recria → confinamento: link entre as etapas e otimização de dias."""
+import numpy as np
+import pytest
+
+from confinamento_engine import PADROES_CONFINAMENTO, calcular_confinamento
+from pipeline import evaluate_ciclo, otimizar_ciclo
+from recria_engine import PADROES_RECRIA, evaluate_recria
+
+
+def test_lucro_do_ciclo_e_receita_menos_custo():
+    rng = np.random.default_rng(0)
+    params_recria = {"gmd": rng.uniform(0.3, 0.9, 100), "dias": rng.integers(120, 540, 100)}
+    params_conf = {"ganho_dia": rng.uniform(1.0, 1.8, 100), "dias": rng.integers(60, 180, 100)}
+    resultado = evaluate_ciclo(params_recria, params_conf)
+
+    np.testing.assert_allclose(resultado["lucro_ciclo"], resultado["conf_receita"] - resultado["custo_ciclo"])
+    recria = evaluate_recria(**{**PADROES_RECRIA, **params_recria})
+    conf = calcular_confinamento(**{**PADROES_CONFINAMENTO, **params_conf,
+                                    "peso_inicial": recria["peso_final"],
+                                    "preco_compra_kg": PADROES_RECRIA["preco_venda_kg"]})
+    np.testing.assert_allclose(resultado["lucro_ciclo"], recria["lucro"] + conf["lucro"])
+
+
+@pytest.mark.parametrize("criterio", ["lucro_ciclo", "roi_ciclo_mensal"])
+def test_otimizar_ciclo_e_o_maximo_da_grade(criterio):
+    dias_recria = np.arange(120, 541, 30)
+    dias_conf = np.arange(60, 181, 10)
+    otimo = otimizar_ciclo({}, {}, dias_recria, dias_conf, criterio)
+
+    melhor = max(
+        (float(evaluate_ciclo({"dias": dr}, {"dias": dc})[criterio]), dr, dc)
+        for dr in dias_recria for dc in dias_conf
+    )
+    assert otimo["otimo"][criterio] == pytest.approx(melhor[0], rel=1e-12)
+    assert (otimo["dias_recria"], otimo["dias_confinamento"]) == (melhor[1], melhor[2])
+    assert otimo["valores"].shape == (len(dias_recria), len(dias_conf))
+
+
+def test_criterio_invalido():
+    with pytest.raises(ValueError):
+        otimizar_ciclo({}, {}, [365], [110], "margem")
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Motor vetorizado da recria × fórmulas escalares originais de render_recria, memo e grade de sensibilidade."""
+import numpy as np
+import pytest
+
+from referencia import recria_escalar
+from recria_engine import (
+    EIXO_GMD, EIXO_PRECO_COMPRA, EIXO_PRECO_VENDA, INDICADORES_RECRIA, PADROES_RECRIA, cenario_recria, dividir,
+    estatisticas_cache_recria, evaluate_recria, preco_venda_equilibrio, superficie_lucro,
+)
+
+
+def test_vetorizado_igual_ao_escalar():
+    rng = np.random.default_rng(0)
+    n = 300
+    params = {
+        **{nome: np.full(n, valor, dtype=np.float64) for nome, valor in PADROES_RECRIA.items()},
+        "peso_inicial": rng.uniform(120, 260, n),
+        "preco_compra_pyg": rng.uniform(15000, 25000, n),
+        "dias": rng.integers(30, 540, n).astype(np.float64),
+        "gmd": rng.uniform(0.2, 1.2, n),
+        "preco_venda_kg": rng.uniform(1.0, 3.5, n),
+    }
+    vetorizado = evaluate_recria(**params)
+    for i in range(n):
+        escalar = recria_escalar(**{nome: float(valores[i]) for nome, valores in params.items()})
+        for nome in INDICADORES_RECRIA:
+            assert vetorizado[nome][i] == pytest.approx(escalar[nome], rel=1e-12, abs=1e-12), nome
+
+
+@pytest.mark.parametrize("campo", ["cambio", "preco_venda_kg", "dias"])
+def test_denominadores_zero(campo):
+    params = {**PADROES_RECRIA, campo: 0.0}
+    resultado = evaluate_recria(**params)
+    escalar = recria_escalar(**params)
+    for nome in INDICADORES_RECRIA:
+        assert np.isfinite(resultado[nome])
+        assert float(resultado[nome]) == pytest.approx(escalar[nome], rel=1e-12, abs=1e-12), nome
+
+
+def test_dividir_zero_onde_denominador_nao_positivo():
+    np.testing.assert_array_equal(dividir([1.0, 2.0, 3.0], [2.0, 0.0, -1.0]), [0.5, 0.0, 0.0])
+
+
+def test_cenario_memoizado_pela_chave_arredondada():
+    params = {**PADROES_RECRIA, "gmd": 0.517}
+    cenario_recria(**params)
+    antes = estatisticas_cache_recria()
+
+    # diferença abaixo do arredondamento de ``chave_cenario``: mesmo cenário
+    resultado = cenario_recria(**{**params, "gmd": 0.517 + 1e-12})
+    depois = estatisticas_cache_recria()
+    assert depois["hits"] == antes["hits"] + 1
+    assert resultado["lucro"] == pytest.approx(evaluate_recria(**params)["lucro"])
+
+    cenario_recria(**{**params, "gmd": 0.518})
+    assert estatisticas_cache_recria()["misses"] == depois["misses"] + 1
+
+
+def _fixos_da_grade(params):
+    custo_mensal = params["custo_aluguel"] + params["custo_nutricional"] + params["custo_operacional"]
+    return {
+        "peso_inicial": params["peso_inicial"], "cambio": params["cambio"], "dias": params["dias"],
+        "custo_total_periodo": custo_mensal * params["dias"] / 30.5, "frete": params["frete"],
+        "comissao": params["comissao"], "juros_anual": params["juros_anual"],
+    }
+
+
+def test_superficie_e_equilibrio_iguais_ao_motor():
+    i, j, k = 37, 120, 15
+    ponto = {**PADROES_RECRIA, "preco_compra_pyg": EIXO_PRECO_COMPRA[i],
+             "preco_venda_kg": EIXO_PRECO_VENDA[j], "gmd": EIXO_GMD[k]}
+    fixos = _fixos_da_grade(PADROES_RECRIA)
+
+    lucro = superficie_lucro(**fixos)
+    assert lucro.shape == (len(EIXO_PRECO_COMPRA), len(EIXO_PRECO_VENDA), len(EIXO_GMD))
+    assert lucro[i, j, k] == pytest.approx(evaluate_recria(**ponto)["lucro"], rel=1e-12)
+
+    equilibrio = preco_venda_equilibrio(**fixos)[i, k]
+    assert evaluate_recria(**{**ponto, "preco_venda_kg": equilibrio})["lucro"] == pytest.approx(0.0, abs=1e-9)
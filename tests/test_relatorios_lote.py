@@ -0,0 +1,28 @@
+# -*- coding: utf-8 -*-
+"""Datas e nomes de arquivo dos relatórios em lote."""
+import datetime
+
+import pandas as pd
+import pytest
+
+from relatorios_lote import _datas_iniciais, _nomes_arquivos
+
+
+def test_datas_iso_nao_trocam_dia_e_mes():
+    tabela = pd.DataFrame({"data_inicial": ["2026-01-02", "02/01/2026", None]})
+    datas = _datas_iniciais(tabela)
+    assert datas[:2] == [datetime.date(2026, 1, 2)] * 2
+    assert datas[2] == datetime.date.today()
+
+
+def test_data_em_formato_desconhecido_e_rejeitada():
+    with pytest.raises(ValueError):
+        _datas_iniciais(pd.DataFrame({"data_inicial": ["2.1.2026"]}))
+
+
+def test_lotes_com_mesmo_arquivo_recebem_numero_da_linha():
+    nomes = _nomes_arquivos("recria", ["A/1", "A 1", "B", "C", "C"])
+    assert nomes == [
+        "recria_A_1_linha1.pdf", "recria_A_1_linha2.pdf", "recria_B.pdf",
+        "recria_C_linha4.pdf", "recria_C_linha5.pdf",
+    ]
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Dia ótimo de saída × varredura escalar dia a dia."""
+import numpy as np
+import pytest
+
+import saida_otima
+from confinamento_engine import PADROES_CONFINAMENTO, calcular_confinamento
+from recria_engine import PADROES_RECRIA, evaluate_recria
+from saida_otima import CRITERIOS_SAIDA, DIAS_POR_MES, dia_otimo
+
+MOTORES = {"recria": (evaluate_recria, PADROES_RECRIA), "confinamento": (calcular_confinamento, PADROES_CONFINAMENTO)}
+
+
+def _varredura(etapa, params, dias_max, criterio):
+    motor, padroes = MOTORES[etapa]
+    melhor = None
+    for dia in range(1, dias_max + 1):
+        resultado = motor(**{**padroes, **params, "dias": dia})
+        if criterio == "lucro_mensal":
+            valor = float(resultado["lucro"]) / (dia / DIAS_POR_MES[etapa])
+        else:
+            valor = float(resultado[criterio])
+        if melhor is None or valor > melhor[0]:
+            melhor = (valor, dia, float(resultado["lucro"]))
+    return melhor
+
+
+@pytest.mark.parametrize("etapa", ["recria", "confinamento"])
+def test_igual_a_varredura_escalar(etapa, monkeypatch):
+    monkeypatch.setattr(saida_otima, "TAMANHO_BLOCO", 1_000)  # força vários blocos
+    rng = np.random.default_rng(3)
+    if etapa == "recria":
+        params = {"gmd": rng.uniform(0.2, 0.9, 6), "preco_venda_kg": rng.uniform(1.8, 3.0, 6)}
+    else:
+        params = {"ganho_dia": rng.uniform(0.8, 1.8, 6), "diaria": rng.uniform(10, 20, 6)}
+
+    for criterio in CRITERIOS_SAIDA[etapa]:
+        saida = dia_otimo(etapa, params, dias_max=200, criterio=criterio)
+        for i in range(6):
+            valor, dia, lucro = _varredura(etapa, {k: float(v[i]) for k, v in params.items()}, 200, criterio)
+            assert saida["dia_otimo"][i] == dia, (criterio, i)
+            assert saida["valor_otimo"][i] == pytest.approx(valor, rel=1e-12)
+            assert saida["lucro_otimo"][i] == pytest.approx(lucro, rel=1e-12)
+
+
+def test_lucro_marginal_das_curvas():
+    saida = dia_otimo("confinamento", {}, dias_max=50, curvas=True)
+    lucro = [float(calcular_confinamento(**{**PADROES_CONFINAMENTO, "dias": d})["lucro"]) for d in range(51)]
+    np.testing.assert_allclose(saida["lucro_marginal"][0], np.diff(lucro), rtol=1e-9)
+
+
+def test_etapa_e_criterio_invalidos():
+    with pytest.raises(ValueError):
+        dia_otimo("engorda", {})
+    with pytest.raises(ValueError):
+        dia_otimo("confinamento", {}, criterio="margem_mensal")
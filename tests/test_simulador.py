@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""API sem interface: campos de identificação e modo em blocos."""
+import pandas as pd
+import pytest
+
+from lotes import processar_arquivo
+from simulador import SIMULACOES, ler_linhas, main
+
+
+@pytest.mark.parametrize("formato", ["csv", "parquet"])
+@pytest.mark.parametrize("tipo", sorted(SIMULACOES))
+def test_identificadores_preservados_e_iguais_ao_modo_em_blocos(tmp_path, tipo, formato):
+    # a segunda linha tem ``dias`` vazio: vale o padrão nos dois caminhos
+    entrada = tmp_path / f"lotes.{formato}"
+    if formato == "csv":
+        entrada.write_text("lote,cliente,dias\n001,ACME,200\nA3,,\n")
+    else:
+        pd.DataFrame({"lote": ["001", "A3"], "cliente": ["ACME", ""], "dias": [200, None]}).to_parquet(entrada)
+
+    linhas = SIMULACOES[tipo](ler_linhas(str(entrada)))
+    assert [linha["lote"] for linha in linhas] == ["001", "A3"]
+    assert [linha["cliente"] for linha in linhas] == ["ACME", ""]
+
+    processar_arquivo(entrada, tmp_path / "saida.parquet", tipo, tamanho_bloco=1)
+    em_blocos = pd.read_parquet(tmp_path / "saida.parquet")
+    assert list(em_blocos.columns) == list(linhas[0])
+    identificacao = ["lote", "cliente"]
+    pd.testing.assert_frame_equal(
+        em_blocos.drop(columns=identificacao), pd.DataFrame(linhas).drop(columns=identificacao)
+    )
+
+
+@pytest.mark.parametrize("extra", [[], ["--bloco", "10", "-o", "saida.csv"]])
+def test_valor_nao_numerico_vira_erro_de_uso(tmp_path, capsys, monkeypatch, extra):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "lotes.csv").write_text("lote,gmd\nL1,0.5\nL2,abc\n")
+    with pytest.raises(SystemExit) as saida:
+        main(["recria", "lotes.csv", *extra])
+    assert saida.value.code == 2
+    assert "abc" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("arquivo, conteudo, mensagem", [
+    ("faltando.csv", None, "faltando.csv"),
+    ("lotes.json", "[1, 2]", "lista de objetos"),
+])
+def test_entrada_invalida_vira_erro_de_uso(tmp_path, capsys, monkeypatch, arquivo, conteudo, mensagem):
+    monkeypatch.chdir(tmp_path)
+    if conteudo is not None:
+        (tmp_path / arquivo).write_text(conteudo)
+    with pytest.raises(SystemExit) as saida:
+        main(["recria", arquivo])
+    assert saida.value.code == 2
+    assert mensagem in capsys.readouterr().err
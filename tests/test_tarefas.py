@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""Fila de tarefas: cancelamento em execução, limite por dono e liberação de resultados."""
+import threading
+import time
+
+import pytest
+
+import tarefas
+
+
+def _esperar(id_tarefa, estados=("concluida", "cancelada", "erro"), limite=5.0):
+    fim = time.time() + limite
+    while tarefas.estado(id_tarefa)["estado"] not in estados:
+        assert time.time() < fim, tarefas.estado(id_tarefa)
+        time.sleep(0.01)
+
+
+def test_resultado_liberado_apos_leitura():
+    id_tarefa = tarefas.enviar(lambda: [1, 2, 3])
+    _esperar(id_tarefa)
+    assert tarefas.resultado(id_tarefa, liberar=True) == [1, 2, 3]
+    assert tarefas.resultado(id_tarefa) is None
+
+
+def test_resultado_expira(monkeypatch):
+    id_tarefa = tarefas.enviar(lambda: "pronto")
+    _esperar(id_tarefa)
+    monkeypatch.setattr(tarefas, "VALIDADE_RESULTADO", -1)
+    tarefas.listar()
+    assert tarefas.resultado(id_tarefa) is None
+
+
+def test_cancelar_tarefa_em_execucao():
+    iniciou, terminou = threading.Event(), threading.Event()
+    passos = []
+
+    def demorada(progresso):
+        iniciou.set()
+        try:
+            for passo in range(500):
+                time.sleep(0.01)
+                passos.append(passo)
+                progresso(passo + 1, 500)
+            return "nunca"
+        finally:
+            terminou.set()
+
+    id_tarefa = tarefas.enviar(demorada)
+    assert iniciou.wait(5)
+    assert tarefas.cancelar(id_tarefa)
+    assert terminou.wait(5)
+    assert len(passos) < 500
+    assert tarefas.estado(id_tarefa)["estado"] == "cancelada"
+    assert tarefas.resultado(id_tarefa) is None
+
+
+def test_cancelada_em_execucao_conta_no_limite_do_dono():
+    assert tarefas.MAX_POR_DONO < tarefas.MAX_TRABALHADORES
+    iniciou, liberar = threading.Event(), threading.Event()
+
+    def demorada(progresso):
+        iniciou.set()
+        liberar.wait(5)
+        progresso(1, 2)
+
+    id_tarefa = tarefas.enviar(demorada, dono="sessao")
+    assert iniciou.wait(5)
+    tarefas.cancelar(id_tarefa)
+    # ainda ocupa a thread até o próximo ``progresso``
+    with pytest.raises(tarefas.LimiteTarefas):
+        tarefas.enviar(lambda: None, dono="sessao")
+    liberar.set()
+    fim = time.time() + 5
+    while True:
+        try:
+            _esperar(tarefas.enviar(lambda: None, dono="sessao"))
+            break
+        except tarefas.LimiteTarefas:
+            assert time.time() < fim
+            time.sleep(0.01)
@@ -0,0 +1,54 @@
+# -*- coding: utf-8 -*-
+"""Tornado e pontos de equilíbrio × avaliações diretas dos motores."""
+import math
+
+import numpy as np
+import pytest
+
+from confinamento_engine import PADROES_CONFINAMENTO, calcular_confinamento
+from recria_engine import PADROES_RECRIA, evaluate_recria
+from tornado import pontos_equilibrio, tornado
+
+
+def test_tornado_igual_aos_cenarios_isolados():
+    resultado = tornado("recria", {}, variacao=0.2)
+    assert list(resultado["amplitude"]) == sorted(resultado["amplitude"], reverse=True)
+    for campo, baixo, alto in zip(resultado["campos"], resultado["baixo"], resultado["alto"]):
+        valor = PADROES_RECRIA[campo]
+        assert baixo == pytest.approx(float(evaluate_recria(**{**PADROES_RECRIA, campo: valor * 0.8})["lucro"]))
+        assert alto == pytest.approx(float(evaluate_recria(**{**PADROES_RECRIA, campo: valor * 1.2})["lucro"]))
+
+
+@pytest.mark.parametrize("etapa, motor, padroes", [
+    ("recria", evaluate_recria, PADROES_RECRIA),
+    ("confinamento", calcular_confinamento, PADROES_CONFINAMENTO),
+])
+def test_equilibrio_zera_o_lucro(etapa, motor, padroes):
+    equilibrio = pontos_equilibrio(etapa, {})
+    encontrados = {campo: valor for campo, valor in equilibrio.items() if not math.isnan(valor)}
+    assert "preco_venda_kg" in encontrados
+    for campo, valor in encontrados.items():
+        lucro = float(motor(**{**padroes, campo: valor})["lucro"])
+        assert lucro == pytest.approx(0.0, abs=1e-6), campo
+
+
+def test_equilibrio_linear_em_forma_fechada():
+    # lucro da recria é linear no preço de venda: equilíbrio = custos / peso final
+    base = evaluate_recria(**PADROES_RECRIA)
+    esperado = float((base["custo_total"] + base["juros_valor"]) / base["peso_final"])
+    assert pontos_equilibrio("recria", {}, campos=["preco_venda_kg"])["preco_venda_kg"] == pytest.approx(esperado)
+
+
+def test_sem_troca_de_sinal_devolve_nan():
+    # o rendimento inicial não entra no lucro
+    equilibrio = pontos_equilibrio("confinamento", {}, campos=["rendimento_ini", "preco_venda_kg"])
+    assert math.isnan(equilibrio["rendimento_ini"])
+    assert not math.isnan(equilibrio["preco_venda_kg"])
+    # sem receita, nenhuma diária ≥ 0 zera o lucro
+    sem_raiz = pontos_equilibrio("confinamento", {"preco_venda_kg": 0.0}, campos=["diaria"])
+    assert np.isnan(sem_raiz["diaria"])
+
+
+def test_etapa_invalida():
+    with pytest.raises(ValueError):
+        tornado("engorda", {})
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""Análise tornado (±X% em cada entrada) e pontos de equilíbrio.
+
+Todas as variações de uma etapa são montadas num único lote de cenários
+(2 por parâmetro) e avaliadas numa só chamada do motor. Os pontos de
+equilíbrio (valor de cada entrada que zera o lucro, com as demais fixas) saem
+de uma bisseção vetorizada: cada iteração avalia todos os parâmetros de uma
+vez.
+"""
+import numpy as np
+
+from etapas import motor_da_etapa
+
+# Busca do equilíbrio: o limite superior começa no valor base (mín. 1) e dobra
+# até o indicador trocar de sinal, no máximo EXPANSOES vezes.
+MINIMO_BUSCA = 1e-9
+EXPANSOES = 40
+ITERACOES = 80
+
+
+def _avaliar_variando(motor, base, campos, valores):
+    # valores[i, j] -> cenário em que só campos[i] muda; demais ficam na base
+    colunas = {nome: np.full(valores.shape, float(valor)) for nome, valor in base.items()}
+    for i, campo in enumerate(campos):
+        colunas[campo][i] = valores[i]
+    return motor(**colunas)
+
+
+def tornado(etapa, params, variacao=0.10, indicador="lucro", campos=None):
+    """Indicador com cada entrada a -``variacao`` e +``variacao`` (fração).
+
+    Devolve um dict com arrays alinhados, ordenados pela amplitude (maior
+    primeiro): ``campos``, ``valor_base``, ``baixo``/``alto`` (indicador com o
+    campo reduzido/aumentado), ``amplitude`` (|alto - baixo|) e
+    ``elasticidade`` (variação % do indicador por 1% no campo). Inclui também
+    ``indicador_base``.
+    """
+    motor, padroes, _ = motor_da_etapa(etapa)
+    base = {**padroes, **params}
+    campos = list(campos or padroes)
+
+    valor_base = np.array([float(base[campo]) for campo in campos])
+    fatores = np.array([1.0 - variacao, 1.0 + variacao])
+    resultado = _avaliar_variando(motor, base, campos, valor_base[:, np.newaxis] * fatores)
+    indicador_base = float(motor(**base)[indicador])
+
+    baixo = resultado[indicador][:, 0]
+    alto = resultado[indicador][:, 1]
+    amplitude = np.abs(alto - baixo)
+    elasticidade = (alto - baixo) / (2 * variacao * indicador_base) if indicador_base else np.full(len(campos), np.nan)
+
+    ordem = np.argsort(-amplitude, kind="stable")
+    return {
+        "campos": [campos[i] for i in ordem],
+        "valor_base": valor_base[ordem],
+        "baixo": baixo[ordem],
+        "alto": alto[ordem],
+        "amplitude": amplitude[ordem],
+        "elasticidade": elasticidade[ordem],
+        "indicador_base": indicador_base,
+        "variacao": variacao,
+    }
+
+
+def pontos_equilibrio(etapa, params, indicador="lucro", campos=None, iteracoes=ITERACOES):
+    """Valor de cada entrada que zera o ``indicador``, com as demais na base.
+
+    Busca em ``[~0, base × 2^k]`` por bisseção vetorizada; devolve
+    ``{campo: valor}`` com ``nan`` quando o indicador não troca de sinal no
+    intervalo (por exemplo, campos que não afetam o lucro).
+    """
+    motor, padroes, _ = motor_da_etapa(etapa)
+    base = {**padroes, **params}
+    campos = list(campos or padroes)
+
+    valor_base = np.array([abs(float(base[campo])) for campo in campos])
+    baixo = np.full(len(campos), MINIMO_BUSCA)
+    alto = np.maximum(valor_base, 1.0)
+
+    sinal_baixo = np.sign(_avaliar_variando(motor, base, campos, baixo[:, np.newaxis])[indicador][:, 0])
+    for _ in range(EXPANSOES):
+        valor = _avaliar_variando(motor, base, campos, alto[:, np.newaxis])[indicador][:, 0]
+        existe = sinal_baixo * np.sign(valor) < 0
+        if existe.all():
+            break
+        alto = np.where(existe, alto, alto * 2)
+
+    for _ in range(iteracoes):
+        meio = (baixo + alto) / 2
+        valor = _avaliar_variando(motor, base, campos, meio[:, np.newaxis])[indicador][:, 0]
+        mesmo_lado = np.sign(valor) == sinal_baixo
+        baixo = np.where(mesmo_lado, meio, baixo)
+        alto = np.where(mesmo_lado, alto, meio)
+
+    equilibrio = np.where(existe, (baixo + alto) / 2, np.nan)
+    return dict(zip(campos, equilibrio.tolist()))